@@ -3,18 +3,15 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
-from sklearn.model_selection import train_test_split, GridSearchCV, cross_val_score, StratifiedKFold, LeaveOneOut, LeavePOut, KFold
+from sklearn.model_selection import train_test_split, StratifiedKFold, LeaveOneOut, LeavePOut, KFold
 from sklearn.preprocessing import StandardScaler, LabelEncoder, PolynomialFeatures, RobustScaler, MinMaxScaler
-from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor, GradientBoostingRegressor, GradientBoostingClassifier, BaggingRegressor, VotingRegressor, StackingRegressor
+from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor, GradientBoostingRegressor, GradientBoostingClassifier, HistGradientBoostingClassifier, HistGradientBoostingRegressor, BaggingRegressor, VotingRegressor, StackingRegressor
 from sklearn.linear_model import LogisticRegression, LinearRegression
-from sklearn.svm import SVR, SVC
 from sklearn.neighbors import KNeighborsClassifier
 from sklearn.neural_network import MLPClassifier, MLPRegressor
 from sklearn.tree import DecisionTreeClassifier
 from sklearn.naive_bayes import GaussianNB
 from sklearn.metrics import accuracy_score, mean_squared_error, r2_score, classification_report, confusion_matrix, roc_curve, roc_auc_score, auc
-from sklearn.feature_selection import SelectKBest, f_regression, f_classif, mutual_info_regression, mutual_info_classif
-from sklearn.decomposition import PCA
 from sklearn.inspection import partial_dependence, PartialDependenceDisplay
 from sklearn.cluster import KMeans, AgglomerativeClustering, DBSCAN, SpectralClustering
 from sklearn.metrics import silhouette_score, adjusted_rand_score
@@ -27,12 +24,28 @@ import os
 from PIL import Image
 import io
 import time
+import uuid
 from statsmodels.stats.outliers_influence import variance_inflation_factor
 import statsmodels.api as sm
 from statsmodels.stats.diagnostic import het_breuschpagan
 from auth_db import auth_db
 from captcha_utils import captcha_gen, verify_captcha
 from utils import prepare_timeseries_data, check_stationarity, plot_timeseries_analysis, analyze_trend_seasonality_cycle, plot_pattern_analysis
+from dedup_utils import find_exact_duplicates, exact_duplicate_clusters, find_near_duplicates
+from feature_selection_utils import feature_scores, multi_stage_select, bootstrap_stability, STABILITY_METHODS
+from ga_utils import run_genetic_selection, checkpoint_path, load_checkpoint
+from encoding_utils import label_encoded, SparseOneHotEncoder, HashingEncoder, TargetEncoder, sparse_frame, is_sparse_frame, frame_to_csr, sparse_memory_summary, make_sparse_scaler, native_categorical_mask
+from resampling_utils import ScalableResampler, PYNNDESCENT_AVAILABLE
+from precision_utils import to_float32, frame_nbytes, compare_precision
+from embedding_utils import projections, PCA_BACKENDS, matrix_fingerprint
+from tuning_utils import make_search, early_stopping_params, SEARCH_STRATEGIES
+from validation_utils import cross_validation_result, cv_cost, supports_closed_form_loo, is_leave_out, SampledLeavePOut
+from job_utils import jobs, train_model_job, shap_values_job, ga_selection_job, ACTIVE_STATUSES
+from cache_utils import training_cache, training_key
+from registry_utils import model_registry
+from benchmark_utils import benchmark_models, run_benchmark
+from shap_utils import compute_shap_values
+from svm_utils import make_svm, resolve_svm_mode, SVM_MODES, CALIBRATION_METHODS, EXACT_SVM_MAX_ROWS
 
 try:
     import lime
@@ -49,6 +62,11 @@ try:
 except ImportError:
     IMB_AVAILABLE = False
 
+# Copy-on-write: turunan DataFrame (subset kolom, salinan dangkal) berbagi data sampai kolomnya diubah.
+# Selalu aktif sejak pandas 3.0; untuk pandas 2.x diaktifkan di sini.
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
 # Initialize translation
 TRANSLATIONS = {
     'en': {
@@ -110,11 +128,25 @@ if 'encoders' not in st.session_state:
     st.session_state.encoders = {}
 if 'scaler' not in st.session_state:
     st.session_state.scaler = None
+if 'sparse_encoder' not in st.session_state:
+    st.session_state.sparse_encoder = None
+if 'sparse_scaler' not in st.session_state:
+    st.session_state.sparse_scaler = None
+if 'target_encoder' not in st.session_state:
+    st.session_state.target_encoder = None
+if 'float32_mode' not in st.session_state:
+    st.session_state.float32_mode = False
+if 'pca_projection' not in st.session_state:
+    st.session_state.pca_projection = None
 if 'model_type' not in st.session_state:
     st.session_state.model_type = None
 
 if 'model_results' not in st.session_state:
     st.session_state.model_results = []
+if 'job_owner' not in st.session_state:
+    # Job hanya terlihat oleh sesi yang mengirimnya; id disimpan di URL agar tetap sama setelah halaman dimuat ulang
+    st.session_state.job_owner = st.query_params.get('jobs') or uuid.uuid4().hex
+    st.query_params['jobs'] = st.session_state.job_owner
 
 # Time series specific state variables
 if 'is_time_series' not in st.session_state:
@@ -182,6 +214,81 @@ def get_model_type(model):
     except:
         return st.session_state.problem_type
 
+# Fragment: hanya panel progres job yang dijalankan ulang berkala, bukan seluruh skrip
+_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None)
+
+def job_progress(job_id, render_partial=None):
+    """Progres job yang sedang berjalan; begitu job selesai seluruh aplikasi dijalankan ulang untuk menampilkan hasilnya"""
+    job = jobs.get(job_id)
+    if job is None or job['status'] not in ACTIVE_STATUSES:
+        st.rerun()
+    st.progress(job.get('progress', 0.0))
+    st.caption(f"{job['status']}: {job.get('message', '')}")
+    partial = jobs.partial(job_id) if job.get('has_partial') else None
+    if partial is not None and render_partial is not None:
+        render_partial(partial)
+
+live_job_progress = _fragment(run_every=2)(job_progress) if _fragment is not None else None
+
+def job_panel(kind, state_key, render_partial=None):
+    """Tabel job satu jenis, job yang dipantau beserta progres dan tombol batal; mengembalikan (job_id, record)"""
+    kind_jobs = jobs.list(kind, owner=st.session_state.job_owner)
+    if not kind_jobs:
+        return None, None
+    st.dataframe(pd.DataFrame([{
+        'Job': job['id'],
+        'Name': job['name'],
+        'Status': job['status'],
+        'Progress': f"{job.get('progress', 0) * 100:.0f}%",
+        'Message': job.get('message', '')
+    } for job in kind_jobs]))
+    job_ids = [job['id'] for job in kind_jobs]
+    current_job = st.session_state.get(state_key)
+    job_id = st.selectbox(
+        "Job yang dipantau:" if st.session_state.language == 'id' else "Job to follow:",
+        job_ids,
+        index=job_ids.index(current_job) if current_job in job_ids else 0,
+        key=f"{kind}_job_select"
+    )
+    st.session_state[state_key] = job_id
+    job = jobs.get(job_id)
+    if job is None:
+        # Job dihapus (retensi atau sesi lain) di antara pembacaan daftar dan status
+        return None, None
+    
+    if job['status'] in ACTIVE_STATUSES:
+        job_col1, job_col2, job_col3 = st.columns(3)
+        with job_col1:
+            if st.button("Batalkan Job" if st.session_state.language == 'id' else "Cancel Job", key=f"{kind}_job_cancel"):
+                jobs.cancel(job_id)
+                st.rerun()
+        with job_col2:
+            if st.button("Perbarui Status" if st.session_state.language == 'id' else "Refresh Status", key=f"{kind}_job_refresh"):
+                st.rerun()
+        with job_col3:
+            auto_refresh = st.checkbox(
+                "Perbarui otomatis" if st.session_state.language == 'id' else "Auto refresh",
+                value=live_job_progress is not None,
+                disabled=live_job_progress is None,
+                key=f"{kind}_job_auto_refresh"
+            )
+        if auto_refresh:
+            # Hanya fragment ini yang diperbarui setiap 2 detik; bagian lain halaman tetap dirender
+            live_job_progress(job_id, render_partial)
+        else:
+            job_progress(job_id, render_partial)
+    else:
+        if job['status'] == "failed":
+            st.error(f"Job gagal: {job.get('error', '')}" if st.session_state.language == 'id' else f"Job failed: {job.get('error', '')}")
+        elif job['status'] != "completed":
+            st.warning(f"Job {job['status']}" if st.session_state.language == 'id' else f"Job {job['status']}")
+        # Hasil job (model, data) tersimpan di disk sampai dihapus di sini atau oleh retensi JobRunner
+        if st.button("Hapus Job" if st.session_state.language == 'id' else "Delete Job", key=f"{kind}_job_delete"):
+            jobs.delete(job_id)
+            st.session_state.pop(state_key, None)
+            st.rerun()
+    return job_id, job
+
 def recommend_research_methods(data):
     """Rekomendasikan metode penelitian berdasarkan karakteristik dataset"""
     recommendations = []
@@ -1054,8 +1161,8 @@ with tab2:
                         
                         # PCA visualization
                         if len(selected_features) > 2:
-                            pca = PCA(n_components=2)
-                            pca_data = pca.fit_transform(scaled_data)
+                            # Proyeksi di-cache per matriks; backend (full/randomized/incremental) dipilih dari ukuran data
+                            pca_data = projections.pca(scaled_data, 2).embedding
                             scatter2 = ax2.scatter(pca_data[:, 0], pca_data[:, 1], c=clusters, cmap='viridis', alpha=0.6)
                             ax2.set_xlabel('PC1')
                             ax2.set_ylabel('PC2')
@@ -1133,8 +1240,7 @@ with tab2:
                         num_features = [col for col in selected_features 
                                       if col in st.session_state.numerical_columns]
                         if len(num_features) >= 2:
-                            pca = PCA(n_components=2)
-                            pca_data = pca.fit_transform(clustering_data[num_features])
+                            pca_data = projections.pca(clustering_data[num_features], 2).embedding
                             scatter2 = ax2.scatter(pca_data[:, 0], pca_data[:, 1], c=clusters, cmap='viridis', alpha=0.6)
                             ax2.set_xlabel('PC1')
                             ax2.set_ylabel('PC2')
@@ -1315,7 +1421,8 @@ with tab3:
     st.header("Pemrosesan Data Awal" if st.session_state.language == 'id' else "Data Preprocessing")
     
     if st.session_state.data is not None:
-        data = st.session_state.data.copy()
+        # Salinan dangkal: kolom baru disalin hanya saat diubah (copy-on-write)
+        data = st.session_state.data.copy(deep=False)
         
         st.subheader("Pilih Variabel Target" if st.session_state.language == 'id' else "Select Target Variable")
         target_column = st.selectbox("Pilih kolom target untuk diprediksi:" if st.session_state.language == 'id' else "Choose the target column for prediction:", data.columns)
@@ -1478,14 +1585,38 @@ with tab3:
         # Handle Duplicate Data
         st.subheader("Penanganan Data Duplikat" if st.session_state.language == 'id' else "Handle Duplicate Data")
         
+        # Pilih metode deteksi duplikat
+        dedup_method = st.radio(
+            "Metode deteksi duplikat:" if st.session_state.language == 'id' else "Duplicate detection method:",
+            ["Pandas (semua kolom)" if st.session_state.language == 'id' else "Pandas (all columns)",
+             "Hash 64-bit per baris" if st.session_state.language == 'id' else "64-bit row hash"],
+            key="dedup_method"
+        )
+        use_row_hash = dedup_method in ["Hash 64-bit per baris", "64-bit row hash"]
+        
+        if use_row_hash:
+            dedup_key_columns = st.multiselect(
+                "Kolom kunci (kosongkan untuk semua kolom):" if st.session_state.language == 'id' else "Key columns (leave empty for all columns):",
+                data.columns.tolist(),
+                key="dedup_key_columns"
+            )
+            duplicate_mask, row_hashes = find_exact_duplicates(data, dedup_key_columns or None)
+        else:
+            duplicate_mask = data.duplicated()
+        
         # Check for duplicate rows
-        duplicate_count = data.duplicated().sum()
+        duplicate_count = duplicate_mask.sum()
         
         if duplicate_count > 0:
             st.warning(f"Ditemukan {duplicate_count} baris duplikat dalam dataset" if st.session_state.language == 'id' else f"Found {duplicate_count} duplicate rows in the dataset")
             
             # Show preview of duplicate rows
-            duplicate_rows = data[data.duplicated(keep=False)].sort_values(by=data.columns.tolist())
+            if use_row_hash:
+                duplicate_clusters = exact_duplicate_clusters(row_hashes)
+                duplicate_rows = data.loc[duplicate_clusters['row_index']]
+                st.write(f"Jumlah klaster duplikat: {duplicate_clusters['cluster_id'].nunique()}" if st.session_state.language == 'id' else f"Number of duplicate clusters: {duplicate_clusters['cluster_id'].nunique()}")
+            else:
+                duplicate_rows = data[data.duplicated(keep=False)].sort_values(by=data.columns.tolist())
             st.write("Preview baris duplikat:" if st.session_state.language == 'id' else "Preview of duplicate rows:")
             st.dataframe(duplicate_rows.head(10))
             
@@ -1497,7 +1628,7 @@ with tab3:
                 original_count = len(data)
                 
                 # Remove duplicate rows
-                data = data.drop_duplicates()
+                data = data[~duplicate_mask]
                 
                 # Calculate removed duplicates
                 removed_count = original_count - len(data)
@@ -1506,6 +1637,54 @@ with tab3:
                 st.info(f"Jumlah data: {original_count} → {len(data)}" if st.session_state.language == 'id' else f"Data count: {original_count} → {len(data)}")
         else:
             st.success("Tidak ditemukan data duplikat dalam dataset" if st.session_state.language == 'id' else "No duplicate data found in the dataset")
+        
+        # Deteksi near-duplicate (mis. pasien terdaftar ulang dengan salah ketik)
+        detect_near_duplicates = st.checkbox(
+            "Deteksi near-duplicate (MinHash/LSH)" if st.session_state.language == 'id' else "Detect near-duplicates (MinHash/LSH)",
+            value=False,
+            help="Menemukan record yang mirip (mis. nama dengan salah ketik) tanpa membandingkan semua pasangan" if st.session_state.language == 'id' else "Finds similar records (e.g. names with typos) without comparing all pairs"
+        )
+        
+        if detect_near_duplicates:
+            near_dup_columns = st.multiselect(
+                "Kolom identitas untuk dibandingkan:" if st.session_state.language == 'id' else "Identity columns to compare:",
+                data.columns.tolist(),
+                default=[c for c in st.session_state.categorical_columns if c in data.columns][:2] or data.columns.tolist()[:1],
+                key="near_dup_columns"
+            )
+            near_dup_threshold = st.slider(
+                "Ambang kemiripan (Jaccard):" if st.session_state.language == 'id' else "Similarity threshold (Jaccard):",
+                0.5, 1.0, 0.8, 0.05,
+                key="near_dup_threshold"
+            )
+            
+            if near_dup_columns:
+                # Hasil disimpan per (isi data, indeks, parameter) agar rerun Streamlit tidak menghitung ulang MinHash
+                near_dup_key = (
+                    matrix_fingerprint(data[near_dup_columns]),
+                    matrix_fingerprint(data.index.to_frame(index=False)),
+                    near_dup_threshold
+                )
+                cached_near_dup = st.session_state.get('near_dup_cache')
+                if cached_near_dup is not None and cached_near_dup[0] == near_dup_key:
+                    near_dup_clusters = cached_near_dup[1]
+                else:
+                    with st.spinner("Mencari near-duplicate..." if st.session_state.language == 'id' else "Searching for near-duplicates..."):
+                        near_dup_clusters = find_near_duplicates(data, near_dup_columns, threshold=near_dup_threshold)
+                    st.session_state.near_dup_cache = (near_dup_key, near_dup_clusters)
+                
+                if len(near_dup_clusters) > 0:
+                    st.warning(f"Ditemukan {near_dup_clusters['cluster_id'].nunique()} klaster near-duplicate ({len(near_dup_clusters)} baris)" if st.session_state.language == 'id' else f"Found {near_dup_clusters['cluster_id'].nunique()} near-duplicate clusters ({len(near_dup_clusters)} rows)")
+                    near_dup_preview = data.loc[near_dup_clusters['row_index'], near_dup_columns].copy()
+                    near_dup_preview.insert(0, 'cluster_id', near_dup_clusters['cluster_id'].to_numpy())
+                    st.dataframe(near_dup_preview.head(50))
+                    
+                    if st.checkbox("Pertahankan hanya satu record per klaster" if st.session_state.language == 'id' else "Keep only one record per cluster", value=False, key="drop_near_duplicates"):
+                        drop_index = near_dup_clusters[near_dup_clusters.duplicated('cluster_id')]['row_index']
+                        data = data.drop(index=drop_index)
+                        st.success(f"Berhasil menghapus {len(drop_index)} near-duplicate" if st.session_state.language == 'id' else f"Removed {len(drop_index)} near-duplicates")
+                else:
+                    st.success("Tidak ditemukan near-duplicate" if st.session_state.language == 'id' else "No near-duplicates found")
 
         # Feature selection
         st.subheader("Rekayasa Data" if st.session_state.language == 'id' else "Data Modification")
@@ -1575,9 +1754,6 @@ with tab3:
                         confirm_removal = st.checkbox("Konfirmasi penghapusan" if st.session_state.language == 'id' else "Confirm removal", key="confirm_removal_v1")
                         
                         if confirm_removal:
-                            # Simpan data asli
-                            original_data = data.copy()
-                            
                             # Hapus kelas yang dipilih
                             data = data[~data[target_column].isin(classes_to_remove)]
                             
@@ -1603,6 +1779,16 @@ with tab3:
                             st.dataframe(comparison_df)
                 
 
+        # Presisi numerik: float32 dipakai dari encoding sampai scaling, training, SHAP dan prediksi batch
+        numeric_precision = st.radio(
+            "Presisi numerik:" if st.session_state.language == 'id' else "Numeric precision:",
+            ["float64", "float32"],
+            horizontal=True,
+            help="float32 memotong memori matriks fitur sekitar separuh" if st.session_state.language == 'id' else "float32 roughly halves feature-matrix memory"
+        )
+        st.session_state.float32_mode = numeric_precision == "float32"
+        feature_dtype = np.float32 if st.session_state.float32_mode else np.float64
+
         # Encoding fitur kategorikal
         categorical_cols = [col for col in data.columns if col in st.session_state.categorical_columns and col != target_column]
         if categorical_cols:
@@ -1614,7 +1800,9 @@ with tab3:
                 unique_values = data[col].nunique()
                 st.write(f"- **{col}**: {unique_values} nilai unik" if st.session_state.language == 'id' else f"- **{col}**: {unique_values} unique values")
             
-            encoding_method = st.radio("Encoding method:", ["Label Encoding", "One-Hot Encoding"])
+            encoding_method = st.radio("Encoding method:", ["Label Encoding", "One-Hot Encoding", "One-Hot Encoding (Sparse)", "Hashing Encoding", "Target Encoding (Out-of-Fold)"])
+            st.session_state.sparse_encoder = None
+            st.session_state.target_encoder = None
             if encoding_method == "Label Encoding":
                 encoders = {}
                 for col in categorical_cols:
@@ -1623,9 +1811,40 @@ with tab3:
                     encoders[col] = le
                 st.session_state.encoders = encoders
                 st.success("Encoding label diaplikasikan pada fitur kategorikal." if st.session_state.language == 'id' else "Label encoding applied to categorical features.")
+            elif encoding_method == "One-Hot Encoding (Sparse)":
+                # Encoding langsung ke matriks CSR, memori sebanding dengan jumlah nilai non-zero
+                target_series = data[target_column]
+                sparse_encoder = SparseOneHotEncoder(drop_first=True, dtype=feature_dtype)
+                data = sparse_encoder.fit_transform(data.drop(columns=[target_column]), categorical_cols)
+                data[target_column] = target_series
+                st.session_state.sparse_encoder = sparse_encoder
+                st.success("One-hot encoding sparse diaplikasikan pada fitur kategorikal." if st.session_state.language == 'id' else "Sparse one-hot encoding applied to categorical features.")
+            elif encoding_method == "Hashing Encoding":
+                # Lebar kolom tetap, tidak bergantung pada jumlah kategori
+                n_hash_features = st.select_slider(
+                    "Jumlah kolom hash:" if st.session_state.language == 'id' else "Number of hash columns:",
+                    options=[16, 32, 64, 128, 256, 512, 1024, 2048, 4096],
+                    value=256
+                )
+                target_series = data[target_column]
+                sparse_encoder = HashingEncoder(n_features=n_hash_features, dtype=feature_dtype)
+                data = sparse_encoder.fit_transform(data.drop(columns=[target_column]), categorical_cols)
+                data[target_column] = target_series
+                st.session_state.sparse_encoder = sparse_encoder
+                st.success(f"Hashing encoding diaplikasikan: {len(categorical_cols)} fitur kategorikal menjadi {n_hash_features} kolom." if st.session_state.language == 'id' else f"Hashing encoding applied: {len(categorical_cols)} categorical features mapped to {n_hash_features} columns.")
+            elif encoding_method == "Target Encoding (Out-of-Fold)":
+                col1, col2 = st.columns(2)
+                with col1:
+                    te_smoothing = st.slider("Smoothing:", 0.0, 100.0, 10.0, 1.0)
+                with col2:
+                    te_folds = st.slider("Jumlah fold:" if st.session_state.language == 'id' else "Number of folds:", 2, 10, 5)
+                st.info("Setiap baris dienkode dengan statistik target dari fold lain sehingga nilai targetnya sendiri tidak bocor ke fitur. Encoder di-fit setelah train-test split, hanya pada data latih; data uji memakai mapping yang sama dengan prediksi." if st.session_state.language == 'id' else "Each row is encoded with target statistics from the other folds, so its own target never leaks into its features. The encoder is fitted after the train-test split on the training rows only; test rows use the same mapping as prediction.")
+                # Fit ditunda sampai setelah train-test split (lihat di bawah) agar label data uji tidak ikut dipelajari
+                st.session_state.target_encoder = TargetEncoder(smoothing=te_smoothing, n_folds=te_folds, problem_type=st.session_state.problem_type, random_state=42, dtype=feature_dtype)
+                st.success("Target encoding akan diaplikasikan pada fitur kategorikal setelah train-test split." if st.session_state.language == 'id' else "Target encoding will be applied to categorical features after the train-test split.")
             else:  # One-Hot Encoding
                 # Simpan target column
-                target_series = data[target_column].copy()
+                target_series = data[target_column]
                 # One-hot encode data
                 data = pd.get_dummies(data.drop(columns=[target_column]), columns=categorical_cols, drop_first=True)
                 # Kembalikan target column
@@ -1635,24 +1854,35 @@ with tab3:
             # Tampilkan deskripsi fitur setelah encoding
             st.subheader("Deskripsi Fitur Setelah Encoding" if st.session_state.language == 'id' else "Feature Description After Encoding")
             
-            # Buat dataframe deskripsi fitur
-            feature_desc = pd.DataFrame({
-                'Nama Fitur' if st.session_state.language == 'id' else 'Feature Name': data.columns,
-                'Tipe Data' if st.session_state.language == 'id' else 'Data Type': data.dtypes.astype(str),
-                'Jumlah Non-Null' if st.session_state.language == 'id' else 'Non-Null Count': data.count(),
-                'Jumlah Nilai Unik' if st.session_state.language == 'id' else 'Unique Values': data.nunique(),
-                'Nilai yang Hilang' if st.session_state.language == 'id' else 'Missing Values': data.isnull().sum()
-            })
-            
-            # Tampilkan sebagai tabel
-            st.dataframe(feature_desc)
-            
-            # Tampilkan ringkasan statistik
-            st.write("**Ringkasan Statistik:**" if st.session_state.language == 'id' else "**Statistical Summary:**")
-            st.write(f"- Total fitur: {len(data.columns)}")
-            st.write(f"- Total baris: {len(data)}")
-            st.write(f"- Fitur numerik: {len(data.select_dtypes(include=[np.number]).columns)}")
-            st.write(f"- Fitur kategorikal: {len(data.select_dtypes(include=['object', 'category']).columns)}")
+            if st.session_state.sparse_encoder is not None:
+                # Ringkasan ringkas untuk matriks sparse (hindari nunique/count per kolom pada ribuan kolom)
+                nnz, density, sparse_bytes, dense_bytes = sparse_memory_summary(data.drop(columns=[target_column]))
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Jumlah fitur" if st.session_state.language == 'id' else "Number of features", len(data.columns) - 1)
+                with col2:
+                    st.metric("Nilai non-zero" if st.session_state.language == 'id' else "Non-zero values", f"{nnz:,} ({density:.2%})")
+                with col3:
+                    st.metric("Memori (sparse vs dense)" if st.session_state.language == 'id' else "Memory (sparse vs dense)", f"{sparse_bytes / 1024**2:.1f} MB", f"-{(dense_bytes - sparse_bytes) / 1024**2:.1f} MB vs dense")
+            else:
+                # Buat dataframe deskripsi fitur
+                feature_desc = pd.DataFrame({
+                    'Nama Fitur' if st.session_state.language == 'id' else 'Feature Name': data.columns,
+                    'Tipe Data' if st.session_state.language == 'id' else 'Data Type': data.dtypes.astype(str),
+                    'Jumlah Non-Null' if st.session_state.language == 'id' else 'Non-Null Count': data.count(),
+                    'Jumlah Nilai Unik' if st.session_state.language == 'id' else 'Unique Values': data.nunique(),
+                    'Nilai yang Hilang' if st.session_state.language == 'id' else 'Missing Values': data.isnull().sum()
+                })
+
+                # Tampilkan sebagai tabel
+                st.dataframe(feature_desc)
+
+                # Tampilkan ringkasan statistik
+                st.write("**Ringkasan Statistik:**" if st.session_state.language == 'id' else "**Statistical Summary:**")
+                st.write(f"- Total fitur: {len(data.columns)}")
+                st.write(f"- Total baris: {len(data)}")
+                st.write(f"- Fitur numerik: {len(data.select_dtypes(include=[np.number]).columns)}")
+                st.write(f"- Fitur kategorikal: {len(data.select_dtypes(include=['object', 'category']).columns)}")
  
             # Tampilkan distribusi kelas
             class_counts = data[target_column].value_counts()
@@ -1670,6 +1900,17 @@ with tab3:
         # Update all_columns setelah encoding
         all_columns = [col for col in data.columns if col != target_column]
 
+        if st.session_state.float32_mode:
+            bytes_before = frame_nbytes(data[all_columns])
+            data = to_float32(data, exclude=[target_column])
+            bytes_after = frame_nbytes(data[all_columns])
+            st.metric(
+                "Memori fitur (float32)" if st.session_state.language == 'id' else "Feature memory (float32)",
+                f"{bytes_after / 1024**2:.1f} MB",
+                f"-{(bytes_before - bytes_after) / 1024**2:.1f} MB vs float64",
+                delta_color="inverse"
+            )
+
         # Train-test split
         st.subheader("Lakukan Train-Test Split" if st.session_state.language == 'id' else "Train-Test Split")
 
@@ -1692,6 +1933,16 @@ with tab3:
             X, y, test_size=test_size, random_state=random_state
         )
 
+        if st.session_state.target_encoder is not None:
+            # Target encoding: statistik hanya dari data latih (out-of-fold), data uji lewat transform() seperti saat prediksi
+            target_encoder = st.session_state.target_encoder
+            X_train = target_encoder.fit_transform(X_train, categorical_cols, y_train)
+            X_test = target_encoder.transform(X_test)
+            all_columns = list(X_train.columns)
+            # Seleksi fitur di bawah membaca data: susun ulang dari bagian latih/uji yang sudah dienkode
+            data = pd.concat([X_train, X_test])
+            data[target_column] = np.concatenate([y_train.to_numpy(), y_test.to_numpy()])
+
         # Tambahkan normalisasi setelah train test split
         st.subheader("Normalisasi Fitur" if st.session_state.language == 'id' else "Feature Normalization")
 
@@ -1700,9 +1951,19 @@ with tab3:
             ["None", "StandardScaler", "MinMaxScaler", "RobustScaler"]
         )
 
-        if normalization_method != "None":
+        st.session_state.sparse_scaler = None
+        if normalization_method != "None" and is_sparse_frame(X_train):
+            # Scaler tanpa centering agar matriks tetap sparse
+            scaler = make_sparse_scaler(normalization_method)
+            X_train = sparse_frame(scaler.fit_transform(frame_to_csr(X_train)), index=X_train.index, columns=X_train.columns)
+            X_test = sparse_frame(scaler.transform(frame_to_csr(X_test)), index=X_test.index, columns=X_test.columns)
+            st.session_state.sparse_scaler = scaler
+
+            st.success(f"Normalisasi {normalization_method} (sparse, tanpa centering) berhasil diterapkan" if st.session_state.language == 'id' else f"{normalization_method} normalization (sparse, without centering) applied")
+            st.info(f"Fitur yang dinormalisasi: {X_train.shape[1]} fitur" if st.session_state.language == 'id' else f"Normalized features: {X_train.shape[1]} features")
+        elif normalization_method != "None":
             from sklearn.preprocessing import StandardScaler, MinMaxScaler, RobustScaler
-            
+
             if normalization_method == "StandardScaler":
                 scaler = StandardScaler()
             elif normalization_method == "MinMaxScaler":
@@ -1740,11 +2001,46 @@ with tab3:
                      "SMOTEENN",
                      "SMOTETomek"]
                 )
+
+                # Mode skala besar: indeks tetangga per kelas dibangun sekali, sampel sintetis dibuat per chunk di beberapa proses
+                scalable_resampling = False
+                if balance_method in ["SMOTE", "SMOTEENN", "SMOTETomek"] and not is_sparse_frame(X_train):
+                    scalable_resampling = st.checkbox(
+                        "Mode data besar (chunked & paralel)" if st.session_state.language == 'id' else "Large-data mode (chunked & parallel)",
+                        value=len(X_train) > 100000,
+                        help="Indeks tetangga dibangun sekali dan dipakai ulang untuk pembersihan ENN/Tomek" if st.session_state.language == 'id' else "The neighbour index is built once and reused by the ENN/Tomek cleaning pass"
+                    )
+                    if scalable_resampling:
+                        col1, col2 = st.columns(2)
+                        with col1:
+                            resampling_chunk_size = st.number_input(
+                                "Ukuran chunk sampel sintetis:" if st.session_state.language == 'id' else "Synthetic sample chunk size:",
+                                min_value=1000, max_value=500000, value=50000, step=1000
+                            )
+                        with col2:
+                            approximate_neighbours = st.checkbox(
+                                "Tetangga aproksimasi (PyNNDescent)" if st.session_state.language == 'id' else "Approximate neighbours (PyNNDescent)",
+                                value=False, disabled=not PYNNDESCENT_AVAILABLE,
+                                help=None if PYNNDESCENT_AVAILABLE else ("Install dengan: pip install pynndescent" if st.session_state.language == 'id' else "Install with: pip install pynndescent")
+                            )
                 
                 if balance_method != "Tidak ada" and balance_method != "None":
                     with st.spinner("Menerapkan penyeimbangan dataset..." if st.session_state.language == 'id' else "Applying dataset balancing..."):
                         try:
-                            if balance_method == "Random Over Sampling":
+                            if scalable_resampling:
+                                resampler = ScalableResampler(
+                                    method=balance_method,
+                                    chunk_size=int(resampling_chunk_size),
+                                    approximate=approximate_neighbours,
+                                    random_state=random_state
+                                )
+                                X_train_bal, y_train_bal = resampler.fit_resample(X_train, y_train)
+                                st.info(
+                                    f"{resampler.n_synthetic_} sampel sintetis dibuat, {resampler.n_removed_} sampel dihapus saat pembersihan"
+                                    if st.session_state.language == 'id'
+                                    else f"{resampler.n_synthetic_} synthetic samples generated, {resampler.n_removed_} samples removed by cleaning"
+                                )
+                            elif balance_method == "Random Over Sampling":
                                 ros = RandomOverSampler(random_state=random_state)
                                 X_train_bal, y_train_bal = ros.fit_resample(X_train, y_train)
                             elif balance_method == "Random Under Sampling":
@@ -1799,12 +2095,58 @@ with tab3:
             ]
         )
 
-        # Gunakan data training untuk seleksi fitur
-        X_train_for_selection = X_train.copy()
-        y_train_for_selection = y_train.copy()
-        
+        # Pengaturan estimasi mutual information (dipakai semua metode yang memakai MI)
+        with st.expander("Pengaturan Mutual Information" if st.session_state.language == 'id' else "Mutual Information Settings"):
+            st.caption(
+                "Fitur diskrit/kategorikal memakai tabel kontingensi; fitur kontinu memakai estimator kNN yang dibagi ke beberapa proses."
+                if st.session_state.language == 'id'
+                else "Discrete/categorical features use a contingency table; continuous features use the kNN estimator split across worker processes."
+            )
+            mi_use_sample = st.checkbox(
+                "Estimasi pada sampel baris (terstratifikasi)" if st.session_state.language == 'id' else "Estimate on a (stratified) row sample",
+                value=len(data) > 50000
+            )
+            mi_params = {}
+            if mi_use_sample:
+                col1, col2 = st.columns(2)
+                with col1:
+                    mi_params['sample_size'] = st.number_input(
+                        "Ukuran sampel:" if st.session_state.language == 'id' else "Sample size:",
+                        min_value=100, max_value=max(100, len(data)), value=min(20000, max(100, len(data))), step=1000
+                    )
+                with col2:
+                    mi_params['n_repeats'] = st.number_input(
+                        "Jumlah pengulangan subsampling:" if st.session_state.language == 'id' else "Subsampling repeats:",
+                        min_value=1, max_value=10, value=3, step=1,
+                        help="Skor dirata-rata antar subsampel agar lebih stabil" if st.session_state.language == 'id' else "Scores are averaged across subsamples for stability"
+                    )
+
+        # Pengaturan RFE (dipakai semua jalur RFE)
+        with st.expander("Pengaturan RFE" if st.session_state.language == 'id' else "RFE Settings"):
+            rfe_step = st.select_slider(
+                "Langkah eliminasi per iterasi:" if st.session_state.language == 'id' else "Features eliminated per iteration:",
+                options=[1, 0.05, 0.1, 0.2, 0.3],
+                value=1,
+                help="Default 1 fitur per iterasi (sama seperti RFE standar); langkah persentase lebih cepat pada data lebar tetapi dapat mengubah hasil" if st.session_state.language == 'id' else "Default is 1 feature per iteration (standard RFE); percentage steps are faster on wide data but can change the result",
+                format_func=lambda v: ("1 fitur" if st.session_state.language == 'id' else "1 feature") if v == 1 else f"{int(v * 100)}%"
+            )
+            rfe_params = {'step': rfe_step}
+            rfe_use_cv = st.checkbox(
+                "RFECV: pilih jumlah fitur dengan cross-validation (fold paralel)" if st.session_state.language == 'id' else "RFECV: choose the number of features by cross-validation (parallel folds)",
+                value=False
+            )
+            rfe_cv_folds = st.slider("Jumlah fold RFECV:" if st.session_state.language == 'id' else "RFECV folds:", 3, 10, 5, disabled=not rfe_use_cv)
+
+        # Matriks fitur ter-encode dibuat saat pertama dibutuhkan (hanya oleh metode yang memakainya), paling banyak
+        # sekali per rerun; tiap metode memakai subset kolomnya (view, bukan salinan)
+        encoded_frames = {}
+        def encoded_features():
+            if 'X' not in encoded_frames:
+                encoded_frames['X'] = label_encoded(data[all_columns])
+            return encoded_frames['X']
+
         # Simpan nama kolom asli untuk referensi
-        all_columns_for_selection = X_train_for_selection.columns.tolist()
+        all_columns_for_selection = X_train.columns.tolist()
         selected_features = all_columns_for_selection
 
         # Setelah feature selection selesai, terapkan pada X_train dan X_test
@@ -1916,172 +2258,121 @@ with tab3:
                     min_value=1, max_value=len(all_columns), value=min(10, len(all_columns)), step=1
                 )
             
-            # Prepare data for PyGAD
-            X_ga = data[all_columns].copy()
-            y_ga = data[target_column].copy()
+            # Opsi percepatan: fitness surrogate, early stopping, dan checkpoint
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                ga_use_surrogate = st.checkbox(
+                    "Fitness surrogate (ridge)" if st.session_state.language == 'id' else "Surrogate fitness (ridge)",
+                    value=False,
+                    help="Skor ridge closed-form pada fold yang di-cache; hanya kromosom elit yang diverifikasi dengan Random Forest" if st.session_state.language == 'id' else "Closed-form ridge score on cached folds; only elite chromosomes are verified with Random Forest"
+                )
+                ga_verify_elite = st.number_input(
+                    "Elit yang diverifikasi per generasi:" if st.session_state.language == 'id' else "Elites verified per generation:",
+                    min_value=1, max_value=10, value=3, step=1,
+                    disabled=not ga_use_surrogate
+                )
+            with col2:
+                ga_patience = st.number_input(
+                    "Early stopping (generasi tanpa peningkatan):" if st.session_state.language == 'id' else "Early stopping (generations without improvement):",
+                    min_value=0, max_value=200, value=15, step=1,
+                    help="0 = nonaktif" if st.session_state.language == 'id' else "0 = disabled"
+                )
+            with col3:
+                ga_checkpoint_every = st.number_input(
+                    "Checkpoint setiap N generasi:" if st.session_state.language == 'id' else "Checkpoint every N generations:",
+                    min_value=0, max_value=100, value=5, step=1,
+                    help="0 = nonaktif" if st.session_state.language == 'id' else "0 = disabled"
+                )
             
-            # Handle categorical variables
-            for col in X_ga.select_dtypes(include=['object', 'category']).columns:
-                le = LabelEncoder()
-                X_ga[col] = le.fit_transform(X_ga[col].astype(str))
+            # Prepare data for PyGAD
+            X_ga = encoded_features()
+            y_ga = data[target_column]
             
             # Standardize features
             scaler = StandardScaler()
             X_ga_scaled = scaler.fit_transform(X_ga)
             
-            if st.button("Jalankan Algoritma Genetik" if st.session_state.language == 'id' else "Run Genetic Algorithm"):
-                try:
-                    import pygad
-                    
-                    # Define fitness function
-                    def fitness_func(ga_instance, solution, solution_idx):
-                        # Get selected features based on binary solution
-                        selected_indices = np.where(solution == 1)[0]
-                        
-                        if len(selected_indices) == 0:
-                            return 0.0
-                        
-                        # Limit to target number of features
-                        if len(selected_indices) > target_features:
-                            # Select top features based on importance
-                            if problem_type == "Regression":
-                                from sklearn.ensemble import RandomForestRegressor
-                                temp_model = RandomForestRegressor(n_estimators=50, random_state=42)
-                                temp_model.fit(X_ga_scaled, y_ga)
-                                importances = temp_model.feature_importances_
-                                top_indices = np.argsort(importances)[-target_features:]
-                                selected_indices = np.intersect1d(selected_indices, top_indices)
-                            else:
-                                from sklearn.ensemble import RandomForestClassifier
-                                temp_model = RandomForestClassifier(n_estimators=50, random_state=42)
-                                temp_model.fit(X_ga_scaled, y_ga)
-                                importances = temp_model.feature_importances_
-                                top_indices = np.argsort(importances)[-target_features:]
-                                selected_indices = np.intersect1d(selected_indices, top_indices)
-                        
-                        if len(selected_indices) == 0:
-                            return 0.0
-                        
-                        # Get selected features
-                        X_selected = X_ga_scaled[:, selected_indices]
-                        
-                        # Use cross-validation to evaluate fitness
-                        if problem_type == "Regression":
-                            from sklearn.ensemble import RandomForestRegressor
-                            model = RandomForestRegressor(n_estimators=50, random_state=42)
-                            scores = cross_val_score(model, X_selected, y_ga, cv=3, 
-                                                   scoring='neg_mean_squared_error')
-                            fitness = -np.mean(scores)  # Negative MSE, so higher is better
-                        else:
-                            from sklearn.ensemble import RandomForestClassifier
-                            model = RandomForestClassifier(n_estimators=50, random_state=42)
-                            scores = cross_val_score(model, X_selected, y_ga, cv=3, 
-                                                   scoring='accuracy')
-                            fitness = np.mean(scores)
-                        
-                        # Penalty for too many features
-                        penalty = abs(len(selected_indices) - target_features) * 0.01
-                        return max(0, fitness - penalty)
-                    
-                    # Initialize PyGAD
-                    gene_space = [0, 1]  # Binary genes
-                    
-                    ga_instance = pygad.GA(
-                        num_generations=ga_generations,
-                        num_parents_mating=ga_population_size // 2,
-                        fitness_func=fitness_func,
-                        sol_per_pop=ga_population_size,
-                        num_genes=len(all_columns),
-                        gene_space=gene_space,
-                        init_range_low=0,
-                        init_range_high=2,
-                        parent_selection_type="tournament",
-                        K_tournament=3,
-                        crossover_type="single_point",
-                        crossover_probability=ga_crossover_rate,
-                        mutation_type="random",
-                        mutation_probability=ga_mutation_rate,
-                        keep_elitism=ga_elite_size,
-                        random_seed=42,
-                        suppress_warnings=True
+            # Checkpoint dikunci oleh data + parameter GA, sehingga run yang terputus bisa dilanjutkan
+            ga_checkpoint_file = checkpoint_path(X_ga_scaled, y_ga, {
+                'problem_type': problem_type,
+                'population_size': ga_population_size,
+                'generations': ga_generations,
+                'mutation_rate': ga_mutation_rate,
+                'crossover_rate': ga_crossover_rate,
+                'elite_size': ga_elite_size,
+                'target_features': target_features,
+                'surrogate': ga_use_surrogate
+            })
+            ga_checkpoint = load_checkpoint(ga_checkpoint_file) if ga_checkpoint_every > 0 else None
+            ga_resume = False
+            if ga_checkpoint is not None:
+                ga_resume = st.checkbox(
+                    f"Lanjutkan dari checkpoint (generasi {ga_checkpoint['generations_completed']}/{ga_generations})" if st.session_state.language == 'id' else f"Resume from checkpoint (generation {ga_checkpoint['generations_completed']}/{ga_generations})",
+                    value=True
+                )
+            
+            ga_params = {
+                'population_size': ga_population_size,
+                'mutation_rate': ga_mutation_rate,
+                'crossover_rate': ga_crossover_rate,
+                'elite_size': ga_elite_size,
+                'target_features': target_features,
+                'surrogate': ga_use_surrogate,
+                'verify_elite': ga_verify_elite,
+                'patience': ga_patience,
+                'checkpoint_file': ga_checkpoint_file,
+                'checkpoint_every': ga_checkpoint_every,
+                'resume': ga_resume
+            }
+            ga_in_background = st.checkbox(
+                "Jalankan di latar belakang (job)" if st.session_state.language == 'id' else "Run in the background (job)",
+                value=False,
+                key="ga_in_background",
+                help="Algoritma genetik dijalankan sebagai job yang melaporkan progres per generasi, bisa dibatalkan (checkpoint tetap tersimpan), dan tetap berjalan saat halaman dimuat ulang" if st.session_state.language == 'id' else "The genetic algorithm runs as a job that reports progress every generation, can be cancelled (its checkpoint is kept), and keeps running when the page reloads"
+            )
+            ga_result = None
+            if ga_in_background:
+                if st.button("Kirim Job Algoritma Genetik" if st.session_state.language == 'id' else "Submit Genetic Algorithm Job"):
+                    # Pool evaluasi fitness di dalam job dibatasi agar job yang berjalan bersamaan tidak berebut core
+                    st.session_state.ga_job_id = jobs.submit(
+                        "ga", f"GA ({target_features} / {len(all_columns)})", ga_selection_job,
+                        X_ga_scaled, y_ga, problem_type, ga_generations,
+                        n_jobs=max(1, (os.cpu_count() or 1) // jobs.max_workers),
+                        owner=st.session_state.job_owner,
+                        meta={'data_key': os.path.basename(ga_checkpoint_file)},
+                        **ga_params
                     )
-                    
+                
+                def show_ga_partial(partial):
+                    st.write(f"Generasi {partial['generation']}/{ga_generations} - Fitness terbaik: {partial['best_fitness']:.4f}" if st.session_state.language == 'id' else f"Generation {partial['generation']}/{ga_generations} - Best fitness: {partial['best_fitness']:.4f}")
+                
+                ga_job_id, ga_job = job_panel("ga", 'ga_job_id', show_ga_partial)
+                if ga_job is not None and ga_job['status'] == "completed":
+                    # Kunci checkpoint = data + parameter GA; hasil dari data/kolom lain tidak dipetakan ke all_columns
+                    if ga_job.get('data_key') == os.path.basename(ga_checkpoint_file):
+                        ga_result = jobs.result(ga_job_id)
+                    else:
+                        st.warning("Job ini dijalankan pada data atau parameter GA yang berbeda; hasilnya tidak dimuat." if st.session_state.language == 'id' else "This job ran on different data or GA parameters; its results are not loaded.")
+            elif st.button("Jalankan Algoritma Genetik" if st.session_state.language == 'id' else "Run Genetic Algorithm"):
+                try:
                     # Progress bar
                     progress_bar = st.progress(0)
                     status_text = st.empty()
                     
-                    def on_generation(ga_instance):
-                        generation = ga_instance.generations_completed
-                        max_generations = ga_instance.num_generations
-                        progress = generation / max_generations
-                        progress_bar.progress(progress)
-                        
-                        best_fitness = ga_instance.best_solution()[1]
+                    def on_generation(generation, best_fitness):
+                        progress_bar.progress(min(generation / ga_generations, 1.0))
                         status_text.text(
-                            f"Generasi {generation}/{max_generations} - Fitness terbaik: {best_fitness:.4f}" 
+                            f"Generasi {generation}/{ga_generations} - Fitness terbaik: {best_fitness:.4f}" 
                             if st.session_state.language == 'id' 
-                            else f"Generation {generation}/{max_generations} - Best fitness: {best_fitness:.4f}"
+                            else f"Generation {generation}/{ga_generations} - Best fitness: {best_fitness:.4f}"
                         )
                     
-                    ga_instance.on_generation = on_generation
-                    
                     # Run genetic algorithm
                     with st.spinner("Menjalankan algoritma genetik..." if st.session_state.language == 'id' else "Running genetic algorithm..."):
-                        ga_instance.run()
-                    
-                    # Get results
-                    solution, solution_fitness, solution_idx = ga_instance.best_solution()
-                    selected_indices = np.where(solution == 1)[0]
-                    selected_features = [all_columns[i] for i in selected_indices]
-                    
-                    # Display results
-                    st.success(f"Algoritma genetik selesai!" if st.session_state.language == 'id' else "Genetic algorithm completed!")
-                    
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.metric("Jumlah fitur terpilih" if st.session_state.language == 'id' else "Selected features count", 
-                                len(selected_features))
-                        st.metric("Fitness terbaik" if st.session_state.language == 'id' else "Best fitness", 
-                                f"{solution_fitness:.4f}")
-                    
-                    with col2:
-                        st.metric("Total fitur" if st.session_state.language == 'id' else "Total features", 
-                                len(all_columns))
-                        st.metric("Persentase fitur terpilih" if st.session_state.language == 'id' else "Feature selection ratio", 
-                                f"{len(selected_features)/len(all_columns)*100:.1f}%")
-                    
-                    # Display selected features
-                    st.write("**Fitur yang dipilih algoritma genetik:**" if st.session_state.language == 'id' else "**Features selected by genetic algorithm:**")
-                    st.write(selected_features)
-                    
-                    # Feature importance visualization
-                    if len(selected_features) > 0:
-                        st.write("**Visualisasi seleksi fitur:**" if st.session_state.language == 'id' else "**Feature selection visualization:**")
-                        
-                        # Create a dataframe with selection status
-                        selection_df = pd.DataFrame({
-                            'Feature': all_columns,
-                            'Selected': [1 if i in selected_indices else 0 for i in range(len(all_columns))]
-                        })
-                        
-                        # Plot selection status
-                        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
-                        
-                        # Bar plot of selected vs not selected
-                        selection_counts = selection_df['Selected'].value_counts()
-                        colors = ['#ff9999', '#66b3ff']
-                        ax1.pie(selection_counts.values, labels=['Not Selected', 'Selected'], 
-                               colors=colors, autopct='%1.1f%%', startangle=90)
-                        ax1.set_title('Distribusi Seleksi Fitur' if st.session_state.language == 'id' else 'Feature Selection Distribution')
-                        
-                        # Fitness evolution plot
-                        ax2.plot(ga_instance.best_solutions_fitness, 'b-', linewidth=2)
-                        ax2.set_xlabel('Generasi' if st.session_state.language == 'id' else 'Generation')
-                        ax2.set_ylabel('Fitness' if st.session_state.language == 'id' else 'Fitness')
-                        ax2.set_title('Evolusi Fitness Algoritma Genetik' if st.session_state.language == 'id' else 'Genetic Algorithm Fitness Evolution')
-                        ax2.grid(True, alpha=0.3)
-                        
-                        st.pyplot(fig)
+                        ga_result = run_genetic_selection(
+                            X_ga_scaled, y_ga, problem_type, generations=ga_generations,
+                            on_generation=on_generation, **ga_params
+                        )
                     
                     # Clean up
                     progress_bar.empty()
@@ -2091,12 +2382,79 @@ with tab3:
                     st.error("PyGAD tidak terinstal. Silakan install dengan: pip install pygad" if st.session_state.language == 'id' else 
                             "PyGAD not installed. Please install with: pip install pygad")
                     selected_features = all_columns
+            
+            if ga_result is not None:
+                generations_run = ga_result['generations_run']
+                if generations_run < ga_generations:
+                    st.info(
+                        f"Early stopping pada generasi {generations_run}: fitness tidak meningkat selama {ga_patience} generasi"
+                        if st.session_state.language == 'id'
+                        else f"Early stopping at generation {generations_run}: no fitness improvement for {ga_patience} generations"
+                    )
+                
+                selected_indices = ga_result['selected_indices']
+                solution_fitness = ga_result['solution_fitness']
+                fitness_history = ga_result['fitness_history']
+                selected_features = [all_columns[i] for i in selected_indices]
+                
+                # Display results
+                st.success(f"Algoritma genetik selesai!" if st.session_state.language == 'id' else "Genetic algorithm completed!")
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.metric("Jumlah fitur terpilih" if st.session_state.language == 'id' else "Selected features count", 
+                            len(selected_features))
+                    st.metric("Fitness terbaik" if st.session_state.language == 'id' else "Best fitness", 
+                            f"{solution_fitness:.4f}")
+                
+                with col2:
+                    st.metric("Total fitur" if st.session_state.language == 'id' else "Total features", 
+                            len(all_columns))
+                    st.metric("Persentase fitur terpilih" if st.session_state.language == 'id' else "Feature selection ratio", 
+                            f"{len(selected_features)/len(all_columns)*100:.1f}%")
+                
+                st.caption(
+                    f"Evaluasi fitness: {ga_result['n_evaluations']} subset unik dilatih dari {ga_result['n_requests']} permintaan (sisanya dari cache)"
+                    if st.session_state.language == 'id'
+                    else f"Fitness evaluations: {ga_result['n_evaluations']} unique subsets trained out of {ga_result['n_requests']} requests (the rest served from cache)"
+                )
+                
+                # Display selected features
+                st.write("**Fitur yang dipilih algoritma genetik:**" if st.session_state.language == 'id' else "**Features selected by genetic algorithm:**")
+                st.write(selected_features)
+                
+                # Feature importance visualization
+                if len(selected_features) > 0:
+                    st.write("**Visualisasi seleksi fitur:**" if st.session_state.language == 'id' else "**Feature selection visualization:**")
+                    
+                    # Create a dataframe with selection status
+                    selection_df = pd.DataFrame({
+                        'Feature': all_columns,
+                        'Selected': [1 if i in selected_indices else 0 for i in range(len(all_columns))]
+                    })
+                    
+                    # Plot selection status
+                    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+                    
+                    # Bar plot of selected vs not selected
+                    selection_counts = selection_df['Selected'].value_counts()
+                    colors = ['#ff9999', '#66b3ff']
+                    ax1.pie(selection_counts.values, labels=['Not Selected', 'Selected'], 
+                           colors=colors, autopct='%1.1f%%', startangle=90)
+                    ax1.set_title('Distribusi Seleksi Fitur' if st.session_state.language == 'id' else 'Feature Selection Distribution')
+                    
+                    # Fitness evolution plot
+                    ax2.plot(fitness_history, 'b-', linewidth=2)
+                    ax2.set_xlabel('Generasi' if st.session_state.language == 'id' else 'Generation')
+                    ax2.set_ylabel('Fitness' if st.session_state.language == 'id' else 'Fitness')
+                    ax2.set_title('Evolusi Fitness Algoritma Genetik' if st.session_state.language == 'id' else 'Genetic Algorithm Fitness Evolution')
+                    ax2.grid(True, alpha=0.3)
+                    
+                    st.pyplot(fig)
 
         elif feature_selection_method == "Mutual Information":
-                    if problem_type == "Regression":
-                        mi = mutual_info_regression(data[all_columns], data[target_column])
-                    else:
-                        mi = mutual_info_classif(data[all_columns], data[target_column])
+                    # Skor di-cache per versi data; slider hanya memfilter hasilnya
+                    mi = feature_scores.get(data[all_columns], data[target_column], "Mutual Information", problem_type, **mi_params).values
                     mi_df = pd.DataFrame({"Feature": all_columns, "Mutual Information": mi})
                     mi_df = mi_df.sort_values("Mutual Information", ascending=False)
                     
@@ -2130,7 +2488,7 @@ with tab3:
                 st.error("Target kolom harus numerik untuk Pearson Correlation.")
                 corr = pd.Series([np.nan]*len(numeric_columns), index=numeric_columns)
             else:
-                corr = data[numeric_columns].corrwith(data[target_column]).abs()
+                corr = feature_scores.get(data[numeric_columns], data[target_column], "Pearson Correlation", problem_type)
             corr_df = pd.DataFrame({"Feature": numeric_columns, "Correlation": corr})
             corr_df = corr_df.sort_values("Correlation", ascending=False)
             st.dataframe(corr_df)
@@ -2144,18 +2502,16 @@ with tab3:
             ax.invert_yaxis()
             st.pyplot(fig)
         elif feature_selection_method == "Recursive Feature Elimination (RFE)":
-            from sklearn.feature_selection import RFE
-            X_rfe = data[all_columns].copy()
-            for col in X_rfe.select_dtypes(include=['object', 'category']).columns:
-                le = LabelEncoder()
-                X_rfe[col] = le.fit_transform(X_rfe[col].astype(str))
-            if problem_type == "Regression":
-                estimator = LinearRegression()
-            else:
-                estimator = LogisticRegression(max_iter=500)
-            rfe = RFE(estimator, n_features_to_select=min(10, len(all_columns)))
-            rfe.fit(X_rfe, data[target_column])
-            rfe_df = pd.DataFrame({"Feature": all_columns, "Selected": rfe.support_})
+            X_rfe = encoded_features()
+            n_features_rfe = min(10, len(all_columns))
+            if rfe_use_cv:
+                # RFECV: fold dievaluasi paralel, jumlah fitur dipilih dari skor rata-rata validasi
+                rfecv_df = feature_scores.get(X_rfe, data[target_column], "RFECV", problem_type, cv=rfe_cv_folds, **rfe_params)
+                n_features_rfe = int(rfecv_df['mean_score'].idxmax())
+                st.line_chart(rfecv_df['mean_score'])
+                st.info(f"RFECV: jumlah fitur optimal = {n_features_rfe}" if st.session_state.language == 'id' else f"RFECV: optimal number of features = {n_features_rfe}")
+            rfe_ranking, rfe_selected = feature_scores.rfe_select(X_rfe, data[target_column], problem_type, n_features_rfe, **rfe_params)
+            rfe_df = pd.DataFrame({"Feature": all_columns, "Selected": [f in rfe_selected for f in all_columns], "Ranking": rfe_ranking.values})
             st.dataframe(rfe_df)
             selected_features = rfe_df[rfe_df["Selected"]]["Feature"].tolist()
             selected_count = rfe_df['Selected'].sum()
@@ -2170,15 +2526,7 @@ with tab3:
             st.pyplot(fig)
 
         elif feature_selection_method == "LASSO":
-            from sklearn.linear_model import Lasso, LogisticRegression
-            if problem_type == "Regression":
-                lasso = Lasso(alpha=0.01, max_iter=1000)
-            else:
-                lasso = LogisticRegression(penalty='l1', solver='liblinear', max_iter=500)
-            lasso.fit(data[all_columns], data[target_column])
-            coef = lasso.coef_ if hasattr(lasso, "coef_") else lasso.coef_
-            if coef.ndim > 1:
-                coef = coef[0]
+            coef = feature_scores.get(data[all_columns], data[target_column], "LASSO", problem_type, alpha=0.01, C=1.0).values
             lasso_df = pd.DataFrame({"Feature": all_columns, "Coefficient": coef})
             lasso_df = lasso_df[lasso_df["Coefficient"] != 0].sort_values("Coefficient", ascending=False)
             st.dataframe(lasso_df)
@@ -2191,13 +2539,7 @@ with tab3:
             ax.invert_yaxis()
             st.pyplot(fig)
         elif feature_selection_method == "Gradient Boosting Importance":
-            from sklearn.ensemble import GradientBoostingRegressor, GradientBoostingClassifier
-            if problem_type == "Regression":
-                model = GradientBoostingRegressor(random_state=42)
-            else:
-                model = GradientBoostingClassifier(random_state=42)
-            model.fit(data[all_columns], data[target_column])
-            importances = model.feature_importances_
+            importances = feature_scores.get(data[all_columns], data[target_column], "Gradient Boosting Importance", problem_type).values
             gb_df = pd.DataFrame({"Feature": all_columns, "Importance": importances})
             gb_df = gb_df.sort_values("Importance", ascending=False)
             st.dataframe(gb_df)
@@ -2211,19 +2553,11 @@ with tab3:
             ax.invert_yaxis()
             st.pyplot(fig)
         elif feature_selection_method == "Random Forest Importance":
-                    from sklearn.ensemble import RandomForestRegressor, RandomForestClassifier
-                    
                     # Tambahan: Input untuk jumlah pohon
                     n_estimators = st.number_input("Jumlah pohon Random Forest:", min_value=10, max_value=1000, value=100, step=10,
                                                    help="Semakin banyak pohon, semakin akurat tetapi lebih lambat")
                     
-                    if problem_type == "Regression":
-                        model = RandomForestRegressor(n_estimators=n_estimators, random_state=42)
-                    else:
-                        model = RandomForestClassifier(n_estimators=n_estimators, random_state=42)
-                    
-                    model.fit(data[all_columns], data[target_column])
-                    importances = model.feature_importances_
+                    importances = feature_scores.get(data[all_columns], data[target_column], "Random Forest Importance", problem_type, n_estimators=n_estimators).values
                     rf_df = pd.DataFrame({"Feature": all_columns, "Importance": importances})
                     rf_df = rf_df.sort_values("Importance", ascending=False)
                     
@@ -2277,10 +2611,7 @@ with tab3:
 
             def get_features_by_method(method):
                 if method == "Mutual Information":
-                    if problem_type == "Regression":
-                        mi = mutual_info_regression(data[all_columns], data[target_column])
-                    else:
-                        mi = mutual_info_classif(data[all_columns], data[target_column])
+                    mi = feature_scores.get(data[all_columns], data[target_column], "Mutual Information", problem_type, **mi_params).values
                     mi_df = pd.DataFrame({"Feature": all_columns, "Mutual Information": mi})
                     mi_df = mi_df.sort_values("Mutual Information", ascending=False)
                     
@@ -2290,61 +2621,32 @@ with tab3:
                     filtered_df = mi_df[mi_df["Mutual Information"] >= min_threshold]
                     return set(filtered_df["Feature"].tolist())
                 elif method == "Pearson Correlation":
-                    corr = data[all_columns].corrwith(data[target_column]).abs()
+                    corr = feature_scores.get(data[all_columns], data[target_column], "Pearson Correlation", problem_type).reindex(all_columns)
                     corr_df = pd.DataFrame({"Feature": all_columns, "Correlation": corr})
                     corr_df = corr_df.sort_values("Correlation", ascending=False)
                     top_n = st.slider(f"Top N fitur ({method}):", 1, len(all_columns), min(10, len(all_columns)), key=f"topn_{method}")
                     return set(corr_df.head(top_n)["Feature"].tolist())
                 elif method == "Recursive Feature Elimination (RFE)":
-                    from sklearn.feature_selection import RFE
-                    from sklearn.linear_model import LinearRegression, LogisticRegression  # Tambahkan import ini
-                    if problem_type == "Regression":
-                        estimator = LinearRegression()
-                    else:
-                        estimator = LogisticRegression(max_iter=500)
-                    rfe = RFE(estimator, n_features_to_select=min(10, len(all_columns)))
-                    rfe.fit(data[all_columns], data[target_column])
-                    rfe_df = pd.DataFrame({"Feature": all_columns, "Selected": rfe.support_})
+                    rfe_ranking, rfe_selected = feature_scores.rfe_select(data[all_columns], data[target_column], problem_type, min(10, len(all_columns)), **rfe_params)
+                    rfe_df = pd.DataFrame({"Feature": all_columns, "Selected": [f in rfe_selected for f in all_columns], "Ranking": rfe_ranking.values})
                     return set(rfe_df[rfe_df["Selected"]]["Feature"].tolist())
                 elif method == "LASSO":
-                    from sklearn.linear_model import Lasso, LogisticRegression
-                    if problem_type == "Regression":
-                        lasso = Lasso(alpha=0.01, max_iter=1000)
-                    else:
-                        lasso = LogisticRegression(penalty='l1', solver='liblinear', max_iter=500)
-                    lasso.fit(data[all_columns], data[target_column])
-                    coef = lasso.coef_ if hasattr(lasso, "coef_") else lasso.coef_
-                    if coef.ndim > 1:
-                        coef = coef[0]
+                    coef = feature_scores.get(data[all_columns], data[target_column], "LASSO", problem_type, alpha=0.01, C=1.0).values
                     lasso_df = pd.DataFrame({"Feature": all_columns, "Coefficient": coef})
                     lasso_df = lasso_df[lasso_df["Coefficient"] != 0].sort_values("Coefficient", ascending=False)
                     return set(lasso_df["Feature"].tolist())
                 elif method == "Gradient Boosting Importance":
-                    from sklearn.ensemble import GradientBoostingRegressor, GradientBoostingClassifier
-                    if problem_type == "Regression":
-                        model = GradientBoostingRegressor(random_state=42)
-                    else:
-                        model = GradientBoostingClassifier(random_state=42)
-                    model.fit(data[all_columns], data[target_column])
-                    importances = model.feature_importances_
+                    importances = feature_scores.get(data[all_columns], data[target_column], "Gradient Boosting Importance", problem_type).values
                     gb_df = pd.DataFrame({"Feature": all_columns, "Importance": importances})
                     gb_df = gb_df.sort_values("Importance", ascending=False)
                     top_n = st.slider(f"Top N fitur ({method}):", 1, len(all_columns), min(10, len(all_columns)), key=f"topn_{method}")
                     return set(gb_df.head(top_n)["Feature"].tolist())
                 elif method == "Random Forest Importance":
-                    from sklearn.ensemble import RandomForestRegressor, RandomForestClassifier
-                    
                     # Tambahan: Jumlah pohon untuk ensemble
                     n_estimators = st.number_input(f"Jumlah pohon {method}:", 10, 1000, 100, 10,
                                                 key=f"trees_{method}")
                     
-                    if problem_type == "Regression":
-                        model = RandomForestRegressor(n_estimators=n_estimators, random_state=42)
-                    else:
-                        model = RandomForestClassifier(n_estimators=n_estimators, random_state=42)
-                    
-                    model.fit(data[all_columns], data[target_column])
-                    importances = model.feature_importances_
+                    importances = feature_scores.get(data[all_columns], data[target_column], "Random Forest Importance", problem_type, n_estimators=n_estimators).values
                     rf_df = pd.DataFrame({"Feature": all_columns, "Importance": importances})
                     rf_df = rf_df.sort_values("Importance", ascending=False)
                     
@@ -2371,14 +2673,8 @@ with tab3:
             st.info("Metode ini menggunakan pendekatan 3 tahap: Information Gain → Random Forest Feature Importance → RFE" if st.session_state.language == 'id' else 
                    "This method uses a 3-stage approach: Information Gain → Random Forest Feature Importance → RFE")
             
-            from sklearn.feature_selection import RFE, SelectKBest
-            from sklearn.ensemble import RandomForestClassifier
-            
             # Persiapkan data untuk feature selection
-            X_fs = data[all_columns].copy()
-            for col in X_fs.select_dtypes(include=['object', 'category']).columns:
-                le = LabelEncoder()
-                X_fs[col] = le.fit_transform(X_fs[col].astype(str))
+            X_fs = encoded_features()
             
             # Tampilkan parameter untuk setiap tahap
             st.write("Tahap 1: Information Gain" if st.session_state.language == 'id' else "Stage 1: Information Gain")
@@ -2393,19 +2689,14 @@ with tab3:
             final_features = st.slider("Jumlah fitur akhir" if st.session_state.language == 'id' else "Final number of features", 
                                       1, min(20, len(all_columns)), min(10, len(all_columns)))
             
-            # Tahap 1: Seleksi Fitur dengan Information Gain (SelectKBest + mutual_info_classif)
-            n_features_after_ig = max(1, int(X_fs.shape[1] * ig_percent / 100))
-            
-            if problem_type == "Regression":
-                selector_ig = SelectKBest(score_func=mutual_info_regression, k=n_features_after_ig)
-            else:
-                selector_ig = SelectKBest(score_func=mutual_info_classif, k=n_features_after_ig)
-                
-            X_train_ig = selector_ig.fit_transform(X_fs, data[target_column])
+            # Pipeline bertahap: output tiap tahap (skor MI, forest tahap 2, ranking RFE) di-cache berdasarkan inputnya,
+            # sehingga slider hanya menghitung ulang tahap yang terpengaruh (mis. jumlah fitur akhir hanya memfilter ranking)
+            stages = multi_stage_select(X_fs, data[target_column], problem_type, ig_percent, rf_percent, final_features,
+                                          mi_params=mi_params, step=rfe_params['step'])
             
-            # Dapatkan nama fitur yang terpilih
-            selected_features_ig_mask = selector_ig.get_support()
-            selected_features_ig_names = X_fs.columns[selected_features_ig_mask]
+            # Tahap 1: Seleksi Fitur dengan Information Gain (top-k skor mutual information)
+            selected_features_ig_names = stages['ig_features']
+            n_features_after_ig = len(selected_features_ig_names)
             
             # Tampilkan hasil tahap 1
             st.write(f"Fitur terpilih setelah Information Gain ({n_features_after_ig}):" if st.session_state.language == 'id' else 
@@ -2413,55 +2704,21 @@ with tab3:
             st.write(", ".join(selected_features_ig_names))
             
             # Tahap 2: Seleksi Fitur dengan Feature Importance dari Random Forest
-            n_features_after_rf_fi = max(1, int(len(selected_features_ig_names) * rf_percent / 100))
-            
-            # Latih Random Forest pada data yang sudah difilter IG
-            if problem_type == "Regression":
-                rf_model_for_importance = RandomForestRegressor(n_estimators=100, random_state=42, n_jobs=-1)
-            else:
-                rf_model_for_importance = RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=-1)
-                
-            rf_model_for_importance.fit(X_fs[selected_features_ig_names], data[target_column])
-            
-            # Dapatkan feature importance
-            feature_importances_rf = pd.Series(rf_model_for_importance.feature_importances_, index=selected_features_ig_names)
-            sorted_importances_rf = feature_importances_rf.sort_values(ascending=False)
-            
-            # Pilih fitur-fitur teratas berdasarkan importance
-            top_features_rf_names = sorted_importances_rf.head(n_features_after_rf_fi).index.tolist()
+            top_features_rf_names = stages['rf_features']
+            n_features_after_rf_fi = len(top_features_rf_names)
             
             # Tampilkan hasil tahap 2
             st.write(f"Fitur terpilih setelah Random Forest Feature Importance ({n_features_after_rf_fi}):" if st.session_state.language == 'id' else 
                     f"Selected features after Random Forest Feature Importance ({n_features_after_rf_fi}):")
             st.write(", ".join(top_features_rf_names))
             
-            # Tahap 3: Seleksi Fitur dengan Recursive Feature Elimination (RFE) + Random Forest
-            n_features_final = min(final_features, len(top_features_rf_names))
-            
-            # Pastikan jumlah fitur akhir minimal 2 untuk RFE
-            if len(top_features_rf_names) < 2:
+            # Tahap 3: RFE + Random Forest, dimulai dari forest tahap 2
+            n_features_final = stages['n_final']
+            final_selected_features_names = stages['final_features']
+            if stages['rfe_ranking'] is None:
                 # Jika fitur kurang dari 2, gunakan semua fitur yang tersisa tanpa RFE
-                final_selected_features_names = top_features_rf_names
                 st.warning("Jumlah fitur setelah tahap 2 kurang dari 2. RFE membutuhkan minimal 2 fitur. Menggunakan semua fitur dari tahap 2." if st.session_state.language == 'id' else 
                           "Number of features after stage 2 is less than 2. RFE requires at least 2 features. Using all features from stage 2.")
-            else:
-                # Gunakan Random Forest Classifier/Regressor sebagai estimator untuk RFE
-                if problem_type == "Regression":
-                    estimator_rfe = RandomForestRegressor(n_estimators=100, random_state=42, n_jobs=-1)
-                else:
-                    estimator_rfe = RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=-1)
-                
-                # Pastikan n_features_final minimal 2
-                n_features_final = max(2, n_features_final)
-                
-                selector_rfe = RFE(estimator=estimator_rfe, n_features_to_select=n_features_final, step=1, verbose=0)
-                
-                # Lakukan RFE pada data yang sudah difilter oleh RF Feature Importance
-                selector_rfe.fit(X_fs[top_features_rf_names], data[target_column])
-                
-                # Dapatkan nama fitur akhir yang terpilih
-                selected_features_rfe_mask = selector_rfe.get_support()
-                final_selected_features_names = np.array(top_features_rf_names)[selected_features_rfe_mask].tolist()
             
             # Tampilkan hasil akhir
             st.write(f"Fitur akhir terpilih setelah RFE ({n_features_final}):" if st.session_state.language == 'id' else 
@@ -2529,10 +2786,7 @@ with tab3:
                         key="manual_selection_stage2"
                     )
                 elif feature_selection_method_stage2 == "Mutual Information":
-                    if problem_type == "Regression":
-                        mi = mutual_info_regression(data[all_columns_stage2], data[target_column])
-                    else:
-                        mi = mutual_info_classif(data[all_columns_stage2], data[target_column])
+                    mi = feature_scores.get(data[all_columns_stage2], data[target_column], "Mutual Information", problem_type, **mi_params).values
                     mi_df = pd.DataFrame({"Feature": all_columns_stage2, "Mutual Information": mi})
                     mi_df = mi_df.sort_values("Mutual Information", ascending=False)
                     st.dataframe(mi_df)
@@ -2544,65 +2798,36 @@ with tab3:
                         st.error("Target kolom harus numerik untuk Pearson Correlation.")
                         corr = pd.Series([np.nan]*len(numeric_columns), index=numeric_columns)
                     else:
-                        corr = data[numeric_columns].corrwith(data[target_column]).abs()
+                        corr = feature_scores.get(data[numeric_columns], data[target_column], "Pearson Correlation", problem_type)
                     corr_df = pd.DataFrame({"Feature": numeric_columns, "Correlation": corr})
                     corr_df = corr_df.sort_values("Correlation", ascending=False)
                     st.dataframe(corr_df)
                     top_n = st.slider("Top N features (tahap 2):" if st.session_state.language == 'id' else "Top N features (stage 2):", 1, len(all_columns_stage2), min(5, len(all_columns_stage2)), key="topn_corr_stage2")
                     selected_features_stage2 = corr_df.head(top_n)["Feature"].tolist()
                 elif feature_selection_method_stage2 == "Recursive Feature Elimination (RFE)":
-                    from sklearn.feature_selection import RFE
                     # --- Tambahkan encoding untuk fitur kategorikal sebelum RFE ---
-                    X_rfe = data[all_columns_stage2].copy()
-                    for col in X_rfe.select_dtypes(include=['object', 'category']).columns:
-                        le = LabelEncoder()
-                        X_rfe[col] = le.fit_transform(X_rfe[col].astype(str))
-                    if problem_type == "Regression":
-                        estimator = LinearRegression()
-                    else:
-                        estimator = LogisticRegression(max_iter=500)
+                    X_rfe = encoded_features()[all_columns_stage2]
                     n_features_rfe = st.slider("Jumlah fitur RFE (tahap 2):" if st.session_state.language == 'id' else "Number of RFE features (stage 2):", 1, len(all_columns_stage2), min(5, len(all_columns_stage2)), key="rfe_features_stage2")
-                    rfe = RFE(estimator, n_features_to_select=n_features_rfe)
-                    rfe.fit(X_rfe, data[target_column])
-                    rfe_df = pd.DataFrame({"Feature": all_columns_stage2, "Selected": rfe.support_})
+                    rfe_ranking, rfe_selected = feature_scores.rfe_select(X_rfe, data[target_column], problem_type, n_features_rfe, **rfe_params)
+                    rfe_df = pd.DataFrame({"Feature": all_columns_stage2, "Selected": [f in rfe_selected for f in all_columns_stage2], "Ranking": rfe_ranking.values})
                     st.dataframe(rfe_df)
                     selected_features_stage2 = rfe_df[rfe_df["Selected"]]["Feature"].tolist()
                 elif feature_selection_method_stage2 == "LASSO":
-                    from sklearn.linear_model import Lasso, LogisticRegression
                     alpha_lasso = st.slider("Alpha LASSO (tahap 2):" if st.session_state.language == 'id' else "LASSO Alpha (stage 2):", 0.001, 1.0, 0.01, key="alpha_lasso_stage2")
-                    if problem_type == "Regression":
-                        lasso = Lasso(alpha=alpha_lasso, max_iter=1000)
-                    else:
-                        lasso = LogisticRegression(penalty='l1', solver='liblinear', max_iter=500, C=1/alpha_lasso)
-                    lasso.fit(data[all_columns_stage2], data[target_column])
-                    coef = lasso.coef_ if hasattr(lasso, "coef_") else lasso.coef_
-                    if coef.ndim > 1:
-                        coef = coef[0]
+                    coef = feature_scores.get(data[all_columns_stage2], data[target_column], "LASSO", problem_type, alpha=alpha_lasso, C=1/alpha_lasso).values
                     lasso_df = pd.DataFrame({"Feature": all_columns_stage2, "Coefficient": coef})
                     lasso_df = lasso_df[lasso_df["Coefficient"] != 0].sort_values("Coefficient", ascending=False)
                     st.dataframe(lasso_df)
                     selected_features_stage2 = lasso_df["Feature"].tolist()
                 elif feature_selection_method_stage2 == "Gradient Boosting Importance":
-                    from sklearn.ensemble import GradientBoostingRegressor, GradientBoostingClassifier
-                    if problem_type == "Regression":
-                        model = GradientBoostingRegressor(random_state=42)
-                    else:
-                        model = GradientBoostingClassifier(random_state=42)
-                    model.fit(data[all_columns_stage2], data[target_column])
-                    importances = model.feature_importances_
+                    importances = feature_scores.get(data[all_columns_stage2], data[target_column], "Gradient Boosting Importance", problem_type).values
                     gb_df = pd.DataFrame({"Feature": all_columns_stage2, "Importance": importances})
                     gb_df = gb_df.sort_values("Importance", ascending=False)
                     st.dataframe(gb_df)
                     top_n = st.slider("Top N features (tahap 2):" if st.session_state.language == 'id' else "Top N features (stage 2):", 1, len(all_columns_stage2), min(5, len(all_columns_stage2)), key="topn_gb_stage2")
                     selected_features_stage2 = gb_df.head(top_n)["Feature"].tolist()
                 elif feature_selection_method_stage2 == "Random Forest Importance":
-                    from sklearn.ensemble import RandomForestRegressor, RandomForestClassifier
-                    if problem_type == "Regression":
-                        model = RandomForestRegressor(random_state=42)
-                    else:
-                        model = RandomForestClassifier(random_state=42)
-                    model.fit(data[all_columns_stage2], data[target_column])
-                    importances = model.feature_importances_
+                    importances = feature_scores.get(data[all_columns_stage2], data[target_column], "Random Forest Importance", problem_type, n_estimators=100).values
                     rf_df = pd.DataFrame({"Feature": all_columns_stage2, "Importance": importances})
                     rf_df = rf_df.sort_values("Importance", ascending=False)
                     st.dataframe(rf_df)
@@ -2632,10 +2857,7 @@ with tab3:
 
                     def get_features_by_method_stage2(method, features_list):
                         if method == "Mutual Information":
-                            if problem_type == "Regression":
-                                mi = mutual_info_regression(data[features_list], data[target_column])
-                            else:
-                                mi = mutual_info_classif(data[features_list], data[target_column])
+                            mi = feature_scores.get(data[features_list], data[target_column], "Mutual Information", problem_type, **mi_params).values
                             mi_df = pd.DataFrame({"Feature": features_list, "Mutual Information": mi})
                             mi_df = mi_df.sort_values("Mutual Information", ascending=False)
                             top_n = st.slider(f"Top N fitur ({method}, tahap 2):" if st.session_state.language == 'id' else f"Top N features ({method}, stage 2):", 1, len(features_list), min(5, len(features_list)), key=f"topn_{method}_stage2")
@@ -2645,61 +2867,31 @@ with tab3:
                             if data[target_column].dtype not in [np.float64, np.int64, np.float32, np.int32]:
                                 corr = pd.Series([np.nan]*len(numeric_columns), index=numeric_columns)
                             else:
-                                corr = data[numeric_columns].corrwith(data[target_column]).abs()
+                                corr = feature_scores.get(data[numeric_columns], data[target_column], "Pearson Correlation", problem_type)
                             corr_df = pd.DataFrame({"Feature": numeric_columns, "Correlation": corr})
                             corr_df = corr_df.sort_values("Correlation", ascending=False)
                             top_n = st.slider(f"Top N fitur ({method}, tahap 2):" if st.session_state.language == 'id' else f"Top N features ({method}, stage 2):", 1, len(features_list), min(5, len(features_list)), key=f"topn_{method}_stage2")
                             return set(corr_df.head(top_n)["Feature"].tolist())
                         elif method == "Recursive Feature Elimination (RFE)":
-                            from sklearn.feature_selection import RFE
-                            from sklearn.linear_model import LinearRegression, LogisticRegression
-                            X_rfe = data[features_list].copy()
-                            for col in X_rfe.select_dtypes(include=['object', 'category']).columns:
-                                le = LabelEncoder()
-                                X_rfe[col] = le.fit_transform(X_rfe[col].astype(str))
-                            if problem_type == "Regression":
-                                estimator = LinearRegression()
-                            else:
-                                estimator = LogisticRegression(max_iter=500)
+                            X_rfe = encoded_features()[features_list]
                             n_features_rfe = st.slider(f"Jumlah fitur RFE ({method}, tahap 2):" if st.session_state.language == 'id' else f"Number of RFE features ({method}, stage 2):", 1, len(features_list), min(5, len(features_list)), key=f"rfe_{method}_stage2")
-                            rfe = RFE(estimator, n_features_to_select=n_features_rfe)
-                            rfe.fit(X_rfe, data[target_column])
-                            rfe_df = pd.DataFrame({"Feature": features_list, "Selected": rfe.support_})
+                            rfe_ranking, rfe_selected = feature_scores.rfe_select(X_rfe, data[target_column], problem_type, n_features_rfe, **rfe_params)
+                            rfe_df = pd.DataFrame({"Feature": features_list, "Selected": [f in rfe_selected for f in features_list], "Ranking": rfe_ranking.values})
                             return set(rfe_df[rfe_df["Selected"]]["Feature"].tolist())
                         elif method == "LASSO":
-                            from sklearn.linear_model import Lasso, LogisticRegression
                             alpha_lasso = st.slider(f"Alpha LASSO ({method}, tahap 2):" if st.session_state.language == 'id' else f"LASSO Alpha ({method}, stage 2):", 0.001, 1.0, 0.01, key=f"alpha_{method}_stage2")
-                            if problem_type == "Regression":
-                                lasso = Lasso(alpha=alpha_lasso, max_iter=1000)
-                            else:
-                                lasso = LogisticRegression(penalty='l1', solver='liblinear', max_iter=500, C=1/alpha_lasso)
-                            lasso.fit(data[features_list], data[target_column])
-                            coef = lasso.coef_ if hasattr(lasso, "coef_") else lasso.coef_
-                            if coef.ndim > 1:
-                                coef = coef[0]
+                            coef = feature_scores.get(data[features_list], data[target_column], "LASSO", problem_type, alpha=alpha_lasso, C=1/alpha_lasso).values
                             lasso_df = pd.DataFrame({"Feature": features_list, "Coefficient": coef})
                             lasso_df = lasso_df[lasso_df["Coefficient"] != 0].sort_values("Coefficient", ascending=False)
                             return set(lasso_df["Feature"].tolist())
                         elif method == "Gradient Boosting Importance":
-                            from sklearn.ensemble import GradientBoostingRegressor, GradientBoostingClassifier
-                            if problem_type == "Regression":
-                                model = GradientBoostingRegressor(random_state=42)
-                            else:
-                                model = GradientBoostingClassifier(random_state=42)
-                            model.fit(data[features_list], data[target_column])
-                            importances = model.feature_importances_
+                            importances = feature_scores.get(data[features_list], data[target_column], "Gradient Boosting Importance", problem_type).values
                             gb_df = pd.DataFrame({"Feature": features_list, "Importance": importances})
                             gb_df = gb_df.sort_values("Importance", ascending=False)
                             top_n = st.slider(f"Top N fitur ({method}, tahap 2):" if st.session_state.language == 'id' else f"Top N features ({method}, stage 2):", 1, len(features_list), min(5, len(features_list)), key=f"topn_{method}_stage2")
                             return set(gb_df.head(top_n)["Feature"].tolist())
                         elif method == "Random Forest Importance":
-                            from sklearn.ensemble import RandomForestRegressor, RandomForestClassifier
-                            if problem_type == "Regression":
-                                model = RandomForestRegressor(random_state=42)
-                            else:
-                                model = RandomForestClassifier(random_state=42)
-                            model.fit(data[features_list], data[target_column])
-                            importances = model.feature_importances_
+                            importances = feature_scores.get(data[features_list], data[target_column], "Random Forest Importance", problem_type, n_estimators=100).values
                             rf_df = pd.DataFrame({"Feature": features_list, "Importance": importances})
                             rf_df = rf_df.sort_values("Importance", ascending=False)
                             top_n = st.slider(f"Top N fitur ({method}, tahap 2):" if st.session_state.language == 'id' else f"Top N features ({method}, stage 2):", 1, len(features_list), min(5, len(features_list)), key=f"topn_{method}_stage2")
@@ -2722,14 +2914,8 @@ with tab3:
                     st.info("Metode ini menggunakan pendekatan 3 tahap: Information Gain → Random Forest Feature Importance → RFE (pada hasil tahap 1)" if st.session_state.language == 'id' else 
                            "This method uses a 3-stage approach: Information Gain → Random Forest Feature Importance → RFE (on stage 1 results)")
                     
-                    from sklearn.feature_selection import RFE, SelectKBest
-                    from sklearn.ensemble import RandomForestClassifier
-                    
                     # Persiapkan data untuk feature selection tahap 2
-                    X_fs_stage2 = data[all_columns_stage2].copy()
-                    for col in X_fs_stage2.select_dtypes(include=['object', 'category']).columns:
-                        le = LabelEncoder()
-                        X_fs_stage2[col] = le.fit_transform(X_fs_stage2[col].astype(str))
+                    X_fs_stage2 = encoded_features()[all_columns_stage2]
                     
                     # Tampilkan parameter untuk setiap tahap
                     st.write("Tahap 1: Information Gain (pada hasil tahap 1)" if st.session_state.language == 'id' else "Stage 1: Information Gain (on stage 1 results)")
@@ -2744,19 +2930,14 @@ with tab3:
                     final_features_stage2 = st.slider("Jumlah fitur akhir (tahap 2)" if st.session_state.language == 'id' else "Final number of features (stage 2)", 
                                               1, min(10, len(all_columns_stage2)), min(5, len(all_columns_stage2)), key="final_features_stage2")
                     
-                    # Tahap 1: Seleksi Fitur dengan Information Gain (SelectKBest + mutual_info_classif)
-                    n_features_after_ig_stage2 = max(1, int(X_fs_stage2.shape[1] * ig_percent_stage2 / 100))
-                    
-                    if problem_type == "Regression":
-                        selector_ig_stage2 = SelectKBest(score_func=mutual_info_regression, k=n_features_after_ig_stage2)
-                    else:
-                        selector_ig_stage2 = SelectKBest(score_func=mutual_info_classif, k=n_features_after_ig_stage2)
-                        
-                    X_train_ig_stage2 = selector_ig_stage2.fit_transform(X_fs_stage2, data[target_column])
+                    # Pipeline bertahap: output tiap tahap (skor MI, forest tahap 2, ranking RFE) di-cache berdasarkan inputnya,
+                    # sehingga slider hanya menghitung ulang tahap yang terpengaruh (mis. jumlah fitur akhir hanya memfilter ranking)
+                    stages_stage2 = multi_stage_select(X_fs_stage2, data[target_column], problem_type, ig_percent_stage2, rf_percent_stage2, final_features_stage2,
+                                                  mi_params=mi_params, step=rfe_params['step'])
                     
-                    # Dapatkan nama fitur yang terpilih
-                    selected_features_ig_mask_stage2 = selector_ig_stage2.get_support()
-                    selected_features_ig_names_stage2 = X_fs_stage2.columns[selected_features_ig_mask_stage2]
+                    # Tahap 1: Seleksi Fitur dengan Information Gain (top-k skor mutual information)
+                    selected_features_ig_names_stage2 = stages_stage2['ig_features']
+                    n_features_after_ig_stage2 = len(selected_features_ig_names_stage2)
                     
                     # Tampilkan hasil tahap 1
                     st.write(f"Fitur terpilih setelah Information Gain tahap 2 ({n_features_after_ig_stage2}):" if st.session_state.language == 'id' else 
@@ -2764,55 +2945,21 @@ with tab3:
                     st.write(", ".join(selected_features_ig_names_stage2))
                     
                     # Tahap 2: Seleksi Fitur dengan Feature Importance dari Random Forest
-                    n_features_after_rf_fi_stage2 = max(1, int(len(selected_features_ig_names_stage2) * rf_percent_stage2 / 100))
-                    
-                    # Latih Random Forest pada data yang sudah difilter IG
-                    if problem_type == "Regression":
-                        rf_model_for_importance_stage2 = RandomForestRegressor(n_estimators=100, random_state=42, n_jobs=-1)
-                    else:
-                        rf_model_for_importance_stage2 = RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=-1)
-                        
-                    rf_model_for_importance_stage2.fit(X_fs_stage2[selected_features_ig_names_stage2], data[target_column])
-                    
-                    # Dapatkan feature importance
-                    feature_importances_rf_stage2 = pd.Series(rf_model_for_importance_stage2.feature_importances_, index=selected_features_ig_names_stage2)
-                    sorted_importances_rf_stage2 = feature_importances_rf_stage2.sort_values(ascending=False)
-                    
-                    # Pilih fitur-fitur teratas berdasarkan importance
-                    top_features_rf_names_stage2 = sorted_importances_rf_stage2.head(n_features_after_rf_fi_stage2).index.tolist()
+                    top_features_rf_names_stage2 = stages_stage2['rf_features']
+                    n_features_after_rf_fi_stage2 = len(top_features_rf_names_stage2)
                     
                     # Tampilkan hasil tahap 2
                     st.write(f"Fitur terpilih setelah Random Forest Feature Importance tahap 2 ({n_features_after_rf_fi_stage2}):" if st.session_state.language == 'id' else 
                             f"Selected features after Random Forest Feature Importance stage 2 ({n_features_after_rf_fi_stage2}):")
                     st.write(", ".join(top_features_rf_names_stage2))
                     
-                    # Tahap 3: Seleksi Fitur dengan Recursive Feature Elimination (RFE) + Random Forest
-                    n_features_final_stage2 = min(final_features_stage2, len(top_features_rf_names_stage2))
-                    
-                    # Pastikan jumlah fitur akhir minimal 2 untuk RFE
-                    if len(top_features_rf_names_stage2) < 2:
+                    # Tahap 3: RFE + Random Forest, dimulai dari forest tahap 2
+                    n_features_final_stage2 = stages_stage2['n_final']
+                    final_selected_features_names_stage2 = stages_stage2['final_features']
+                    if stages_stage2['rfe_ranking'] is None:
                         # Jika fitur kurang dari 2, gunakan semua fitur yang tersisa tanpa RFE
-                        final_selected_features_names_stage2 = top_features_rf_names_stage2
                         st.warning("Jumlah fitur setelah tahap 2 kurang dari 2. RFE membutuhkan minimal 2 fitur. Menggunakan semua fitur dari tahap 2." if st.session_state.language == 'id' else 
                                   "Number of features after stage 2 is less than 2. RFE requires at least 2 features. Using all features from stage 2.")
-                    else:
-                        # Gunakan Random Forest Classifier/Regressor sebagai estimator untuk RFE
-                        if problem_type == "Regression":
-                            estimator_rfe_stage2 = RandomForestRegressor(n_estimators=100, random_state=42, n_jobs=-1)
-                        else:
-                            estimator_rfe_stage2 = RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=-1)
-                        
-                        # Pastikan n_features_final minimal 2
-                        n_features_final_stage2 = max(2, n_features_final_stage2)
-                        
-                        selector_rfe_stage2 = RFE(estimator=estimator_rfe_stage2, n_features_to_select=n_features_final_stage2, step=1, verbose=0)
-                        
-                        # Lakukan RFE pada data yang sudah difilter oleh RF Feature Importance
-                        selector_rfe_stage2.fit(X_fs_stage2[top_features_rf_names_stage2], data[target_column])
-                        
-                        # Dapatkan nama fitur akhir yang terpilih
-                        selected_features_rfe_mask_stage2 = selector_rfe_stage2.get_support()
-                        final_selected_features_names_stage2 = np.array(top_features_rf_names_stage2)[selected_features_rfe_mask_stage2].tolist()
                     
                     # Tampilkan hasil akhir
                     st.write(f"Fitur akhir terpilih setelah RFE tahap 2 ({n_features_final_stage2}):" if st.session_state.language == 'id' else 
@@ -2888,6 +3035,130 @@ with tab3:
             st.session_state.y_train = y_train
             st.session_state.y_test = y_test
 
+        # Analisis stabilitas: ulangi satu metode pada resample bootstrap (paralel), hasil tampil per resample
+        with st.expander("Analisis Stabilitas Seleksi Fitur (Bootstrap)" if st.session_state.language == 'id' else "Feature Selection Stability Analysis (Bootstrap)"):
+            st.caption(
+                "Metode dijalankan ulang pada B resample bootstrap. Frekuensi = proporsi resample yang memilih fitur; indeks stabilitas (Nogueira) 1 = subset selalu sama, ~0 = setara subset acak."
+                if st.session_state.language == 'id'
+                else "The method is rerun on B bootstrap resamples. Frequency = share of resamples selecting the feature; stability index (Nogueira) 1 = identical subsets, ~0 = no better than random subsets."
+            )
+            stability_options = list(STABILITY_METHODS)
+            stability_method = st.selectbox(
+                "Metode yang diuji:" if st.session_state.language == 'id' else "Method to assess:",
+                stability_options,
+                index=stability_options.index(feature_selection_method) if feature_selection_method in stability_options else 0
+            )
+            col1, col2 = st.columns(2)
+            with col1:
+                n_bootstrap = st.number_input(
+                    "Jumlah resample bootstrap (B):" if st.session_state.language == 'id' else "Number of bootstrap resamples (B):",
+                    min_value=10, max_value=500, value=50, step=10
+                )
+            with col2:
+                stability_top_n = st.slider(
+                    "Top N fitur per resample:" if st.session_state.language == 'id' else "Top N features per resample:",
+                    1, len(all_columns), min(10, len(all_columns)),
+                    help="LASSO memilih semua koefisien non-nol" if st.session_state.language == 'id' else "LASSO keeps every non-zero coefficient"
+                )
+
+            if st.button("Jalankan analisis stabilitas" if st.session_state.language == 'id' else "Run stability analysis"):
+                X_stability = encoded_features()
+
+                if stability_method == "Mutual Information":
+                    stability_params = mi_params
+                elif stability_method == "Recursive Feature Elimination (RFE)":
+                    stability_params = rfe_params
+                elif stability_method == "LASSO":
+                    stability_params = {'alpha': 0.01, 'C': 1.0}
+                elif stability_method == "Random Forest Importance":
+                    stability_params = {'n_estimators': 100}
+                else:
+                    # Pakai persentase tahap dari pipeline multi-stage jika metode itu yang sedang dipilih
+                    multi_stage_active = feature_selection_method == "Multi-Stage Feature Selection"
+                    stability_params = {
+                        'ig_percent': ig_percent if multi_stage_active else 40,
+                        'rf_percent': rf_percent if multi_stage_active else 50,
+                        'n_final': stability_top_n,
+                        'mi_params': mi_params,
+                        'step': rfe_params['step']
+                    }
+
+                stability_progress = st.progress(0)
+                stability_status = st.empty()
+                stability_chart = st.empty()
+                stability_result = None
+                for stability_result in bootstrap_stability(X_stability, data[target_column], problem_type, stability_method,
+                                                            n_features=stability_top_n, n_bootstrap=int(n_bootstrap),
+                                                            **stability_params):
+                    stability_progress.progress(stability_result['completed'] / stability_result['n_bootstrap'])
+                    index_text = "-" if np.isnan(stability_result['stability']) else f"{stability_result['stability']:.3f}"
+                    stability_status.write(
+                        f"Resample {stability_result['completed']}/{stability_result['n_bootstrap']} selesai — indeks stabilitas: {index_text}"
+                        if st.session_state.language == 'id'
+                        else f"Resample {stability_result['completed']}/{stability_result['n_bootstrap']} done — stability index: {index_text}"
+                    )
+                    stability_chart.bar_chart(stability_result['frequency'].sort_values(ascending=False).head(30))
+
+                if stability_result is not None:
+                    stability_df = pd.DataFrame({
+                        "Feature": stability_result['frequency'].index,
+                        "Selection Frequency": stability_result['frequency'].values
+                    }).sort_values("Selection Frequency", ascending=False)
+                    st.dataframe(stability_df)
+                    col1, col2 = st.columns(2)
+                    col1.metric("Indeks stabilitas" if st.session_state.language == 'id' else "Stability index", f"{stability_result['stability']:.3f}")
+                    col2.metric("Rata-rata ukuran subset" if st.session_state.language == 'id' else "Mean subset size", f"{stability_result['subset_size']:.1f}")
+                    # Ambang interpretasi menurut Nogueira et al. (2018)
+                    if stability_result['stability'] >= 0.75:
+                        st.success("Stabilitas sangat baik" if st.session_state.language == 'id' else "Excellent stability")
+                    elif stability_result['stability'] >= 0.4:
+                        st.info("Stabilitas sedang" if st.session_state.language == 'id' else "Intermediate stability")
+                    else:
+                        st.warning("Stabilitas rendah: subset fitur sangat bergantung pada sampel" if st.session_state.language == 'id' else "Poor stability: the selected subset depends strongly on the sample")
+
+        # Reduksi dimensi (opsional): PCA pada matriks fitur akhir, proyeksi di-cache per matriks
+        st.subheader("Reduksi Dimensi" if st.session_state.language == 'id' else "Dimensionality Reduction")
+        dr_method = st.selectbox(
+            "Metode reduksi dimensi:" if st.session_state.language == 'id' else "Dimensionality reduction method:",
+            ["None", "PCA"]
+        )
+        st.session_state.pca_projection = None
+        if dr_method == "PCA" and st.session_state.X_train is not None and st.session_state.X_train.shape[1] > 1:
+            n_dr_features = st.session_state.X_train.shape[1]
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                dr_components = st.slider(
+                    "Jumlah komponen:" if st.session_state.language == 'id' else "Number of components:",
+                    1, min(100, n_dr_features), min(10, n_dr_features)
+                )
+            with col2:
+                dr_backend = st.selectbox(
+                    "Backend PCA:" if st.session_state.language == 'id' else "PCA backend:",
+                    PCA_BACKENDS,
+                    help="auto: incremental jika melebihi batas memori, randomized untuk matriks besar, selain itu full SVD" if st.session_state.language == 'id' else "auto: incremental above the memory budget, randomized for large matrices, otherwise full SVD"
+                )
+            with col3:
+                dr_memory_budget = st.number_input(
+                    "Batas memori (MB):" if st.session_state.language == 'id' else "Memory budget (MB):",
+                    min_value=64, max_value=16384, value=512, step=64
+                )
+            with st.spinner("Menghitung PCA..." if st.session_state.language == 'id' else "Computing PCA..."):
+                pca_projection = projections.pca(st.session_state.X_train, dr_components, backend=dr_backend,
+                                                 memory_budget_mb=dr_memory_budget)
+                X_train_pca = pd.DataFrame(pca_projection.embedding, index=st.session_state.X_train.index,
+                                           columns=pca_projection.component_names)
+                X_test_pca = pca_projection.transform_frame(st.session_state.X_test)
+            st.session_state.X_train = X_train_pca
+            st.session_state.X_test = X_test_pca
+            st.session_state.pca_projection = pca_projection
+
+            explained = pca_projection.explained_variance_ratio_
+            st.info(
+                f"PCA ({pca_projection.backend}): {n_dr_features} fitur → {pca_projection.n_components} komponen, varians terjelaskan {explained.sum():.2%}"
+                if st.session_state.language == 'id'
+                else f"PCA ({pca_projection.backend}): {n_dr_features} features → {pca_projection.n_components} components, explained variance {explained.sum():.2%}"
+            )
+            st.line_chart(pd.Series(np.cumsum(explained), index=range(1, len(explained) + 1), name="Cumulative explained variance"))
             
     else:
         st.info("Silahkan unggah dataset di tab 'Data Upload' terlebih dahulu." if st.session_state.language == 'id' else "Please upload a dataset in the 'Data Upload' tab first.")
@@ -2941,33 +3212,44 @@ with tab4:
         cv_params = {}
         
         if cv_method == "K-Fold Cross Validation":
-            from sklearn.model_selection import KFold, cross_val_score
+            from sklearn.model_selection import KFold
             
             n_splits = st.slider("Jumlah fold (K):" if st.session_state.language == 'id' else "Number of folds (K):", 2, 10, 5)
             cv_params['cv'] = KFold(n_splits=n_splits, shuffle=True, random_state=random_state)
             cv_params['name'] = f"K-Fold (K={n_splits})"
             
         elif cv_method == "Stratified K-Fold Cross Validation":
-            from sklearn.model_selection import StratifiedKFold, cross_val_score
+            from sklearn.model_selection import StratifiedKFold
             
             n_splits = st.slider("Jumlah fold (K):" if st.session_state.language == 'id' else "Number of folds (K):", 2, 10, 5)
             cv_params['cv'] = StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=random_state)
             cv_params['name'] = f"Stratified K-Fold (K={n_splits})"
             
         elif cv_method == "Leave-One-Out Cross Validation":
-            from sklearn.model_selection import LeaveOneOut, cross_val_score
+            from sklearn.model_selection import LeaveOneOut
             
             cv_params['cv'] = LeaveOneOut()
             cv_params['name'] = "Leave-One-Out"
+            st.caption("Linear/Ridge Regression memakai rumus tertutup (hat matrix, tanpa refit); model lain dilatih ulang n kali secara paralel per chunk." if st.session_state.language == 'id' else "Linear/Ridge Regression use the closed-form hat-matrix shortcut (no refits); other models are refit n times in parallel chunks.")
             
         elif cv_method == "Leave-P-Out Cross Validation":
-            from sklearn.model_selection import LeavePOut, cross_val_score
+            from sklearn.model_selection import LeavePOut
             
             max_p = min(5, len(X) - 1)
             p_value = st.slider("Nilai P:" if st.session_state.language == 'id' else "P value:", 1, max_p, 2)
             cv_params['cv'] = LeavePOut(p=p_value)
             cv_params['name'] = f"Leave-{p_value}-Out"
             
+            # C(n, p) split meledak cepat: di atas batas, test set diambil sebagai sampel acak
+            n_cv_rows = int(round(len(X) * (1 - test_size)))
+            lpo_splits = cv_cost(cv_params['cv'], n_cv_rows)['n_splits']
+            max_lpo_splits = st.number_input("Maksimum split Leave-P-Out:" if st.session_state.language == 'id' else "Maximum Leave-P-Out splits:", 10, 100000, 1000, 100)
+            st.caption(f"C({n_cv_rows}, {p_value}) = {lpo_splits:,} split")
+            if lpo_splits > max_lpo_splits:
+                cv_params['cv'] = SampledLeavePOut(p=p_value, n_splits=max_lpo_splits, random_state=random_state)
+                cv_params['name'] = f"Leave-{p_value}-Out (sampled {max_lpo_splits:,} of {lpo_splits:,})"
+                st.warning(f"Leave-{p_value}-Out penuh membutuhkan {lpo_splits:,} fit; dipakai {max_lpo_splits:,} test set acak." if st.session_state.language == 'id' else f"Full Leave-{p_value}-Out needs {lpo_splits:,} fits; using {max_lpo_splits:,} random test sets instead.")
+            
         else:  # None (Holdout)
             cv_params['cv'] = None
             cv_params['name'] = "Holdout Validation"
@@ -2983,11 +3265,22 @@ with tab4:
                 )
                 cv_params['scoring'] = cv_scoring
             else:  # Regression
+                regression_metrics = ["neg_mean_squared_error", "neg_root_mean_squared_error", "neg_mean_absolute_error", "r2"]
+                if is_leave_out(cv_params['cv']):
+                    # R² tidak terdefinisi pada fold uji satu sampel (NaN per fold): hanya metrik per sampel
+                    regression_metrics.remove("r2")
+                    st.caption("R² tidak tersedia untuk Leave-One-Out/Leave-P-Out; gunakan metrik galat per sampel." if st.session_state.language == 'id' else "R² is not available for Leave-One-Out/Leave-P-Out; use a per-sample error metric.")
                 cv_scoring = st.selectbox(
                     "Metrik evaluasi:" if st.session_state.language == 'id' else "Evaluation metric:",
-                    ["neg_mean_squared_error", "neg_root_mean_squared_error", "neg_mean_absolute_error", "r2"]
+                    regression_metrics
                 )
                 cv_params['scoring'] = cv_scoring
+            
+            # CV yang diperkirakan lebih lama dari batas ini tidak dijalankan (estimasi dari waktu satu fit)
+            cv_params['max_seconds'] = 60 * st.number_input(
+                "Batas estimasi waktu cross-validation (menit):" if st.session_state.language == 'id' else "Cross-validation time limit (estimated, minutes):",
+                1, 1440, 10
+            )
                 
             # Display data distribution for classification with stratified k-fold
             if problem_type == "Classification" and cv_method == "Stratified K-Fold Cross Validation":
@@ -3229,14 +3522,12 @@ with tab4:
             
             if show_3d_viz:
                 try:
-                    from sklearn.decomposition import PCA
-                    from sklearn.manifold import TSNE
                     import plotly.express as px
                     import plotly.graph_objects as go
                     
                     # Prepare data for visualization
-                    X_train_viz = st.session_state.X_train.copy()
-                    X_test_viz = st.session_state.X_test.copy()
+                    X_train_viz = st.session_state.X_train
+                    X_test_viz = st.session_state.X_test
                     y_train_viz = st.session_state.y_train
                     y_test_viz = st.session_state.y_test
                     
@@ -3267,39 +3558,52 @@ with tab4:
                             "Number of iterations:" if st.session_state.language == 'id' else "Number of iterations:",
                             250, 2000, 1000
                         )
+                        tsne_sample_size = st.number_input(
+                            "Ukuran sampel t-SNE (sisa titik diproyeksikan via tetangga terdekat):" if st.session_state.language == 'id' else "t-SNE sample size (remaining points projected via nearest neighbours):",
+                            min_value=min(100, len(X_combined)), max_value=len(X_combined),
+                            value=min(5000, len(X_combined)), step=500
+                        )
                     
                     if st.button("Generate 3D Visualization" if st.session_state.language == 'id' else "Generate 3D Visualization"):
                         with st.spinner("Membuat visualisasi 3D..." if st.session_state.language == 'id' else "Creating 3D visualization..."):
                             
                             if viz_method == "PCA":
-                                # Apply PCA
-                                pca = PCA(n_components=3)
-                                X_3d = pca.fit_transform(X_combined)
+                                # Apply PCA (di-cache per matriks fitur)
+                                pca = projections.pca(X_combined, 3)
+                                X_3d = pca.embedding
                                 
                                 # Calculate explained variance
                                 explained_var = pca.explained_variance_ratio_
                                 
-                                st.write(f"**PCA Explained Variance:**")
+                                st.write(f"**PCA Explained Variance** ({pca.backend}):")
                                 st.write(f"PC1: {explained_var[0]:.2%}")
                                 st.write(f"PC2: {explained_var[1]:.2%}")
                                 st.write(f"PC3: {explained_var[2]:.2%}")
                                 st.write(f"Total: {sum(explained_var):.2%}")
                                 
                             else:  # t-SNE
-                                # Apply t-SNE
-                                tsne = TSNE(
+                                # Apply t-SNE (embedding di-cache per data + parameter; hanya sampel yang dioptimasi)
+                                tsne = projections.tsne(
+                                    X_combined,
                                     n_components=3,
-                                    perplexity=min(perplexity, len(X_combined) - 1),
+                                    perplexity=perplexity,
                                     learning_rate=learning_rate,
                                     n_iter=n_iter,
+                                    sample_size=int(tsne_sample_size),
                                     random_state=42
                                 )
-                                X_3d = tsne.fit_transform(X_combined)
+                                X_3d = tsne.embedding
                                 
                                 st.write(f"**t-SNE Parameters:**")
                                 st.write(f"Perplexity: {perplexity}")
                                 st.write(f"Learning rate: {learning_rate}")
                                 st.write(f"Iterations: {n_iter}")
+                                st.write(f"Backend: {tsne.method}")
+                                st.write(
+                                    f"Sampel t-SNE: {len(tsne.sample_index)} dari {len(X_combined)} titik (sisanya diproyeksikan)"
+                                    if st.session_state.language == 'id'
+                                    else f"t-SNE sample: {len(tsne.sample_index)} of {len(X_combined)} points (the rest projected)"
+                                )
                             
                             # Create DataFrame for visualization
                             viz_df = pd.DataFrame({
@@ -3490,13 +3794,57 @@ with tab4:
             
             st.subheader(f"Melatih Model {problem_type}" if st.session_state.language == 'id' else f"Training a {problem_type} Model")
             
-            # Tambahkan opsi untuk menggunakan GridSearchCV
-            use_grid_search = st.checkbox("Gunakan GridSearchCV untuk hyperparameter tuning" if st.session_state.language == 'id' else "Use GridSearchCV for hyperparameter tuning", value=False)
+            # Opsi pencarian hyperparameter (Grid/Randomized Search, Successive Halving, Hyperband)
+            use_grid_search = st.checkbox("Gunakan pencarian hyperparameter" if st.session_state.language == 'id' else "Use hyperparameter search", value=False)
+            # Tuning memakai skema CV yang sama dengan evaluasi, sehingga skor fold pemenang dipakai ulang
+            search_cv = cv_params['cv'] if cv_params['cv'] is not None else 5
+            # Tuning regresi memakai R², kecuali Leave-One-Out/Leave-P-Out (R² tidak terdefinisi per fold)
+            regression_search_scoring = 'neg_mean_squared_error' if is_leave_out(search_cv) else 'r2'
+            search_options = {'strategy': "Grid Search", 'report_scoring': cv_params.get('scoring')}
+            if use_grid_search:
+                search_options['strategy'] = st.selectbox(
+                    "Strategi pencarian:" if st.session_state.language == 'id' else "Search strategy:",
+                    SEARCH_STRATEGIES,
+                    help="Randomized Search mencoba sejumlah kombinasi acak; Successive Halving dan Hyperband menilai banyak kandidat dengan sebagian data (atau sedikit pohon untuk model ensemble) lalu hanya melanjutkan kandidat terbaik" if st.session_state.language == 'id' else "Randomized Search tries a random subset of combinations; Successive Halving and Hyperband score many candidates on a fraction of the rows (or few trees for ensemble models) and only promote the best ones"
+                )
+                search_options['warm_start'] = st.checkbox(
+                    "Warm start n_estimators (Random Forest / Gradient Boosting)" if st.session_state.language == 'id' else "Warm-start n_estimators (Random Forest / Gradient Boosting)",
+                    value=True,
+                    help="Grid/Randomized Search menumbuhkan satu model per kombinasi parameter dan fold melewati semua nilai n_estimators (mis. 50 → 100 → 200) dan menilainya di setiap titik, bukan melatih tiap nilai dari awal" if st.session_state.language == 'id' else "Grid/Randomized Search grows one model per parameter combination and fold through all n_estimators values (e.g. 50 → 100 → 200) and scores it at each checkpoint instead of training every value from scratch"
+                )
+                if search_options['strategy'] != "Grid Search":
+                    budget_col1, budget_col2, budget_col3 = st.columns(3)
+                    with budget_col1:
+                        time_budget = st.number_input("Batas waktu (menit, 0 = tanpa batas):" if st.session_state.language == 'id' else "Time budget (minutes, 0 = unlimited):", 0.0, 600.0, 5.0, 0.5)
+                    with budget_col2:
+                        max_fits = st.number_input("Maksimum fit (0 = tanpa batas):" if st.session_state.language == 'id' else "Maximum fits (0 = unlimited):", 0, 100000, 200, 10)
+                    with budget_col3:
+                        n_candidates = st.number_input("Jumlah kandidat:" if st.session_state.language == 'id' else "Number of candidates:", 2, 500, 20)
+                    search_options.update({
+                        'time_budget': time_budget * 60 if time_budget > 0 else None,
+                        'max_fits': max_fits if max_fits > 0 else None,
+                        'n_candidates': n_candidates
+                    })
+            
+            # Early stopping untuk Gradient Boosting / MLP: sebagian data latih dipakai sebagai validasi
+            use_early_stopping = st.checkbox(
+                "Early stopping (Gradient Boosting / MLP)",
+                value=False,
+                help="Pelatihan berhenti bila skor pada data validasi tidak membaik selama sejumlah iterasi (MLP: hanya solver adam/sgd)" if st.session_state.language == 'id' else "Training stops once the score on a held-out validation split has not improved for a number of iterations (MLP: adam/sgd solvers only)"
+            )
+            early_stopping_options = {}
+            if use_early_stopping:
+                es_col1, es_col2 = st.columns(2)
+                with es_col1:
+                    validation_fraction = st.slider("Fraksi data validasi:" if st.session_state.language == 'id' else "Validation fraction:", 0.05, 0.5, 0.1, 0.05)
+                with es_col2:
+                    patience = st.number_input("Patience (iterasi tanpa perbaikan):" if st.session_state.language == 'id' else "Patience (iterations without improvement):", 1, 100, 10)
+                early_stopping_options = {'validation_fraction': validation_fraction, 'patience': patience}
             
             # Model selection
             if problem_type == "Classification":
                 # Define available classification models
-                classification_models = ["Random Forest", "Logistic Regression", "SVM", "KNN", "Decision Tree", "Naive Bayes", "Gradient Boosting", "MLP (Neural Network)"]
+                classification_models = ["Random Forest", "Logistic Regression", "SVM", "KNN", "Decision Tree", "Naive Bayes", "Gradient Boosting", "Histogram Gradient Boosting", "MLP (Neural Network)"]
                                    
                 model_type = st.selectbox("Select a classification model:" if st.session_state.language == 'id' else "Pilih model klasifikasi:", classification_models)
                 st.session_state.model_type = model_type
@@ -3514,8 +3862,7 @@ with tab4:
                             'min_samples_split': [2, 5, 10],
                             'min_samples_leaf': [1, 2, 4]
                         }
-                        cv_value = cv_params['cv'] if cv_params['cv'] is not None else 5
-                        model = GridSearchCV(base_model, param_grid, cv=cv_value, scoring='accuracy', n_jobs=-1)
+                        model = make_search(base_model, param_grid, cv=search_cv, scoring='accuracy', **search_options)
                     else:
                         model = RandomForestClassifier(
                             n_estimators=n_estimators,
@@ -3535,8 +3882,7 @@ with tab4:
                             'solver': ['liblinear', 'lbfgs', 'saga'],
                             'max_iter': [100, 500, 1000]
                         }
-                        cv_value = cv_params['cv'] if cv_params['cv'] is not None else 5
-                        model = GridSearchCV(base_model, param_grid, cv=cv_value, scoring='accuracy', n_jobs=-1)
+                        model = make_search(base_model, param_grid, cv=search_cv, scoring='accuracy', **search_options)
                     else:
                         model = LogisticRegression(
                             C=C,
@@ -3548,8 +3894,31 @@ with tab4:
                     C = st.slider("Regularization parameter (C):" if st.session_state.language == 'id' else "Parameter regulerisasi (C):", 0.1, 10.0, 1.0)
                     kernel = st.selectbox("Kernel:" if st.session_state.language == 'id' else "Kernel:", ["linear", "poly", "rbf", "sigmoid"])
                     gamma = st.selectbox("Gamma (kernel coefficient):" if st.session_state.language == 'id' else "Gamma (koefisien kernel):", ["scale", "auto"])
+
+                    # Mode SVM: kernel exact untuk data kecil, aproksimasi kernel (Nystroem / random features) + solver linear untuk data besar
+                    svm_mode = st.selectbox(
+                        "Mode SVM:" if st.session_state.language == 'id' else "SVM mode:",
+                        SVM_MODES,
+                        help=f"Auto: kernel exact sampai {EXACT_SVM_MAX_ROWS:,} baris latih, di atasnya Nystroem. Kernel linear pada mode aproksimasi langsung memakai solver linear; random features tersedia untuk kernel rbf dan poly (sigmoid memakai Nystroem)" if st.session_state.language == 'id' else f"Auto: exact kernel up to {EXACT_SVM_MAX_ROWS:,} training rows, Nystroem above. The linear kernel in approximate modes goes straight to a linear solver; random features cover the rbf and poly kernels (sigmoid uses Nystroem)"
+                    )
+                    resolved_svm_mode = resolve_svm_mode(svm_mode, len(st.session_state.X_train))
+                    svm_components = 500
+                    if resolved_svm_mode != "Exact":
+                        svm_components = st.number_input("Jumlah komponen aproksimasi kernel:" if st.session_state.language == 'id' else "Kernel approximation components:", 50, 5000, 500, 50)
+                    st.caption(f"Mode yang dipakai: {resolved_svm_mode} ({len(st.session_state.X_train):,} baris latih)" if st.session_state.language == 'id' else f"Mode used: {resolved_svm_mode} ({len(st.session_state.X_train):,} training rows)")
+                    svm_calibration = st.selectbox(
+                        "Kalibrasi probabilitas:" if st.session_state.language == 'id' else "Probability calibration:",
+                        CALIBRATION_METHODS,
+                        format_func=lambda method: {
+                            'internal': "Platt 5-fold internal (SVC)" if st.session_state.language == 'id' else "Internal 5-fold Platt (SVC)",
+                            'sigmoid': "Sigmoid post-hoc (data kalibrasi terpisah)" if st.session_state.language == 'id' else "Post-hoc sigmoid (held-out calibration split)",
+                            'isotonic': "Isotonic post-hoc (data kalibrasi terpisah)" if st.session_state.language == 'id' else "Post-hoc isotonic (held-out calibration split)",
+                            'none': "Tanpa kalibrasi" if st.session_state.language == 'id' else "No calibration"
+                        }[method],
+                        help="Kalibrasi post-hoc melatih SVM sekali dan mengkalibrasi probabilitas pada 20% data latih, bukan 5 fit tambahan di dalam SVC" if st.session_state.language == 'id' else "Post-hoc calibration fits the SVM once and calibrates probabilities on 20% of the training rows instead of 5 extra fits inside SVC"
+                    )
                     
-                    base_model = SVC(probability=True, random_state=42)
+                    base_model = make_svm(problem_type, len(st.session_state.X_train), svm_mode, svm_calibration, svm_components)
                     
                     if use_grid_search:
                         param_grid = {
@@ -3557,15 +3926,13 @@ with tab4:
                             'kernel': [kernel] if kernel != "rbf" else ['linear', 'rbf'],
                             'gamma': [gamma] if gamma != "scale" else ['scale', 'auto'],
                         }
-                        cv_value = cv_params['cv'] if cv_params['cv'] is not None else 5
-                        model = GridSearchCV(base_model, param_grid, cv=cv_value, scoring='accuracy', n_jobs=-1)
+                        model = make_search(base_model, param_grid, cv=search_cv, scoring='accuracy', **search_options)
                     else:
-                        model = SVC(
+                        model = make_svm(
+                            problem_type, len(st.session_state.X_train), svm_mode, svm_calibration, svm_components,
                             C=C,
                             kernel=kernel,
-                            gamma=gamma,
-                            probability=True,
-                            random_state=42
+                            gamma=gamma
                         )
                         
                 elif model_type == "KNN":
@@ -3582,7 +3949,7 @@ with tab4:
                             'algorithm': ['auto', 'ball_tree', 'kd_tree', 'brute'],
                             'p': [1, 2]  # Manhattan or Euclidean distance
                         }
-                        model = GridSearchCV(base_model, param_grid, cv=5, scoring='accuracy', n_jobs=-1)
+                        model = make_search(base_model, param_grid, cv=search_cv, scoring='accuracy', **search_options)
                     else:
                         model = KNeighborsClassifier(
                             n_neighbors=n_neighbors,
@@ -3604,7 +3971,7 @@ with tab4:
                             'min_samples_leaf': [1, 2, 4],
                             'criterion': ['gini', 'entropy']
                         }
-                        model = GridSearchCV(base_model, param_grid, cv=5, scoring='accuracy', n_jobs=-1)
+                        model = make_search(base_model, param_grid, cv=search_cv, scoring='accuracy', **search_options)
                     else:
                         model = DecisionTreeClassifier(
                             max_depth=max_depth,
@@ -3622,7 +3989,7 @@ with tab4:
                         param_grid = {
                             'var_smoothing': [1e-10, 1e-9, 1e-8]
                         }
-                        model = GridSearchCV(base_model, param_grid, cv=5, scoring='accuracy', n_jobs=-1)
+                        model = make_search(base_model, param_grid, cv=search_cv, scoring='accuracy', **search_options)
                     else:
                         model = GaussianNB(
                             var_smoothing=var_smoothing
@@ -3633,7 +4000,8 @@ with tab4:
                     learning_rate = st.slider("Learning rate:" if st.session_state.language == 'id' else "Learning rate:", 0.01, 0.3, 0.1)
                     max_depth = st.slider("Kedalaman maksimum:" if st.session_state.language == 'id' else "Kedalaman maksimum:", 1, 10, 3)
                     
-                    base_model = GradientBoostingClassifier(random_state=42)
+                    gb_early_stopping = early_stopping_params(GradientBoostingClassifier(), **early_stopping_options) if use_early_stopping else {}
+                    base_model = GradientBoostingClassifier(random_state=42, **gb_early_stopping)
                     
                     if use_grid_search:
                         param_grid = {
@@ -3642,13 +4010,49 @@ with tab4:
                             'max_depth': [3, 6, 9] if max_depth == 3 else [max(1, max_depth-3), max_depth, min(10, max_depth+3)],
                             'subsample': [0.8, 0.9, 1.0]
                         }
-                        model = GridSearchCV(base_model, param_grid, cv=5, scoring='accuracy', n_jobs=-1)
+                        model = make_search(base_model, param_grid, cv=search_cv, scoring='accuracy', **search_options)
                     else:
                         model = GradientBoostingClassifier(
                             n_estimators=n_estimators,
                             learning_rate=learning_rate,
                             max_depth=max_depth,
-                            random_state=42
+                            random_state=42,
+                            **gb_early_stopping
+                        )
+                        
+                elif model_type == "Histogram Gradient Boosting":
+                    # Fitur dibagi ke maksimal 255 bin: jauh lebih cepat dari Gradient Boosting biasa pada data besar,
+                    # multi-thread (OpenMP), dan nilai hilang (NaN) ditangani langsung tanpa imputasi
+                    max_iter = st.slider("Jumlah boosting iterations:" if st.session_state.language == 'id' else "Number of boosting iterations:", 10, 1000, 100)
+                    learning_rate = st.slider("Learning rate:" if st.session_state.language == 'id' else "Learning rate:", 0.01, 0.3, 0.1)
+                    max_leaf_nodes = st.slider("Maksimum daun per pohon:" if st.session_state.language == 'id' else "Maximum leaves per tree:", 2, 256, 31)
+                    l2_regularization = st.slider("Regularisasi L2:" if st.session_state.language == 'id' else "L2 regularization:", 0.0, 10.0, 0.0)
+                    
+                    # Kolom hasil label encoding dipakai sebagai fitur kategorikal native
+                    categorical_mask = native_categorical_mask(st.session_state.X_train, st.session_state.categorical_columns)
+                    if categorical_mask is not None:
+                        st.caption(f"{int(categorical_mask.sum())} fitur kategorikal ditangani secara native" if st.session_state.language == 'id' else f"{int(categorical_mask.sum())} categorical features handled natively")
+                    
+                    hgb_early_stopping = early_stopping_params(HistGradientBoostingClassifier(), **early_stopping_options) if use_early_stopping else {}
+                    base_model = HistGradientBoostingClassifier(categorical_features=categorical_mask, random_state=42, **hgb_early_stopping)
+                    
+                    if use_grid_search:
+                        param_grid = {
+                            'max_iter': [50, 100, 200] if max_iter == 100 else [max(10, max_iter//2), max_iter, min(1000, max_iter*2)],
+                            'learning_rate': [0.05, 0.1, 0.2] if learning_rate == 0.1 else [max(0.01, learning_rate/2), learning_rate, min(0.3, learning_rate*2)],
+                            'max_leaf_nodes': [15, 31, 63] if max_leaf_nodes == 31 else [max(2, max_leaf_nodes//2), max_leaf_nodes, min(256, max_leaf_nodes*2)],
+                            'l2_regularization': [0.0, 0.1, 1.0]
+                        }
+                        model = make_search(base_model, param_grid, cv=search_cv, scoring='accuracy', **search_options)
+                    else:
+                        model = HistGradientBoostingClassifier(
+                            max_iter=max_iter,
+                            learning_rate=learning_rate,
+                            max_leaf_nodes=max_leaf_nodes,
+                            l2_regularization=l2_regularization,
+                            categorical_features=categorical_mask,
+                            random_state=42,
+                            **hgb_early_stopping
                         )
                         
                 elif model_type == "MLP (Neural Network)":
@@ -3764,7 +4168,9 @@ with tab4:
                             'power_t': power_t if learning_rate == "invscaling" else 0.5
                         })
                     
-                    base_model = MLPClassifier()
+                    mlp_early_stopping = early_stopping_params(MLPClassifier(), **early_stopping_options) if use_early_stopping else {}
+                    mlp_params.update(mlp_early_stopping)
+                    base_model = MLPClassifier(**mlp_early_stopping)
                     
                     if use_grid_search:
                         param_grid = {
@@ -3779,7 +4185,7 @@ with tab4:
                             'learning_rate_init': [0.001, 0.01, 0.1],
                             'max_iter': [200, 500, 1000]
                         }
-                        model = GridSearchCV(base_model, param_grid, cv=5, scoring='accuracy', n_jobs=-1)
+                        model = make_search(base_model, param_grid, cv=search_cv, scoring='accuracy', **search_options)
                     else:
                         model = MLPClassifier(**mlp_params)
                                            
@@ -3791,12 +4197,12 @@ with tab4:
                             'alpha': [0.0001, 0.001, 0.01],
                             'max_iter': [200, 500, 1000]
                         }
-                        model = GridSearchCV(base_model, param_grid, cv=5, scoring='accuracy', n_jobs=-1)
+                        model = make_search(base_model, param_grid, cv=search_cv, scoring='accuracy', **search_options)
 
             else:  # Regression
                 # Regular regression models (non-time series)
                 model_type = st.selectbox("Pilih model regresi:" if st.session_state.language == 'id' else "Select a regression model:", 
-                                         ["Random Forest", "Linear Regression", "Gradient Boosting", "SVR", "Bagging Regressor", "Voting Regressor", "Stacking Regressor", "KNN Regressor", "MLP Regressor"])
+                                         ["Random Forest", "Linear Regression", "Gradient Boosting", "Histogram Gradient Boosting", "SVR", "Bagging Regressor", "Voting Regressor", "Stacking Regressor", "KNN Regressor", "MLP Regressor"])
                 
                 if model_type == "Random Forest":
                     n_estimators = st.slider("Jumlah pepohonan:" if st.session_state.language == 'id' else "Number of Trees:", 10, 500, 100)
@@ -3811,8 +4217,7 @@ with tab4:
                             'min_samples_split': [2, 5, 10],
                             'min_samples_leaf': [1, 2, 4]
                         }
-                        cv_value = cv_params['cv'] if cv_params['cv'] is not None else 5
-                        model = GridSearchCV(base_model, param_grid, cv=cv_value, scoring='r2', n_jobs=-1)
+                        model = make_search(base_model, param_grid, cv=search_cv, scoring=regression_search_scoring, **search_options)
                     else:
                         model = RandomForestRegressor(
                             n_estimators=n_estimators,
@@ -3825,7 +4230,8 @@ with tab4:
                     learning_rate = st.slider("Learning rate:" if st.session_state.language == 'id' else "Learning rate:", 0.01, 0.3, 0.1)
                     max_depth = st.slider("Kedalaman maksimum:" if st.session_state.language == 'id' else "Kedalaman maksimum:", 1, 10, 3)
                     
-                    base_model = GradientBoostingRegressor(random_state=42)
+                    gb_early_stopping = early_stopping_params(GradientBoostingRegressor(), **early_stopping_options) if use_early_stopping else {}
+                    base_model = GradientBoostingRegressor(random_state=42, **gb_early_stopping)
                     
                     if use_grid_search:
                         param_grid = {
@@ -3834,13 +4240,49 @@ with tab4:
                             'max_depth': [2, 3, 5] if max_depth == 3 else [max(1, max_depth-1), max_depth, min(10, max_depth+2)],
                             'subsample': [0.8, 0.9, 1.0]
                         }
-                        model = GridSearchCV(base_model, param_grid, cv=5, scoring='r2', n_jobs=-1)
+                        model = make_search(base_model, param_grid, cv=search_cv, scoring=regression_search_scoring, **search_options)
                     else:
                         model = GradientBoostingRegressor(
                             n_estimators=n_estimators,
                             learning_rate=learning_rate,
                             max_depth=max_depth,
-                            random_state=42
+                            random_state=42,
+                            **gb_early_stopping
+                        )
+                        
+                elif model_type == "Histogram Gradient Boosting":
+                    # Fitur dibagi ke maksimal 255 bin: jauh lebih cepat dari Gradient Boosting biasa pada data besar,
+                    # multi-thread (OpenMP), dan nilai hilang (NaN) ditangani langsung tanpa imputasi
+                    max_iter = st.slider("Jumlah boosting iterations:" if st.session_state.language == 'id' else "Number of boosting iterations:", 10, 1000, 100)
+                    learning_rate = st.slider("Learning rate:" if st.session_state.language == 'id' else "Learning rate:", 0.01, 0.3, 0.1)
+                    max_leaf_nodes = st.slider("Maksimum daun per pohon:" if st.session_state.language == 'id' else "Maximum leaves per tree:", 2, 256, 31)
+                    l2_regularization = st.slider("Regularisasi L2:" if st.session_state.language == 'id' else "L2 regularization:", 0.0, 10.0, 0.0)
+                    
+                    # Kolom hasil label encoding dipakai sebagai fitur kategorikal native
+                    categorical_mask = native_categorical_mask(st.session_state.X_train, st.session_state.categorical_columns)
+                    if categorical_mask is not None:
+                        st.caption(f"{int(categorical_mask.sum())} fitur kategorikal ditangani secara native" if st.session_state.language == 'id' else f"{int(categorical_mask.sum())} categorical features handled natively")
+                    
+                    hgb_early_stopping = early_stopping_params(HistGradientBoostingRegressor(), **early_stopping_options) if use_early_stopping else {}
+                    base_model = HistGradientBoostingRegressor(categorical_features=categorical_mask, random_state=42, **hgb_early_stopping)
+                    
+                    if use_grid_search:
+                        param_grid = {
+                            'max_iter': [50, 100, 200] if max_iter == 100 else [max(10, max_iter//2), max_iter, min(1000, max_iter*2)],
+                            'learning_rate': [0.05, 0.1, 0.2] if learning_rate == 0.1 else [max(0.01, learning_rate/2), learning_rate, min(0.3, learning_rate*2)],
+                            'max_leaf_nodes': [15, 31, 63] if max_leaf_nodes == 31 else [max(2, max_leaf_nodes//2), max_leaf_nodes, min(256, max_leaf_nodes*2)],
+                            'l2_regularization': [0.0, 0.1, 1.0]
+                        }
+                        model = make_search(base_model, param_grid, cv=search_cv, scoring=regression_search_scoring, **search_options)
+                    else:
+                        model = HistGradientBoostingRegressor(
+                            max_iter=max_iter,
+                            learning_rate=learning_rate,
+                            max_leaf_nodes=max_leaf_nodes,
+                            l2_regularization=l2_regularization,
+                            categorical_features=categorical_mask,
+                            random_state=42,
+                            **hgb_early_stopping
                         )
                         
                 elif model_type == "Linear Regression":
@@ -3853,7 +4295,7 @@ with tab4:
                             'fit_intercept': [True, False]
                             # 'normalize' parameter removed to avoid error
                         }
-                        model = GridSearchCV(base_model, param_grid, cv=5, scoring='r2', n_jobs=-1)
+                        model = make_search(base_model, param_grid, cv=search_cv, scoring=regression_search_scoring, **search_options)
                     else:
                         model = LinearRegression(
                             fit_intercept=fit_intercept
@@ -3865,7 +4307,19 @@ with tab4:
                     gamma = st.selectbox("Gamma (kernel coefficient):" if st.session_state.language == 'id' else "Gamma (koefisien kernel):", ["scale", "auto"])
                     epsilon = st.slider("Epsilon:" if st.session_state.language == 'id' else "Epsilon:", 0.01, 0.5, 0.1)
 
-                    base_model = SVR()
+                    # Mode SVM: kernel exact untuk data kecil, aproksimasi kernel (Nystroem / random features) + solver linear untuk data besar
+                    svm_mode = st.selectbox(
+                        "Mode SVM:" if st.session_state.language == 'id' else "SVM mode:",
+                        SVM_MODES,
+                        help=f"Auto: kernel exact sampai {EXACT_SVM_MAX_ROWS:,} baris latih, di atasnya Nystroem. Kernel linear pada mode aproksimasi langsung memakai solver linear; random features tersedia untuk kernel rbf dan poly (sigmoid memakai Nystroem)" if st.session_state.language == 'id' else f"Auto: exact kernel up to {EXACT_SVM_MAX_ROWS:,} training rows, Nystroem above. The linear kernel in approximate modes goes straight to a linear solver; random features cover the rbf and poly kernels (sigmoid uses Nystroem)"
+                    )
+                    resolved_svm_mode = resolve_svm_mode(svm_mode, len(st.session_state.X_train))
+                    svm_components = 500
+                    if resolved_svm_mode != "Exact":
+                        svm_components = st.number_input("Jumlah komponen aproksimasi kernel:" if st.session_state.language == 'id' else "Kernel approximation components:", 50, 5000, 500, 50)
+                    st.caption(f"Mode yang dipakai: {resolved_svm_mode} ({len(st.session_state.X_train):,} baris latih)" if st.session_state.language == 'id' else f"Mode used: {resolved_svm_mode} ({len(st.session_state.X_train):,} training rows)")
+
+                    base_model = make_svm(problem_type, len(st.session_state.X_train), svm_mode, n_components=svm_components)
 
                     if use_grid_search:
                         param_grid = {
@@ -3874,9 +4328,10 @@ with tab4:
                             'gamma': [gamma] if gamma != "scale" else ['scale', 'auto'],
                             'epsilon': [epsilon]
                         }
-                        model = GridSearchCV(base_model, param_grid, cv=5, scoring='r2', n_jobs=-1)
+                        model = make_search(base_model, param_grid, cv=search_cv, scoring=regression_search_scoring, **search_options)
                     else:
-                        model = SVR(
+                        model = make_svm(
+                            problem_type, len(st.session_state.X_train), svm_mode, n_components=svm_components,
                             C=C,
                             kernel=kernel,
                             gamma=gamma,
@@ -3938,7 +4393,7 @@ with tab4:
                             'algorithm': ['auto', 'ball_tree', 'kd_tree', 'brute'],
                             'p': [1, 2]  # Manhattan or Euclidean distance
                         }
-                        model = GridSearchCV(base_model, param_grid, cv=5, scoring='r2', n_jobs=-1)
+                        model = make_search(base_model, param_grid, cv=search_cv, scoring=regression_search_scoring, **search_options)
                     else:
                         model = KNeighborsRegressor(
                             n_neighbors=n_neighbors,
@@ -4059,7 +4514,9 @@ with tab4:
                             'power_t': power_t if learning_rate == "invscaling" else 0.5
                         })
                     
-                    base_model = MLPRegressor()
+                    mlp_early_stopping = early_stopping_params(MLPRegressor(), **early_stopping_options) if use_early_stopping else {}
+                    mlp_params.update(mlp_early_stopping)
+                    base_model = MLPRegressor(**mlp_early_stopping)
                     
                     if use_grid_search:
                         param_grid = {
@@ -4074,7 +4531,7 @@ with tab4:
                             'learning_rate_init': [0.001, 0.01, 0.1],
                             'max_iter': [200, 500, 1000]
                         }
-                        model = GridSearchCV(base_model, param_grid, cv=5, scoring='r2', n_jobs=-1)
+                        model = make_search(base_model, param_grid, cv=search_cv, scoring=regression_search_scoring, **search_options)
                     else:
                         model = MLPRegressor(**mlp_params)
                 else:
@@ -4084,13 +4541,84 @@ with tab4:
             model_custom_name = st.text_input("Nama model (bebas, gunakan huruf/angka/underscore):" if st.session_state.language == 'id' else "Nama model (bebas, gunakan huruf/angka/underscore):", value=f"")
             st.session_state.model_type = model_type
 
+            compare_float64 = False
+            if st.session_state.float32_mode:
+                compare_float64 = st.checkbox(
+                    "Bandingkan metrik dengan float64 (melatih ulang satu kali)" if st.session_state.language == 'id' else "Compare metrics against float64 (one extra fit)",
+                    value=False
+                )
+
+            # Pelatihan di latar belakang: job berjalan di process pool, status tersimpan di disk
+            # sehingga tetap berjalan saat rerun/reload dan bisa dibatalkan
+            run_in_background = st.checkbox(
+                "Latih di latar belakang (job)" if st.session_state.language == 'id' else "Train in the background (job)",
+                value=False,
+                help="Pelatihan, tuning dan cross-validation dijalankan sebagai job yang melaporkan progres, bisa dibatalkan, dan tetap berjalan saat halaman dimuat ulang" if st.session_state.language == 'id' else "Training, tuning and cross-validation run as a job that reports progress, can be cancelled, and keeps running when the page reloads"
+            )
+            job_result = None
+            if run_in_background:
+                def training_data_key():
+                    """Sidik data latih (isi, kolom dan target) untuk mencocokkan hasil job dengan sesi ini"""
+                    return f"{matrix_fingerprint(st.session_state.X_train)}-{matrix_fingerprint(st.session_state.y_train)}"
+                
+                if model is not None and st.button("Kirim Job Pelatihan" if st.session_state.language == 'id' else "Submit Training Job"):
+                    st.session_state.training_job_id = jobs.submit(
+                        "training", model_custom_name or model_type, train_model_job,
+                        model, st.session_state.X_train, st.session_state.y_train,
+                        cv=cv_params['cv'], scoring=cv_params.get('scoring'),
+                        owner=st.session_state.job_owner,
+                        meta={
+                            'cache_key': training_key(model, st.session_state.X_train, st.session_state.y_train,
+                                                      cv_params['cv'], cv_params.get('scoring')),
+                            'data_key': training_data_key()
+                        }
+                    )
+                
+                def show_search_partial(partial):
+                    st.write(f"Parameter terbaik sementara: {partial['best_params']} (skor {partial['best_score']:.4f})" if st.session_state.language == 'id' else f"Best parameters so far: {partial['best_params']} (score {partial['best_score']:.4f})")
+                
+                job_id, job = job_panel("training", 'training_job_id', show_search_partial)
+                if job is not None and job['status'] == "completed":
+                    if job.get('data_key') != training_data_key():
+                        # Model job dilatih pada data/split/fitur lain: tidak dievaluasi pada X_test sesi ini
+                        st.warning("Job ini dilatih pada data latih yang berbeda dari data saat ini; hasilnya tidak dimuat." if st.session_state.language == 'id' else "This job was trained on different training data than the current data; its results are not loaded.")
+                    # Hasil job ditampilkan sekali (sama seperti setelah menekan Train Model)
+                    elif st.session_state.get('loaded_training_job') != job_id or st.button("Tampilkan Hasil Lagi" if st.session_state.language == 'id' else "Show Results Again"):
+                        job_result = jobs.result(job_id)
+                        job_result['cache_key'] = job.get('cache_key')
+                        st.session_state.loaded_training_job = job_id
+                        model = job_result['model']
+                        model_type = job['name']
+                        use_grid_search = hasattr(model, "best_params_")
+            
             # Train model button
-            if model is not None and st.button("Train Model"):
+            if job_result is not None or (not run_in_background and model is not None and st.button("Train Model")):
                 with st.spinner(f"Melatih model {model_type}..." if st.session_state.language == 'id' else f"Training {model_type} model..."):
+                    cv_result = None
+                    cache_key, cached_entry = None, None
+                    registered = None
                     try:
-                        start_time = time.time()
-                        model.fit(st.session_state.X_train, st.session_state.y_train)
-                        training_time = time.time() - start_time
+                        if job_result is not None:
+                            # Model sudah dilatih oleh job; CV-nya juga dipakai ulang. Kunci cache dari saat job dikirim:
+                            # hasil masuk ke cache pelatihan sekali, "Tampilkan Hasil Lagi" tidak mendaftarkan/menambah duplikat
+                            training_time = job_result['training_time']
+                            cv_result = job_result['cv_result']
+                            cache_key = job_result['cache_key']
+                            cached_entry = training_cache.get(cache_key) if cache_key is not None else None
+                        else:
+                            # Data, model, parameter dan pengaturan CV yang identik tidak dilatih ulang
+                            cache_key = training_key(model, st.session_state.X_train, st.session_state.y_train,
+                                                     cv_params['cv'], cv_params.get('scoring'))
+                            cached_entry = training_cache.get(cache_key)
+                            if cached_entry is not None:
+                                model = cached_entry['model']
+                                training_time = cached_entry['training_time']
+                                cv_result = cached_entry['cv_result']
+                                st.info("Hasil dipulihkan dari cache pelatihan (data, model, parameter dan CV identik)" if st.session_state.language == 'id' else "Results restored from the training cache (identical data, model, parameters and CV)")
+                            else:
+                                start_time = time.time()
+                                model.fit(st.session_state.X_train, st.session_state.y_train)
+                                training_time = time.time() - start_time
                         
                         # Tambahkan validasi sebelum prediksi
                         try:
@@ -4102,12 +4630,15 @@ with tab4:
                         except Exception as e:
                             st.error(f"Model error: {str(e)}. Silakan latih ulang model." if st.session_state.language == 'id' else f"Model error: {str(e)}. Please retrain the model.")
 
-                        # Jika menggunakan GridSearchCV, tampilkan parameter terbaik
+                        # Jika menggunakan pencarian hyperparameter, tampilkan parameter terbaik
                         if use_grid_search and hasattr(model, "best_params_"):
-                            st.success(f"Pelatihan model selesai dalam {training_time:.2f} detik dengan GridSearchCV. Parameter terbaik: {model.best_params_}" if st.session_state.language == 'id' else f"Model training completed in {training_time:.2f} seconds with GridSearchCV!")
+                            search_strategy = getattr(model, "strategy", "Grid Search")
+                            st.success(f"Pelatihan model selesai dalam {training_time:.2f} detik dengan {search_strategy}. Parameter terbaik: {model.best_params_}" if st.session_state.language == 'id' else f"Model training completed in {training_time:.2f} seconds with {search_strategy}!")
                             st.subheader("Parameter Terbaik" if st.session_state.language == 'id' else "Best Parameters:")
                             st.write(model.best_params_)
                             st.write(f"Skor terbaik (CV): {model.best_score_:.4f}" if st.session_state.language == 'id' else f"Best Score (CV): {model.best_score_:.4f}")
+                            if hasattr(model, "n_fits_"):
+                                st.write(f"{model.strategy}: {model.n_fits_} fit dalam {model.elapsed_:.1f} detik" if st.session_state.language == 'id' else f"{model.strategy}: {model.n_fits_} fits in {model.elapsed_:.1f} seconds")
 
                             # Gunakan model terbaik untuk prediksi
                             y_pred = model.best_estimator_.predict(st.session_state.X_test)
@@ -4117,70 +4648,128 @@ with tab4:
                             y_pred = model.predict(st.session_state.X_test)
                             st.session_state.model = model
                         
+                        # Early stopping: jumlah stage/iterasi yang benar-benar dipakai
+                        fitted_model = st.session_state.model
+                        if getattr(fitted_model, 'n_iter_no_change', None) is not None and hasattr(fitted_model, 'n_estimators_'):
+                            st.info(f"Early stopping: {fitted_model.n_estimators_} dari {fitted_model.n_estimators} boosting stage dipakai" if st.session_state.language == 'id' else f"Early stopping: {fitted_model.n_estimators_} of {fitted_model.n_estimators} boosting stages used")
+                        elif getattr(fitted_model, 'do_early_stopping_', getattr(fitted_model, 'early_stopping', False) is True) and hasattr(fitted_model, 'n_iter_'):
+                            st.info(f"Early stopping: berhenti setelah {fitted_model.n_iter_} dari maksimum {fitted_model.max_iter} iterasi" if st.session_state.language == 'id' else f"Early stopping: stopped after {fitted_model.n_iter_} of at most {fitted_model.max_iter} iterations")
+                        
                         # Cross-validation evaluation
                         if cv_params['cv'] is not None:
                             st.subheader("Hasil Cross-Validation" if st.session_state.language == 'id' else "Cross-Validation Results")
                             
                             with st.spinner("Menghitung cross-validation..." if st.session_state.language == 'id' else "Calculating cross-validation..."):
                                 try:
-                                    # Get the actual model (best estimator if GridSearchCV)
-                                    eval_model = model.best_estimator_ if use_grid_search else model
+                                    # Skor fold dari tuning (atau dari job) dipakai ulang; model tanpa tuning divalidasi sekali
+                                    if cv_result is None and use_grid_search:
+                                        cv_result = getattr(model, 'cv_result_', None)
+                                    if cv_result is not None and cv_params['scoring'] in cv_result.scores:
+                                        st.info(f"Skor fold diambil dari hasil sebelumnya ({cv_result.source}), tanpa cross-validation ulang" if st.session_state.language == 'id' else f"Fold scores reused from {cv_result.source} (no second cross-validation)")
+                                    else:
+                                        # Estimasi biaya dari waktu satu fit; CV yang terlalu mahal ditolak
+                                        closed_form = isinstance(cv_params['cv'], LeaveOneOut) and supports_closed_form_loo(st.session_state.model)
+                                        cv_estimate = cv_cost(cv_params['cv'], len(st.session_state.X_train), training_time / (getattr(model, 'n_fits_', 0) + 1))
+                                        if closed_form or cv_estimate['estimated_seconds'] <= cv_params['max_seconds']:
+                                            cv_result = cross_validation_result(
+                                                st.session_state.model,
+                                                st.session_state.X_train,
+                                                st.session_state.y_train,
+                                                cv=cv_params['cv'],
+                                                scoring=cv_params['scoring']
+                                            )
+                                        else:
+                                            cv_result = None
+                                            st.warning(f"Cross-validation dilewati: {cv_estimate['n_splits']:,} fit diperkirakan {cv_estimate['estimated_seconds'] / 60:,.0f} menit (batas {cv_params['max_seconds'] / 60:.0f} menit). Gunakan K-Fold, kurangi split Leave-P-Out, atau naikkan batas waktu." if st.session_state.language == 'id' else f"Cross-validation skipped: {cv_estimate['n_splits']:,} fits estimated at {cv_estimate['estimated_seconds'] / 60:,.0f} minutes (limit {cv_params['max_seconds'] / 60:.0f} minutes). Use K-Fold, fewer Leave-P-Out splits, or raise the limit.")
                                     
-                                    # Perform cross-validation
-                                    cv_scores = cross_val_score(
-                                        eval_model, 
-                                        st.session_state.X_train, 
-                                        st.session_state.y_train,
-                                        cv=cv_params['cv'],
-                                        scoring=cv_params['scoring'],
-                                        n_jobs=-1
-                                    )
+                                    if cv_result is not None:
+                                        cv_scores = cv_result.scores[cv_params['scoring']]
                                     
-                                    # Display results
-                                    col1, col2, col3 = st.columns(3)
-                                    with col1:
-                                        st.metric(
-                                            "Rata-rata Skor CV" if st.session_state.language == 'id' else "Mean CV Score",
-                                            f"{cv_scores.mean():.4f}"
-                                        )
-                                    with col2:
-                                        st.metric(
-                                            "Standar Deviasi" if st.session_state.language == 'id' else "Std Deviation",
-                                            f"{cv_scores.std():.4f}"
-                                        )
-                                    with col3:
-                                        st.metric(
-                                            "Metode Validasi" if st.session_state.language == 'id' else "Validation Method",
-                                            cv_params['name']
-                                        )
+                                        # Display results
+                                        col1, col2, col3 = st.columns(3)
+                                        with col1:
+                                            st.metric(
+                                                "Rata-rata Skor CV" if st.session_state.language == 'id' else "Mean CV Score",
+                                                f"{cv_scores.mean():.4f}"
+                                            )
+                                        with col2:
+                                            st.metric(
+                                                "Standar Deviasi" if st.session_state.language == 'id' else "Std Deviation",
+                                                f"{cv_scores.std():.4f}"
+                                            )
+                                        with col3:
+                                            st.metric(
+                                                "Metode Validasi" if st.session_state.language == 'id' else "Validation Method",
+                                                cv_params['name']
+                                            )
                                     
-                                    # Plot cross-validation scores
-                                    fig, ax = plt.subplots(figsize=(10, 6))
-                                    ax.boxplot(cv_scores)
-                                    ax.set_title(f"Cross-Validation Scores - {cv_params['name']}" if st.session_state.language == 'id' else f"Cross-Validation Scores - {cv_params['name']}")
-                                    ax.set_ylabel("Score")
-                                    ax.grid(True, alpha=0.3)
-                                    st.pyplot(fig)
+                                        # Plot cross-validation scores
+                                        fig, ax = plt.subplots(figsize=(10, 6))
+                                        ax.boxplot(cv_scores)
+                                        ax.set_title(f"Cross-Validation Scores - {cv_params['name']}" if st.session_state.language == 'id' else f"Cross-Validation Scores - {cv_params['name']}")
+                                        ax.set_ylabel("Score")
+                                        ax.grid(True, alpha=0.3)
+                                        st.pyplot(fig)
                                     
-                                    # Detailed scores
-                                    st.write("**Detail Skor per Fold:**" if st.session_state.language == 'id' else "**Detailed Scores per Fold:**")
-                                    fold_df = pd.DataFrame({
-                                        'Fold': [f'Fold {i+1}' for i in range(len(cv_scores))],
-                                        'Score': cv_scores
-                                    })
-                                    st.dataframe(fold_df)
+                                        # Detailed scores
+                                        st.write("**Detail Skor per Fold:**" if st.session_state.language == 'id' else "**Detailed Scores per Fold:**")
+                                        fold_df = cv_result.fold_table(cv_params['scoring'])
+                                        st.dataframe(fold_df)
+                                    
+                                        oof_pred = cv_result.oof_predictions
+                                        if oof_pred is not None:
+                                            oof_score = accuracy_score(st.session_state.y_train, oof_pred) if problem_type == "Classification" else r2_score(st.session_state.y_train, oof_pred)
+                                            st.write(f"Skor out-of-fold ({'accuracy' if problem_type == 'Classification' else 'R²'}): {oof_score:.4f}" if st.session_state.language == 'id' else f"Out-of-fold score ({'accuracy' if problem_type == 'Classification' else 'R²'}): {oof_score:.4f}")
                                     
                                 except Exception as e:
                                     st.error(f"Error dalam cross-validation: {str(e)}" if st.session_state.language == 'id' else f"Error in cross-validation: {str(e)}")
                         
-                        # Save model dengan nama custom
-                        os.makedirs("models", exist_ok=True)
+                        if cache_key is not None and cached_entry is None:
+                            training_cache.put(cache_key, {
+                                'model': model,
+                                'training_time': training_time,
+                                'cv_result': cv_result
+                            })
+                        
+                        if compare_float64:
+                            with st.spinner("Melatih ulang dengan float64..." if st.session_state.language == 'id' else "Refitting with float64..."):
+                                try:
+                                    precision_df = compare_precision(
+                                        st.session_state.model,
+                                        st.session_state.X_train, st.session_state.y_train,
+                                        st.session_state.X_test, st.session_state.y_test,
+                                        problem_type
+                                    )
+                                    st.subheader("Perbandingan Presisi float32 vs float64" if st.session_state.language == 'id' else "float32 vs float64 Precision Comparison")
+                                    st.dataframe(precision_df)
+                                except Exception as e:
+                                    st.error(f"Error saat membandingkan presisi: {str(e)}" if st.session_state.language == 'id' else f"Error comparing precision: {str(e)}")
+
+                        # Simpan model ke registry (versi baru per nama, artefak terkompresi + manifest JSON);
+                        # cache hit = model yang sama dengan run sebelumnya, tidak disimpan ulang
                         # Bersihkan nama agar hanya huruf/angka/underscore
-                        safe_name = "".join([c if c.isalnum() or c == "_" else "_" for c in model_custom_name])
-                        model_filename = f"models/{safe_name}.pkl"
-                        with open(model_filename, 'wb') as f:
-                            pickle.dump(st.session_state.model, f)
-                        st.success(f"Model telah disimpan sebagai '{model_filename}'" if st.session_state.language == 'id' else "Model saved as '{model_filename}'")
+                        safe_name = "".join([c if c.isalnum() or c == "_" else "_" for c in model_custom_name]) or type(st.session_state.model).__name__
+                        if cached_entry is None:
+                            registered = model_registry.register(
+                                safe_name,
+                                st.session_state.model,
+                                features=st.session_state.X_train.columns,
+                                preprocessing={
+                                    'encoders': st.session_state.encoders,
+                                    'scaler': st.session_state.scaler,
+                                    'sparse_encoder': st.session_state.sparse_encoder,
+                                    'target_encoder': st.session_state.target_encoder,
+                                    'sparse_scaler': st.session_state.sparse_scaler,
+                                    'pca_projection': st.session_state.pca_projection
+                                },
+                                problem_type=problem_type,
+                                data_fingerprint=matrix_fingerprint(st.session_state.X_train),
+                                training_time=training_time,
+                                float32_mode=st.session_state.float32_mode,
+                                best_params=getattr(model, 'best_params_', None),
+                                cv=cv_params['name']
+                            )
+                            st.success(f"Model telah disimpan di registry sebagai '{safe_name}' versi {registered['version']}" if st.session_state.language == 'id' else f"Model saved to the registry as '{safe_name}' version {registered['version']}")
                         
                         # Evaluasi model
                         if problem_type == "Classification":
@@ -4388,7 +4977,10 @@ with tab4:
                         'model': st.session_state.model,
                         'y_test': st.session_state.y_test,
                         'y_pred': y_pred,
-                        'problem_type': problem_type
+                        'problem_type': problem_type,
+                        'cv_result': cv_result,
+                        'cv_scoring': cv_params.get('scoring'),
+                        'cache_key': cache_key
                     }
                     
                     if problem_type == "Classification":
@@ -4405,7 +4997,86 @@ with tab4:
                             'adj_r2': adj_r2
                         })
                     
-                    st.session_state.model_results.append(result)
+                    if registered is not None:
+                        # Metrik baru tersedia setelah evaluasi: tambahkan ke manifest versi ini
+                        if problem_type == "Classification":
+                            registry_metrics = {'accuracy': accuracy}
+                        else:
+                            registry_metrics = {'mse': mse, 'rmse': rmse, 'r2': r2, 'adj_r2': adj_r2}
+                        if cv_result is not None and cv_params.get('scoring') in cv_result.scores:
+                            registry_metrics[f"cv_{cv_params['scoring']}_mean"] = cv_result.mean(cv_params['scoring'])
+                            registry_metrics[f"cv_{cv_params['scoring']}_std"] = cv_result.std(cv_params['scoring'])
+                        model_registry.update(registered['name'], registered['version'], metrics=registry_metrics)
+                    
+                    # Run identik (cache hit) menggantikan entri lamanya, bukan menambah duplikat
+                    duplicate = [i for i, r in enumerate(st.session_state.model_results)
+                                 if cache_key is not None and r.get('cache_key') == cache_key]
+                    if duplicate:
+                        st.session_state.model_results[duplicate[0]] = result
+                    else:
+                        st.session_state.model_results.append(result)
+            
+            # Benchmark: semua keluarga model dilatih bersamaan di process pool pada split CV yang sama
+            with st.expander("Latih Semua Model (Leaderboard)" if st.session_state.language == 'id' else "Train All Models (Leaderboard)"):
+                available_models = benchmark_models(problem_type, len(st.session_state.X_train))
+                benchmark_selection = st.multiselect(
+                    "Model yang dibandingkan:" if st.session_state.language == 'id' else "Models to compare:",
+                    list(available_models),
+                    default=list(available_models)
+                )
+                cores_per_job = st.number_input(
+                    "Core per model:" if st.session_state.language == 'id' else "Cores per model:",
+                    1, max(1, os.cpu_count() or 1), 1
+                )
+                # Skema CV dengan banyak split (LOO/LPO) tidak dipakai untuk benchmark semua model
+                benchmark_cv = cv_params['cv']
+                if benchmark_cv is not None and cv_cost(benchmark_cv, len(st.session_state.X_train))['n_splits'] > 20:
+                    benchmark_cv = None
+                    st.caption("Cross-validation dilewati untuk benchmark (lebih dari 20 split)." if st.session_state.language == 'id' else "Cross-validation skipped for the benchmark (more than 20 splits).")
+                
+                if benchmark_selection and st.button("Jalankan Benchmark" if st.session_state.language == 'id' else "Run Benchmark"):
+                    benchmark_progress = st.progress(0.0)
+                    leaderboard_placeholder = st.empty()
+                    leaderboard = []
+                    score_column = 'Accuracy' if problem_type == "Classification" else 'R²'
+                    benchmark_runs = run_benchmark(
+                        {name: available_models[name] for name in benchmark_selection},
+                        st.session_state.X_train, st.session_state.y_train,
+                        st.session_state.X_test, st.session_state.y_test,
+                        problem_type, cv=benchmark_cv, scoring=cv_params.get('scoring'),
+                        cores_per_job=cores_per_job
+                    )
+                    for done, (name, benchmark_result, error) in enumerate(benchmark_runs, 1):
+                        benchmark_progress.progress(done / len(benchmark_selection))
+                        if error is not None:
+                            st.error(f"{name}: {str(error)}")
+                            continue
+                        
+                        # Hasil langsung masuk ke model_results (menggantikan hasil benchmark lama model yang sama)
+                        result = {
+                            'y_test': st.session_state.y_test,
+                            'problem_type': problem_type,
+                            'cv_scoring': cv_params.get('scoring'),
+                            'cache_key': None,
+                            'benchmark': True,
+                            **benchmark_result
+                        }
+                        st.session_state.model_results = [
+                            r for r in st.session_state.model_results
+                            if not (r.get('benchmark') and r['model_name'] == name)
+                        ] + [result]
+                        
+                        cv_available = result['cv_result'] is not None and result['cv_scoring'] in result['cv_result'].scores
+                        leaderboard.append({
+                            'Model': name,
+                            score_column: result['accuracy'] if problem_type == "Classification" else result['r2'],
+                            'CV Mean': result['cv_result'].mean(result['cv_scoring']) if cv_available else np.nan,
+                            'Fit time (s)': result['fit_time'],
+                            'Predict (ms/row)': result['predict_ms_per_row']
+                        })
+                        leaderboard_placeholder.dataframe(
+                            pd.DataFrame(leaderboard).sort_values(score_column, ascending=False).reset_index(drop=True)
+                        )
             
             # Tampilkan perbandingan model jika ada lebih dari satu model
             if len(st.session_state.model_results) > 1:
@@ -4559,6 +5230,24 @@ with tab4:
                             
                             plt.tight_layout()
                             st.pyplot(fig)
+                    
+                    # Skor CV per model (dari hasil tuning atau satu kali cross-validation)
+                    cv_summary = [
+                        {
+                            'Model': result['model_name'],
+                            'Metric': result['cv_scoring'],
+                            'CV Mean': result['cv_result'].mean(result['cv_scoring']),
+                            'CV Std': result['cv_result'].std(result['cv_scoring']),
+                            'Folds': result['cv_result'].n_folds,
+                            'Source': result['cv_result'].source
+                        }
+                        for result in st.session_state.model_results
+                        if result['problem_type'] == problem_type and result.get('cv_result') is not None
+                        and result['cv_scoring'] in result['cv_result'].scores
+                    ]
+                    if cv_summary:
+                        st.subheader("Skor Cross-Validation" if st.session_state.language == 'id' else "Cross-Validation Scores")
+                        st.dataframe(pd.DataFrame(cv_summary))
                 
                 with comparison_tabs[2]:
                     st.subheader("Peringkat Model" if st.session_state.language == 'id' else "Model Rankings")
@@ -4759,9 +5448,18 @@ with tab4:
                     
                     input_data = {}
                     
-                    for feature in st.session_state.X_train.columns:
+                    # Dengan one-hot sparse, hashing, atau target encoding, input diminta dalam bentuk kolom mentah (sebelum encoding)
+                    column_encoder = st.session_state.sparse_encoder or st.session_state.target_encoder
+                    # Dengan reduksi dimensi PCA, model dilatih pada komponen; input tetap kolom fitur sebelum PCA
+                    pca_projection = st.session_state.pca_projection
+                    model_features = pca_projection.input_columns if pca_projection is not None else list(st.session_state.X_train.columns)
+                    input_features = column_encoder.input_columns if column_encoder is not None else model_features
+                    
+                    for feature in input_features:
                         # Cek apakah fitur adalah kategorikal atau numerikal
-                        if feature in st.session_state.categorical_columns:
+                        if column_encoder is not None and feature in column_encoder.categorical_columns:
+                            input_data[feature] = st.selectbox(f"{feature}:", column_encoder.categories_[feature])
+                        elif feature in st.session_state.categorical_columns:
                             # Jika ada encoder untuk fitur ini, tampilkan opsi yang tersedia
                             if feature in st.session_state.encoders:
                                 options = list(st.session_state.encoders[feature].classes_)
@@ -4778,18 +5476,25 @@ with tab4:
                             input_df = pd.DataFrame([input_data])
                             
                             # Terapkan preprocessing yang sama seperti data training
-                            # Encoding untuk fitur kategorikal
-                            for col in [c for c in input_df.columns if c in st.session_state.categorical_columns]:
-                                if col in st.session_state.encoders:
-                                    input_df[col] = st.session_state.encoders[col].transform(input_df[col].astype(str))
-                            
-                            # Scaling untuk fitur numerikal
-                            num_cols = [c for c in input_df.columns if c in st.session_state.numerical_columns]
-                            if st.session_state.scaler is not None and num_cols:
-                                input_df[num_cols] = st.session_state.scaler.transform(input_df[num_cols])
+                            if column_encoder is not None:
+                                input_df = column_encoder.transform(input_df, scaler=st.session_state.sparse_scaler)
+                            else:
+                                # Encoding untuk fitur kategorikal
+                                for col in [c for c in input_df.columns if c in st.session_state.categorical_columns]:
+                                    if col in st.session_state.encoders:
+                                        input_df[col] = st.session_state.encoders[col].transform(input_df[col].astype(str))
+                                
+                                # Scaling untuk fitur numerikal
+                                num_cols = [c for c in input_df.columns if c in st.session_state.numerical_columns]
+                                if st.session_state.scaler is not None and num_cols:
+                                    input_df[num_cols] = st.session_state.scaler.transform(input_df[num_cols])
 
                             # Pastikan urutan kolom sama dengan saat training
-                            input_df = input_df[st.session_state.X_train.columns]
+                            input_df = input_df[model_features]
+                            if pca_projection is not None:
+                                input_df = pca_projection.transform_frame(input_df)
+                            if st.session_state.float32_mode:
+                                input_df = to_float32(input_df)
 
                             # Lakukan prediksi
                             prediction = st.session_state.model.predict(input_df)
@@ -4846,7 +5551,11 @@ with tab4:
                             st.dataframe(pred_data.head())
                             
                             # Periksa apakah semua fitur yang diperlukan ada
-                            missing_features = [f for f in st.session_state.X_train.columns if f not in pred_data.columns]
+                            column_encoder = st.session_state.sparse_encoder or st.session_state.target_encoder
+                            pca_projection = st.session_state.pca_projection
+                            model_features = pca_projection.input_columns if pca_projection is not None else list(st.session_state.X_train.columns)
+                            required_features = column_encoder.input_columns if column_encoder is not None else model_features
+                            missing_features = [f for f in required_features if f not in pred_data.columns]
                             
                             if missing_features:
                                 st.error(f"Data tidak memiliki fitur yang diperlukan: {', '.join(missing_features)}" if st.session_state.language == 'id' else f"Data is missing required features: {', '.join(missing_features)}")
@@ -4857,7 +5566,7 @@ with tab4:
                             col1, col2 = st.columns(2)
                             with col1:
                                 st.write("**Fitur yang diharapkan model:**")
-                                expected_features = list(st.session_state.X_train.columns)
+                                expected_features = list(required_features)
                                 st.write(expected_features)
                                 
                             with col2:
@@ -4890,7 +5599,7 @@ with tab4:
                                 st.write("**📊 Validasi Fitur:**")
                                 
                                 # Check for missing features
-                                missing_features = [f for f in st.session_state.X_train.columns if f not in pred_data.columns]
+                                missing_features = [f for f in required_features if f not in pred_data.columns]
                                 
                                 if missing_features:
                                     st.error(f"Data tidak memiliki fitur yang diperlukan: {', '.join(missing_features)}")
@@ -4901,7 +5610,7 @@ with tab4:
                                     col1, col2 = st.columns(2)
                                     with col1:
                                         st.write("**Fitur yang diharapkan model:**")
-                                        expected_features = list(st.session_state.X_train.columns)
+                                        expected_features = list(required_features)
                                         st.write(expected_features)
                                         
                                     with col2:
@@ -4926,7 +5635,7 @@ with tab4:
                                 else:
                                     # Validasi tipe data
                                     type_issues = []
-                                    for col in st.session_state.X_train.columns:
+                                    for col in ([] if column_encoder is not None or pca_projection is not None else st.session_state.X_train.columns):
                                         if col in pred_data.columns:
                                             expected_dtype = st.session_state.X_train[col].dtype
                                             actual_dtype = pred_data[col].dtype
@@ -4951,22 +5660,32 @@ with tab4:
                                                 st.error(f"Gagal mengkonversi {col}: {str(e)}")
                                     
                                     # Lanjutkan dengan preprocessing
-                                    pred_data = pred_data[st.session_state.X_train.columns]
-                                    
-                                    # Encoding untuk fitur kategorikal
-                                    for col in [c for c in pred_data.columns if c in st.session_state.categorical_columns]:
-                                        if col in st.session_state.encoders:
-                                            try:
-                                                pred_data[col] = st.session_state.encoders[col].transform(pred_data[col].astype(str))
-                                            except ValueError as e:
-                                                st.error(f"Error encoding {col}: {str(e)}")
-                                                st.write(f"Nilai unik dalam data: {pred_data[col].unique()}")
-                                                st.write(f"Nilai yang diharapkan encoder: {list(st.session_state.encoders[col].classes_)}")
-                                    
-                                    # Scaling untuk fitur numerikal
-                                    num_cols = [c for c in pred_data.columns if c in st.session_state.numerical_columns]
-                                    if st.session_state.scaler is not None and num_cols:
-                                        pred_data[num_cols] = st.session_state.scaler.transform(pred_data[num_cols])
+                                    if column_encoder is not None:
+                                        # Encoder kolom mentah (one-hot sparse / hashing / target encoding) + scaling sparse
+                                        pred_data = column_encoder.transform(pred_data[required_features], scaler=st.session_state.sparse_scaler)
+                                        pred_data = pred_data[model_features]
+                                    else:
+                                        pred_data = pred_data[model_features]
+                                        
+                                        # Encoding untuk fitur kategorikal
+                                        for col in [c for c in pred_data.columns if c in st.session_state.categorical_columns]:
+                                            if col in st.session_state.encoders:
+                                                try:
+                                                    pred_data[col] = st.session_state.encoders[col].transform(pred_data[col].astype(str))
+                                                except ValueError as e:
+                                                    st.error(f"Error encoding {col}: {str(e)}")
+                                                    st.write(f"Nilai unik dalam data: {pred_data[col].unique()}")
+                                                    st.write(f"Nilai yang diharapkan encoder: {list(st.session_state.encoders[col].classes_)}")
+                                        
+                                        # Scaling untuk fitur numerikal
+                                        num_cols = [c for c in pred_data.columns if c in st.session_state.numerical_columns]
+                                        if st.session_state.scaler is not None and num_cols:
+                                            pred_data[num_cols] = st.session_state.scaler.transform(pred_data[num_cols])
+
+                                    if pca_projection is not None:
+                                        pred_data = pca_projection.transform_frame(pred_data)
+                                    if st.session_state.float32_mode:
+                                        pred_data = to_float32(pred_data)
                                     
                                     if st.button("Prediksi Batch", key="batch_prediction_btn"):
                                         try:
@@ -5013,26 +5732,44 @@ with tab4:
                 # Tambahkan bagian untuk memuat model yang sudah disimpan
                 st.subheader("Muat Model yang Sudah Disimpan" if st.session_state.language == 'id' else "Load Saved Model")
                 
-                # Cek apakah folder models ada
-                if os.path.exists("models"):
-                    model_files = [f for f in os.listdir("models") if f.endswith(".pkl")]
-                    
-                    if model_files:
-                        selected_model_file = st.selectbox("Pilih model yang akan dimuat:" if st.session_state.language == 'id' else "Select a model to load:", model_files)
-                        
-                        if st.button("Muat Model" if st.session_state.language == 'id' else "Load Model"):
-                            try:
+                registered_models = model_registry.list()
+                # File .pkl lama (sebelum registry) tetap bisa dimuat
+                legacy_files = sorted(f for f in os.listdir("models") if f.endswith(".pkl")) if os.path.exists("models") else []
+                
+                if registered_models or legacy_files:
+                    model_options = [f"{m['name']} (v{m['version']})" for m in registered_models] + legacy_files
+                    selected_model_file = st.selectbox("Pilih model yang akan dimuat:" if st.session_state.language == 'id' else "Select a model to load:", model_options)
+                    selected_index = model_options.index(selected_model_file)
+                    
+                    if selected_index < len(registered_models):
+                        selected_manifest = registered_models[selected_index]
+                        with st.expander("Manifest model" if st.session_state.language == 'id' else "Model manifest"):
+                            st.json(selected_manifest)
+                        if selected_manifest.get('features') and list(st.session_state.X_train.columns) != selected_manifest['features']:
+                            st.warning("Fitur model ini berbeda dengan fitur data saat ini." if st.session_state.language == 'id' else "This model's features differ from the current data's features.")
+                    
+                    if st.button("Muat Model" if st.session_state.language == 'id' else "Load Model"):
+                        try:
+                            if selected_index < len(registered_models):
+                                # Model dimuat sekali dan dibagi antar sesi (di-memory-map kecuali model pohon sklearn); encoder/scaler/PCA model ini menggantikan
+                                # milik sesi saat ini (juga bila model dilatih tanpa objek tersebut)
+                                loaded_model, preprocessing, _ = model_registry.load(selected_manifest['name'], selected_manifest['version'])
+                                st.session_state.encoders = preprocessing.get('encoders') or {}
+                                st.session_state.scaler = preprocessing.get('scaler')
+                                st.session_state.sparse_encoder = preprocessing.get('sparse_encoder')
+                                st.session_state.target_encoder = preprocessing.get('target_encoder')
+                                st.session_state.sparse_scaler = preprocessing.get('sparse_scaler')
+                                st.session_state.pca_projection = preprocessing.get('pca_projection')
+                            else:
                                 with open(os.path.join("models", selected_model_file), 'rb') as f:
                                     loaded_model = pickle.load(f)
-                                
-                                st.session_state.model = loaded_model
-                                st.success(f"Model {selected_model_file} berhasil dimuat!" if st.session_state.language == 'id' else f"Model {selected_model_file} loaded successfully!")
-                            except Exception as e:
-                                st.error(f"Error saat memuat model: {str(e)}")
-                    else:
-                        st.info("Tidak ada model tersimpan di folder 'models'." if st.session_state.language == 'id' else "No saved models found in the 'models' folder.")
+                            
+                            st.session_state.model = loaded_model
+                            st.success(f"Model {selected_model_file} berhasil dimuat!" if st.session_state.language == 'id' else f"Model {selected_model_file} loaded successfully!")
+                        except Exception as e:
+                            st.error(f"Error saat memuat model: {str(e)}")
                 else:
-                    st.info("Folder 'models' belum dibuat. Latih dan simpan model terlebih dahulu." if st.session_state.language == 'id' else "Folder 'models' does not exist. Train and save models first.")
+                    st.info("Belum ada model tersimpan. Latih dan simpan model terlebih dahulu." if st.session_state.language == 'id' else "No saved models yet. Train and save models first.")
             else:
                 st.info("Silakan latih model terlebih dahulu sebelum melakukan prediksi." if st.session_state.language == 'id' else "Please train a model first before making predictions.")
     else:
@@ -5074,200 +5811,217 @@ with tab5:
                 min_value=10, max_value=min(100, len(st.session_state.X_test)), value=50
             )
             
-            if st.button("Generate SHAP Values" if st.session_state.language == 'id' else "Generate SHAP Values"):
+            def prepare_shap_sample():
+                """Sampel data uji untuk SHAP (one-hot untuk fitur kategorikal, semua kolom numerik)"""
+                # Persiapkan data untuk SHAP
+                X_sample = st.session_state.X_test[selected_features].sample(min(sample_size, len(st.session_state.X_test)), random_state=42)
+                
+                # Identifikasi fitur kategorikal dalam sampel
+                categorical_cols = [col for col in selected_features if col in st.session_state.categorical_columns]
+                
+                # Terapkan One-Hot Encoding jika ada fitur kategorikal
+                if categorical_cols:
+                    st.info("Fitur kategorikal terdeteksi. Menerapkan One-Hot Encoding untuk analisis SHAP." if st.session_state.language == 'id' else 
+                        "Categorical features detected. Applying One-Hot Encoding for SHAP analysis.")
+                    X_sample = pd.get_dummies(X_sample, columns=categorical_cols, drop_first=False)
+                
+                # Pastikan semua nilai dalam X_sample adalah numerik
+                for col in X_sample.columns:
+                    try:
+                        # Konversi ke numpy array terlebih dahulu (tetap float32 pada mode float32)
+                        X_sample[col] = np.array(X_sample[col]).astype(np.float32 if st.session_state.float32_mode else float)
+                    except:
+                        try:
+                            # Jika gagal, gunakan factorize dan konversi ke float
+                            X_sample[col] = pd.factorize(X_sample[col])[0].astype(np.float32 if st.session_state.float32_mode else float)
+                        except Exception as e:
+                            st.error(f"Error saat mengkonversi kolom {col} ke numerik: {str(e)}")
+                return X_sample
+            
+            # Data latar KernelExplainer (diringkas dengan k-means di dalam perhitungan)
+            X_background = st.session_state.X_train[selected_features].sample(min(50, len(st.session_state.X_train)), random_state=42)
+            
+            shap_in_background = st.checkbox(
+                "Hitung di latar belakang (job)" if st.session_state.language == 'id' else "Compute in the background (job)",
+                value=False,
+                key="shap_in_background",
+                help="Nilai SHAP dihitung sebagai job yang melaporkan progres per blok sampel, bisa dibatalkan, dan tetap berjalan saat halaman dimuat ulang" if st.session_state.language == 'id' else "SHAP values are computed as a job that reports progress per block of samples, can be cancelled, and keeps running when the page reloads"
+            )
+            shap_result = None
+            if shap_in_background:
+                if st.button("Kirim Job SHAP" if st.session_state.language == 'id' else "Submit SHAP Job"):
+                    if not selected_features:
+                        st.error("Silakan pilih setidaknya satu fitur untuk analisis SHAP." if st.session_state.language == 'id' else "Please select at least one feature for SHAP analysis.")
+                    else:
+                        st.session_state.shap_job_id = jobs.submit(
+                            "shap", type(st.session_state.model).__name__, shap_values_job,
+                            st.session_state.model, prepare_shap_sample(), X_background,
+                            owner=st.session_state.job_owner
+                        )
+                
+                shap_job_id, shap_job = job_panel("shap", 'shap_job_id')
+                if shap_job is not None and shap_job['status'] == "completed":
+                    shap_result = jobs.result(shap_job_id)
+            elif st.button("Generate SHAP Values" if st.session_state.language == 'id' else "Generate SHAP Values"):
                 if not selected_features:
                     st.error("Silakan pilih setidaknya satu fitur untuk analisis SHAP." if st.session_state.language == 'id' else "Please select at least one feature for SHAP analysis.")
                 else:
                     with st.spinner("Menghitung nilai SHAP..." if st.session_state.language == 'id' else "Calculating SHAP values..."):
-                        # Persiapkan data untuk SHAP
-                        X_sample = st.session_state.X_test[selected_features].sample(min(sample_size, len(st.session_state.X_test)), random_state=42)
-                        
-                        # Identifikasi fitur kategorikal dalam sampel
-                        categorical_cols = [col for col in selected_features if col in st.session_state.categorical_columns]
-                        
-                        # Terapkan One-Hot Encoding jika ada fitur kategorikal
-                        if categorical_cols:
-                            st.info("Fitur kategorikal terdeteksi. Menerapkan One-Hot Encoding untuk analisis SHAP." if st.session_state.language == 'id' else 
-                                "Categorical features detected. Applying One-Hot Encoding for SHAP analysis.")
-                            X_sample = pd.get_dummies(X_sample, columns=categorical_cols, drop_first=False)
-                        
-                        # Pastikan semua nilai dalam X_sample adalah numerik
-                        for col in X_sample.columns:
-                            try:
-                                # Konversi ke numpy array terlebih dahulu
-                                X_sample[col] = np.array(X_sample[col]).astype(float)
-                            except:
-                                try:
-                                    # Jika gagal, gunakan factorize dan konversi ke float
-                                    X_sample[col] = pd.factorize(X_sample[col])[0].astype(float)
-                                except Exception as e:
-                                    st.error(f"Error saat mengkonversi kolom {col} ke numerik: {str(e)}")
-                        
                         try:
-                            # Pilih explainer berdasarkan jenis model
-                            model_type = type(st.session_state.model).__name__.lower()
-                            
-                            if any(tree_model in model_type for tree_model in ['randomforest', 'gradientboosting', 'xgb', 'lgbm', 'catboost', 'decisiontree']):                            
-                                if model_type == 'gradientboostingclassifier':
-                                    # Gunakan KernelExplainer untuk GradientBoostingClassifier karena TreeExplainer tidak mendukung multi-kelas
-                                    background = shap.kmeans(st.session_state.X_train[selected_features].sample(min(50, len(st.session_state.X_train)), random_state=42), 5)
-                                    explainer = shap.KernelExplainer(st.session_state.model.predict_proba, background)
-                                    shap_values = explainer.shap_values(X_sample)
-                                else:
-                                    # Gunakan TreeExplainer untuk model berbasis pohon lainnya
-                                    explainer = shap.TreeExplainer(st.session_state.model)
-                                    shap_values = explainer.shap_values(X_sample)
-                                
-                                # Untuk model klasifikasi dengan output multi-kelas
-                                if st.session_state.problem_type == "Classification" and isinstance(shap_values, list):
-                                    st.subheader("Pilih Kelas untuk Visualisasi SHAP" if st.session_state.language == 'id' else "Select Class for SHAP Visualization")
-                                    if hasattr(st.session_state.model, 'classes_'):
-                                        class_names = st.session_state.model.classes_
-                                        class_idx = st.selectbox(
-                                            "Pilih kelas:" if st.session_state.language == 'id' else "Select class:",
-                                            options=range(len(class_names)),
-                                            format_func=lambda i: f"{class_names[i]}"
-                                        )
-                                        shap_values_selected = shap_values[class_idx]
-                                        st.success(f"Menampilkan nilai SHAP untuk kelas: {class_names[class_idx]}" if st.session_state.language == 'id' else 
-                                                f"Displaying SHAP values for class: {class_names[class_idx]}")
-                                    else:
-                                        class_idx = st.selectbox(
-                                            "Pilih indeks kelas:" if st.session_state.language == 'id' else "Select class index:",
-                                            options=range(len(shap_values))
-                                        )
-                                        shap_values_selected = shap_values[class_idx]
-                                        st.success(f"Menampilkan nilai SHAP untuk indeks kelas: {class_idx}" if st.session_state.language == 'id' else 
-                                                f"Displaying SHAP values for class index: {class_idx}")
-                                else:
-                                    shap_values_selected = shap_values
-                            else:
-                                # Gunakan KernelExplainer untuk model lainnya
-                                background = shap.kmeans(st.session_state.X_train[selected_features].sample(min(50, len(st.session_state.X_train)), random_state=42), 5)
-                                explainer = shap.KernelExplainer(st.session_state.model.predict, background)
-                                shap_values_selected = explainer.shap_values(X_sample)
-                            
-                            # Visualisasi SHAP
-                            st.subheader("Visualisasi SHAP" if st.session_state.language == 'id' else "SHAP Visualizations")
-                            
-                            # 1. Summary Plot
-                            st.write("### Summary Plot")
-                            fig, ax = plt.subplots(figsize=(10, 8))
-                            shap.summary_plot(shap_values_selected, X_sample, show=False)
-                            plt.tight_layout()
-                            st.pyplot(fig)
-                            plt.clf()
-                            
-                            # 2. Feature Importance Plot
-                            st.write("### Feature Importance Plot")
+                            shap_result = compute_shap_values(st.session_state.model, prepare_shap_sample(), X_background)
+                        except Exception as e:
+                            st.error(f"Error saat menghitung nilai SHAP: {str(e)}")
+            
+            if shap_result is not None:
+                X_sample = shap_result['X_sample']
+                shap_values = shap_result['shap_values']
+                expected_value = shap_result['expected_value']
+                try:
+                    # Untuk model klasifikasi dengan output multi-kelas
+                    if st.session_state.problem_type == "Classification" and isinstance(shap_values, list):
+                        st.subheader("Pilih Kelas untuk Visualisasi SHAP" if st.session_state.language == 'id' else "Select Class for SHAP Visualization")
+                        if hasattr(st.session_state.model, 'classes_'):
+                            class_names = st.session_state.model.classes_
+                            class_idx = st.selectbox(
+                                "Pilih kelas:" if st.session_state.language == 'id' else "Select class:",
+                                options=range(len(class_names)),
+                                format_func=lambda i: f"{class_names[i]}"
+                            )
+                            shap_values_selected = shap_values[class_idx]
+                            st.success(f"Menampilkan nilai SHAP untuk kelas: {class_names[class_idx]}" if st.session_state.language == 'id' else 
+                                    f"Displaying SHAP values for class: {class_names[class_idx]}")
+                        else:
+                            class_idx = st.selectbox(
+                                "Pilih indeks kelas:" if st.session_state.language == 'id' else "Select class index:",
+                                options=range(len(shap_values))
+                            )
+                            shap_values_selected = shap_values[class_idx]
+                            st.success(f"Menampilkan nilai SHAP untuk indeks kelas: {class_idx}" if st.session_state.language == 'id' else 
+                                    f"Displaying SHAP values for class index: {class_idx}")
+                    else:
+                        shap_values_selected = shap_values
+                    
+                    # Visualisasi SHAP
+                    st.subheader("Visualisasi SHAP" if st.session_state.language == 'id' else "SHAP Visualizations")
+                    
+                    # 1. Summary Plot
+                    st.write("### Summary Plot")
+                    fig, ax = plt.subplots(figsize=(10, 8))
+                    shap.summary_plot(shap_values_selected, X_sample, show=False)
+                    plt.tight_layout()
+                    st.pyplot(fig)
+                    plt.clf()
+                    
+                    # 2. Feature Importance Plot
+                    st.write("### Feature Importance Plot")
+                    fig, ax = plt.subplots(figsize=(10, 6))
+                    shap.summary_plot(shap_values_selected, X_sample, plot_type="bar", show=False)
+                    plt.tight_layout()
+                    st.pyplot(fig)
+                    plt.clf()
+                    
+                    # 3. Dependence Plots untuk fitur teratas
+                    st.write("### Dependence Plots")
+                    
+                    # Hitung rata-rata nilai absolut SHAP untuk setiap fitur
+                    if isinstance(shap_values_selected, list):
+                        # Untuk multi-output, ambil output pertama
+                        shap_arr = np.array(shap_values_selected[0], dtype=float)
+                        feature_importance = np.abs(shap_arr).mean(0)
+                    else:
+                        shap_arr = np.array(shap_values_selected, dtype=float)
+                        feature_importance = np.abs(shap_arr).mean(0)
+                    
+                    # Dapatkan indeks fitur terurut berdasarkan kepentingan
+                    top_indices = feature_importance.argsort()[-5:][::-1]
+                    
+                    # Buat dependence plot untuk 5 fitur teratas
+                    for idx in top_indices:
+                        if idx < len(X_sample.columns):  # Pastikan indeks valid
+                            feature_name = X_sample.columns[idx]
                             fig, ax = plt.subplots(figsize=(10, 6))
-                            shap.summary_plot(shap_values_selected, X_sample, plot_type="bar", show=False)
+                            shap.dependence_plot(idx, shap_values_selected, X_sample, show=False, ax=ax)
+                            plt.title(f"Dependence Plot for {feature_name}")
                             plt.tight_layout()
                             st.pyplot(fig)
                             plt.clf()
-                            
-                            # 3. Dependence Plots untuk fitur teratas
-                            st.write("### Dependence Plots")
-                            
-                            # Hitung rata-rata nilai absolut SHAP untuk setiap fitur
-                            if isinstance(shap_values_selected, list):
-                                # Untuk multi-output, ambil output pertama
-                                shap_arr = np.array(shap_values_selected[0], dtype=float)
-                                feature_importance = np.abs(shap_arr).mean(0)
-                            else:
-                                shap_arr = np.array(shap_values_selected, dtype=float)
-                                feature_importance = np.abs(shap_arr).mean(0)
-                            
-                            # Dapatkan indeks fitur terurut berdasarkan kepentingan
-                            top_indices = feature_importance.argsort()[-5:][::-1]
-                            
-                            # Buat dependence plot untuk 5 fitur teratas
-                            for idx in top_indices:
-                                if idx < len(X_sample.columns):  # Pastikan indeks valid
-                                    feature_name = X_sample.columns[idx]
-                                    fig, ax = plt.subplots(figsize=(10, 6))
-                                    shap.dependence_plot(idx, shap_values_selected, X_sample, show=False, ax=ax)
-                                    plt.title(f"Dependence Plot for {feature_name}")
-                                    plt.tight_layout()
-                                    st.pyplot(fig)
-                                    plt.clf()
-                            
-                            # 4. Force Plot untuk sampel individual
-                            st.write("### Force Plot untuk Sampel Individual")
-                            sample_idx = st.slider(
-                                "Pilih indeks sampel:" if st.session_state.language == 'id' else "Select sample index:",
-                                0, len(X_sample) - 1, 0
-                            )
-                            
-                            # Tampilkan data sampel
-                            st.write("Data sampel:" if st.session_state.language == 'id' else "Sample data:")
-                            st.dataframe(X_sample.iloc[[sample_idx]])
-                            
-                            # Force plot
-                            if isinstance(shap_values_selected, list):
-                                # Untuk multi-output, ambil output pertama
-                                force_plot = shap.force_plot(explainer.expected_value[0] if isinstance(explainer.expected_value, list) else explainer.expected_value, 
-                                                        shap_values_selected[0][sample_idx, :], 
-                                                        X_sample.iloc[sample_idx, :], 
-                                                        matplotlib=True,
-                                                        show=False)
-                            else:
-                                force_plot = shap.force_plot(explainer.expected_value if hasattr(explainer, 'expected_value') else 0, 
-                                                        shap_values_selected[sample_idx, :], 
-                                                        X_sample.iloc[sample_idx, :], 
-                                                        matplotlib=True,
-                                                        show=False)
-                            
-                            st.pyplot(force_plot)
-                            
-                        # 5. Waterfall Plot
-                            st.write("### Waterfall Plot")
-                            fig, ax = plt.subplots(figsize=(10, 8))
+                    
+                    # 4. Force Plot untuk sampel individual
+                    st.write("### Force Plot untuk Sampel Individual")
+                    sample_idx = st.slider(
+                        "Pilih indeks sampel:" if st.session_state.language == 'id' else "Select sample index:",
+                        0, len(X_sample) - 1, 0
+                    )
+                    
+                    # Tampilkan data sampel
+                    st.write("Data sampel:" if st.session_state.language == 'id' else "Sample data:")
+                    st.dataframe(X_sample.iloc[[sample_idx]])
+                    
+                    # Force plot
+                    if isinstance(shap_values_selected, list):
+                        # Untuk multi-output, ambil output pertama
+                        force_plot = shap.force_plot(expected_value[0] if isinstance(expected_value, list) else expected_value, 
+                                                shap_values_selected[0][sample_idx, :], 
+                                                X_sample.iloc[sample_idx, :], 
+                                                matplotlib=True,
+                                                show=False)
+                    else:
+                        force_plot = shap.force_plot(expected_value, 
+                                                shap_values_selected[sample_idx, :], 
+                                                X_sample.iloc[sample_idx, :], 
+                                                matplotlib=True,
+                                                show=False)
+                    
+                    st.pyplot(force_plot)
+                    
+                    # 5. Waterfall Plot
+                    st.write("### Waterfall Plot")
+                    fig, ax = plt.subplots(figsize=(10, 8))
 
-                            if isinstance(shap_values_selected, list):
-                                # Untuk multi-output, ambil output dan expected_value untuk kelas pertama
-                                shap.plots._waterfall.waterfall_legacy(
-                                    explainer.expected_value[0] if isinstance(explainer.expected_value, (list, np.ndarray)) else explainer.expected_value,
-                                    shap_values_selected[0][sample_idx, :],
-                                    feature_names=X_sample.columns,
-                                    show=False,
-                                    max_display=10
-                                )
-                            else:
-                                shap.plots._waterfall.waterfall_legacy(
-                                    explainer.expected_value if np.isscalar(explainer.expected_value) else explainer.expected_value[0],
-                                    shap_values_selected[sample_idx, :],
-                                    feature_names=X_sample.columns,
-                                    show=False,
-                                    max_display=10
-                                )
+                    if isinstance(shap_values_selected, list):
+                        # Untuk multi-output, ambil output dan expected_value untuk kelas pertama
+                        shap.plots._waterfall.waterfall_legacy(
+                            expected_value[0] if isinstance(expected_value, (list, np.ndarray)) else expected_value,
+                            shap_values_selected[0][sample_idx, :],
+                            feature_names=X_sample.columns,
+                            show=False,
+                            max_display=10
+                        )
+                    else:
+                        shap.plots._waterfall.waterfall_legacy(
+                            expected_value if np.isscalar(expected_value) else expected_value[0],
+                            shap_values_selected[sample_idx, :],
+                            feature_names=X_sample.columns,
+                            show=False,
+                            max_display=10
+                        )
 
-                            plt.tight_layout()
-                            st.pyplot(fig)
-                            plt.clf()
-                            
-                            # Tips untuk interpretasi
-                            st.subheader("Tips untuk Interpretasi" if st.session_state.language == 'id' else "Tips for Interpretation")
-                            st.info("""
-                            - **Summary Plot**: Menunjukkan fitur mana yang paling penting dan bagaimana mereka mempengaruhi prediksi. Warna merah menunjukkan nilai fitur tinggi, biru menunjukkan nilai rendah.
-                            - **Feature Importance**: Menampilkan fitur berdasarkan kepentingannya (rata-rata nilai absolut SHAP).
-                            - **Dependence Plot**: Menunjukkan bagaimana nilai SHAP berubah berdasarkan nilai fitur, membantu mengidentifikasi interaksi.
-                            - **Force Plot**: Menunjukkan kontribusi setiap fitur untuk prediksi sampel individual.
-                            - **Waterfall Plot**: Menunjukkan bagaimana setiap fitur berkontribusi pada prediksi akhir dari nilai dasar.
-                            
-                            Jika menggunakan One-Hot Encoding, fitur kategorikal akan dipecah menjadi beberapa kolom biner.
-                            """ if st.session_state.language == 'id' else """
-                            - **Summary Plot**: Shows which features are most important and how they affect predictions. Red indicates high feature values, blue indicates low values.
-                            - **Feature Importance**: Displays features by importance (average absolute SHAP values).
-                            - **Dependence Plot**: Shows how SHAP values change based on feature values, helping identify interactions.
-                            - **Force Plot**: Shows the contribution of each feature for an individual sample prediction.
-                            - **Waterfall Plot**: Shows how each feature contributes to the final prediction from the base value.
-                            
-                            If using One-Hot Encoding, categorical features will be split into multiple binary columns.
-                            """)
-                            
-                        except Exception as e:
-                            st.error(f"Error saat menghitung nilai SHAP: {str(e)}")
+                    plt.tight_layout()
+                    st.pyplot(fig)
+                    plt.clf()
+                    
+                    # Tips untuk interpretasi
+                    st.subheader("Tips untuk Interpretasi" if st.session_state.language == 'id' else "Tips for Interpretation")
+                    st.info("""
+                    - **Summary Plot**: Menunjukkan fitur mana yang paling penting dan bagaimana mereka mempengaruhi prediksi. Warna merah menunjukkan nilai fitur tinggi, biru menunjukkan nilai rendah.
+                    - **Feature Importance**: Menampilkan fitur berdasarkan kepentingannya (rata-rata nilai absolut SHAP).
+                    - **Dependence Plot**: Menunjukkan bagaimana nilai SHAP berubah berdasarkan nilai fitur, membantu mengidentifikasi interaksi.
+                    - **Force Plot**: Menunjukkan kontribusi setiap fitur untuk prediksi sampel individual.
+                    - **Waterfall Plot**: Menunjukkan bagaimana setiap fitur berkontribusi pada prediksi akhir dari nilai dasar.
+                    
+                    Jika menggunakan One-Hot Encoding, fitur kategorikal akan dipecah menjadi beberapa kolom biner.
+                    """ if st.session_state.language == 'id' else """
+                    - **Summary Plot**: Shows which features are most important and how they affect predictions. Red indicates high feature values, blue indicates low values.
+                    - **Feature Importance**: Displays features by importance (average absolute SHAP values).
+                    - **Dependence Plot**: Shows how SHAP values change based on feature values, helping identify interactions.
+                    - **Force Plot**: Shows the contribution of each feature for an individual sample prediction.
+                    - **Waterfall Plot**: Shows how each feature contributes to the final prediction from the base value.
+                    
+                    If using One-Hot Encoding, categorical features will be split into multiple binary columns.
+                    """)
+                    
+                except Exception as e:
+                    st.error(f"Error saat menampilkan nilai SHAP: {str(e)}" if st.session_state.language == 'id' else f"Error while displaying SHAP values: {str(e)}")
                         
             # Tambahkan dukungan untuk model forecasting
             elif (st.session_state.model is not None and 'is_timeseries' in locals() and is_timeseries):
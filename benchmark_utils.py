@@ -0,0 +1,139 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+from sklearn.base import clone
+from sklearn.ensemble import (BaggingRegressor, GradientBoostingClassifier, GradientBoostingRegressor,
+                              HistGradientBoostingClassifier, HistGradientBoostingRegressor, RandomForestClassifier,
+                              RandomForestRegressor, StackingRegressor, VotingRegressor)
+from sklearn.linear_model import LinearRegression, LogisticRegression
+from sklearn.metrics import accuracy_score, classification_report, confusion_matrix, mean_squared_error, r2_score
+from sklearn.naive_bayes import GaussianNB
+from sklearn.neighbors import KNeighborsClassifier, KNeighborsRegressor
+from sklearn.neural_network import MLPClassifier, MLPRegressor
+from sklearn.tree import DecisionTreeClassifier
+from threadpoolctl import threadpool_limits
+
+from svm_utils import make_svm
+from validation_utils import CrossValidationResult, cv_splits, fit_fold, make_scorers
+
+# State per proses worker (diisi sekali oleh initializer pool)
+_WORKER = {}
+
+
+def benchmark_models(problem_type, n_rows=0):
+    """One estimator per model family of tab4, with the tab4 default settings (SVM/SVR switch to the
+    kernel approximation above EXACT_SVM_MAX_ROWS training rows, like the Auto mode of tab4)"""
+    if problem_type == "Classification":
+        return {
+            "Random Forest": RandomForestClassifier(n_estimators=100, max_depth=10, random_state=42),
+            "Logistic Regression": LogisticRegression(max_iter=1000, random_state=42),
+            "SVM": make_svm("Classification", n_rows),
+            "KNN": KNeighborsClassifier(),
+            "Decision Tree": DecisionTreeClassifier(max_depth=10, random_state=42),
+            "Naive Bayes": GaussianNB(),
+            "Gradient Boosting": GradientBoostingClassifier(random_state=42),
+            "Histogram Gradient Boosting": HistGradientBoostingClassifier(random_state=42),
+            "MLP (Neural Network)": MLPClassifier(max_iter=500, random_state=42)
+        }
+    return {
+        "Random Forest": RandomForestRegressor(n_estimators=100, max_depth=10, random_state=42),
+        "Linear Regression": LinearRegression(),
+        "Gradient Boosting": GradientBoostingRegressor(random_state=42),
+        "Histogram Gradient Boosting": HistGradientBoostingRegressor(random_state=42),
+        "SVR": make_svm("Regression", n_rows),
+        "Bagging Regressor": BaggingRegressor(random_state=42),
+        "Voting Regressor": VotingRegressor([
+            ('rf', RandomForestRegressor(n_estimators=50, random_state=42)),
+            ('lr', LinearRegression())
+        ]),
+        "Stacking Regressor": StackingRegressor(
+            estimators=[('rf', RandomForestRegressor(n_estimators=50, random_state=42)), ('lr', LinearRegression())],
+            final_estimator=LinearRegression(),
+            passthrough=True
+        ),
+        "KNN Regressor": KNeighborsRegressor(),
+        "MLP Regressor": MLPRegressor(max_iter=500, random_state=42)
+    }
+
+
+def _limit_cores(estimator, cores):
+    """Per-job core budget: n_jobs of the estimator (and nested estimators) capped at cores;
+    unset n_jobs (None = 1 core) is left alone"""
+    params = {k: cores for k, v in estimator.get_params().items()
+              if (k == 'n_jobs' or k.endswith('__n_jobs')) and v is not None and (v < 0 or v > cores)}
+    return estimator.set_params(**params) if params else estimator
+
+
+def test_metrics(y_test, y_pred, problem_type, n_features):
+    """The metrics tab4 stores per model in model_results"""
+    if problem_type == "Classification":
+        return {
+            'accuracy': accuracy_score(y_test, y_pred),
+            'confusion_matrix': confusion_matrix(y_test, y_pred),
+            'classification_report': classification_report(y_test, y_pred, output_dict=True, zero_division=0)
+        }
+    mse = mean_squared_error(y_test, y_pred)
+    r2 = r2_score(y_test, y_pred)
+    n = len(y_test)
+    return {
+        'mse': mse,
+        'rmse': np.sqrt(mse),
+        'r2': r2,
+        'adj_r2': 1 - (1 - r2) * (n - 1) / (n - n_features - 1) if n - n_features - 1 > 0 else np.nan
+    }
+
+
+def _init_worker(X_train, y_train, X_test, y_test, splits, problem_type, scoring, cores):
+    """Data and CV splits are sent once per worker, not once per model"""
+    _WORKER.update(X_train=X_train, y_train=y_train, X_test=X_test, y_test=y_test, splits=splits,
+                   problem_type=problem_type, scoring=scoring, cores=cores)
+
+
+def _benchmark_one(name, estimator):
+    """Fit, time the test-set prediction, score, and cross-validate one model family on the shared splits"""
+    w = _WORKER
+    estimator = _limit_cores(clone(estimator), w['cores'])
+    with threadpool_limits(limits=w['cores']):
+        start = time.perf_counter()
+        model = clone(estimator).fit(w['X_train'], w['y_train'])
+        fit_time = time.perf_counter() - start
+        start = time.perf_counter()
+        y_pred = model.predict(w['X_test'])
+        predict_time = time.perf_counter() - start
+
+        cv_result = None
+        if w['splits'] is not None:
+            scorers = make_scorers(estimator, w['scoring'])
+            outputs = [fit_fold(estimator, {}, w['X_train'], w['y_train'], train, test, scorers, True)
+                       for train, test in w['splits']]
+            cv_result = CrossValidationResult(outputs, [test for _, test in w['splits']], len(w['y_train']),
+                                              source="benchmark")
+    return {
+        'model_name': name,
+        'model': model,
+        'y_pred': y_pred,
+        'fit_time': fit_time,
+        'predict_time': predict_time,
+        'predict_ms_per_row': 1000 * predict_time / max(len(y_pred), 1),
+        'cv_result': cv_result,
+        **test_metrics(w['y_test'], y_pred, w['problem_type'], w['X_test'].shape[1])
+    }
+
+
+def run_benchmark(models, X_train, y_train, X_test, y_test, problem_type, cv=None, scoring=None,
+                  cores_per_job=1, n_workers=None):
+    """Train every model concurrently (one process per model, cores_per_job cores each) on identical
+    CV splits; yields (name, result or None, error or None) as soon as each model finishes"""
+    splits = cv_splits(next(iter(models.values())), X_train, y_train, cv) if cv is not None else None
+    n_workers = n_workers or max(1, (os.cpu_count() or 1) // cores_per_job)
+    with ProcessPoolExecutor(max_workers=min(n_workers, len(models)), initializer=_init_worker,
+                             initargs=(X_train, y_train, X_test, y_test, splits, problem_type, scoring,
+                                       cores_per_job)) as pool:
+        futures = {pool.submit(_benchmark_one, name, estimator): name for name, estimator in models.items()}
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result(), None
+            except Exception as e:
+                yield futures[future], None, e
@@ -0,0 +1,97 @@
+import hashlib
+import os
+import pickle
+
+from embedding_utils import matrix_fingerprint
+
+
+def model_signature(model):
+    """Class name plus constructor parameters; search objects include their base estimator's"""
+    if hasattr(model, "get_params"):
+        params = model.get_params(deep=True)
+    else:
+        # BudgetedSearchCV dan sejenisnya: atribut konstruktor (bukan hasil fit atau state privat)
+        params = {k: v for k, v in vars(model).items() if not k.startswith('_') and not k.endswith('_')}
+    return f"{type(model).__module__}.{type(model).__name__}{sorted((k, repr(v)) for k, v in params.items())}"
+
+
+def training_key(model, X_train, y_train, cv=None, scoring=None):
+    """Content address of one training run: data, dtypes, model class/params and CV settings"""
+    digest = hashlib.sha1()
+    digest.update(matrix_fingerprint(X_train).encode())
+    digest.update(repr([str(dtype) for dtype in getattr(X_train, "dtypes", [])]).encode())
+    digest.update(matrix_fingerprint(y_train).encode())
+    digest.update(model_signature(model).encode())
+    digest.update(repr((cv, scoring)).encode())
+    return digest.hexdigest()
+
+
+class TrainingCache:
+    """Fitted models, metrics and fold predictions on local disk, one pickle per training key.
+    Least recently used entries (file mtime, refreshed on every hit) are evicted above max_bytes."""
+
+    def __init__(self, directory="cache/training", max_bytes=1024 ** 3):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            self.misses += 1
+            return None
+        os.utime(path)
+        self.hits += 1
+        return entry
+
+    def put(self, key, entry):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(entry, f)
+        if os.path.getsize(tmp_path) > self.max_bytes:
+            # Satu entri lebih besar dari seluruh cache: tidak disimpan
+            os.remove(tmp_path)
+            return False
+        os.replace(tmp_path, path)
+        self._evict()
+        return True
+
+    def entries(self):
+        """(path, size, last used) of every entry, least recently used first"""
+        if not os.path.isdir(self.directory):
+            return []
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".pkl"):
+                stat = os.stat(os.path.join(self.directory, name))
+                entries.append((os.path.join(self.directory, name), stat.st_size, stat.st_mtime))
+        return sorted(entries, key=lambda entry: entry[2])
+
+    def size(self):
+        return sum(size for _, size, _ in self.entries())
+
+    def _evict(self):
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+
+    def clear(self):
+        for path, _, _ in self.entries():
+            os.remove(path)
+
+
+# Cache bersama untuk hasil pelatihan tab4
+training_cache = TrainingCache()
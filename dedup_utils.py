@@ -0,0 +1,166 @@
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from scipy.sparse.csgraph import connected_components
+
+# Konstanta untuk hashing 64-bit (splitmix64)
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+
+
+def _mix64(values):
+    """Scramble uint64 values (splitmix64 finalizer)"""
+    with np.errstate(over='ignore'):
+        z = values.astype(np.uint64, copy=True)
+        z ^= z >> np.uint64(30)
+        z *= _MIX_1
+        z ^= z >> np.uint64(27)
+        z *= _MIX_2
+        z ^= z >> np.uint64(31)
+    return z
+
+
+def hash_rows(data, key_columns=None, chunk_size=100_000):
+    """Compute a 64-bit hash per row, vectorized and in chunks"""
+    columns = list(key_columns) if key_columns else data.columns.tolist()
+    hashes = np.empty(len(data), dtype=np.uint64)
+    for start in range(0, len(data), chunk_size):
+        chunk = data.iloc[start:start + chunk_size][columns]
+        hashes[start:start + len(chunk)] = pd.util.hash_pandas_object(chunk, index=False).to_numpy()
+    return pd.Series(hashes, index=data.index, name='row_hash')
+
+
+def find_exact_duplicates(data, key_columns=None, keep='first', chunk_size=100_000):
+    """Return (duplicate mask, row hashes) using 64-bit row hashes instead of row comparison"""
+    row_hashes = hash_rows(data, key_columns, chunk_size)
+    return row_hashes.duplicated(keep=keep), row_hashes
+
+
+def exact_duplicate_clusters(row_hashes):
+    """Group rows sharing the same hash into clusters (only clusters with 2+ rows)"""
+    counts = row_hashes.map(row_hashes.value_counts())
+    dup_hashes = row_hashes[counts > 1]
+    if dup_hashes.empty:
+        return pd.DataFrame(columns=['cluster_id', 'row_index', 'cluster_size'])
+    cluster_ids, _ = pd.factorize(dup_hashes)
+    clusters = pd.DataFrame({
+        'cluster_id': cluster_ids,
+        'row_index': dup_hashes.index,
+        'cluster_size': counts[counts > 1].to_numpy()
+    })
+    return clusters.sort_values(['cluster_id', 'row_index']).reset_index(drop=True)
+
+
+def _record_strings(data, key_columns):
+    """Normalize key columns into one lowercase string per record"""
+    columns = list(key_columns) if key_columns else data.columns.tolist()
+    text = data[columns[0]].astype(str)
+    for col in columns[1:]:
+        text = text + '|' + data[col].astype(str)
+    return text.str.lower().str.replace(r'\s+', ' ', regex=True).str.strip()
+
+
+def _shingle_hashes(texts, shingle_size):
+    """64-bit hash of every character shingle, as a (rows x positions) matrix plus a mask of the
+    valid positions; texts no longer than shingle_size form one (zero-padded) shingle"""
+    codes = np.asarray(texts, dtype=str)
+    width = max(codes.dtype.itemsize // 4, shingle_size)
+    # Kode karakter Unicode per posisi (0 = padding di akhir string)
+    chars = np.zeros((len(codes), width), dtype=np.uint64)
+    if codes.dtype.itemsize:
+        chars[:, :codes.dtype.itemsize // 4] = codes.view(np.uint32).reshape(len(codes), -1)
+    n_positions = width - shingle_size + 1
+    hashes = np.zeros((len(codes), n_positions), dtype=np.uint64)
+    with np.errstate(over='ignore'):
+        for offset in range(shingle_size):
+            hashes = _mix64(hashes ^ chars[:, offset:offset + n_positions])
+    lengths = np.char.str_len(codes)
+    valid = np.arange(n_positions)[None, :] <= np.maximum(lengths - shingle_size, 0)[:, None]
+    return hashes, valid
+
+
+def minhash_signatures(data, key_columns=None, num_perm=64, shingle_size=3, seed=42, chunk_cells=2 ** 22):
+    """Compute MinHash signatures over character shingles of the key columns (vectorized per row chunk)"""
+    rng = np.random.RandomState(seed)
+    seeds = rng.randint(1, np.iinfo(np.int64).max, size=num_perm, dtype=np.int64).astype(np.uint64)
+    texts = _record_strings(data, key_columns).to_numpy(dtype=str)
+
+    signatures = np.full((len(texts), num_perm), np.iinfo(np.uint64).max, dtype=np.uint64)
+    max_length = max((len(text) for text in texts), default=0)
+    chunk_size = max(1, chunk_cells // max(max_length, 1))
+    for start in range(0, len(texts), chunk_size):
+        hashes, valid = _shingle_hashes(texts[start:start + chunk_size], shingle_size)
+        for j, perm_seed in enumerate(seeds):
+            # Posisi di luar string tidak ikut dalam minimum
+            permuted = np.where(valid, _mix64(hashes ^ perm_seed), np.iinfo(np.uint64).max)
+            signatures[start:start + len(hashes), j] = permuted.min(axis=1)
+    return signatures
+
+
+def _bucket_pairs(order, boundaries, max_bucket_pairs):
+    """Candidate (anchor, other) pairs of every LSH bucket: all pairs in buckets up to
+    max_bucket_pairs rows, larger buckets (e.g. many empty records) only against their first member"""
+    group = np.zeros(len(order), dtype=np.int64)
+    group[boundaries] = 1
+    group = np.cumsum(group)
+    starts = np.concatenate([[0], boundaries])
+    sizes = np.diff(np.concatenate([starts, [len(order)]]))
+    size = sizes[group]
+
+    anchors, others = [], []
+    large = np.flatnonzero((size > max_bucket_pairs) & (np.arange(len(order)) != starts[group]))
+    anchors.append(order[starts[group[large]]])
+    others.append(order[large])
+    small = size <= max_bucket_pairs
+    max_small = int(size[small].max()) if small.any() else 0
+    for offset in range(1, max_small):
+        pos = np.flatnonzero(small[:-offset] & (group[:-offset] == group[offset:]))
+        anchors.append(order[pos])
+        others.append(order[pos + offset])
+    return np.concatenate(anchors), np.concatenate(others)
+
+
+def find_near_duplicates(data, key_columns=None, threshold=0.8, num_perm=64, bands=16,
+                         shingle_size=3, seed=42, max_bucket_pairs=200, chunk_size=100_000):
+    """Find near-duplicate clusters with MinHash + LSH banding (no all-pairs comparison)"""
+    if len(data) < 2:
+        return pd.DataFrame(columns=['cluster_id', 'row_index', 'cluster_size'])
+
+    rows_per_band = max(1, num_perm // bands)
+    signatures = minhash_signatures(data, key_columns, num_perm=bands * rows_per_band,
+                                    shingle_size=shingle_size, seed=seed)
+    n = len(signatures)
+
+    pair_keys = []
+    for band in range(bands):
+        band_slice = signatures[:, band * rows_per_band:(band + 1) * rows_per_band]
+        band_keys = pd.util.hash_pandas_object(pd.DataFrame(band_slice), index=False).to_numpy()
+        order = np.argsort(band_keys, kind='stable')
+        # Kandidat = baris yang jatuh ke bucket yang sama pada band ini
+        boundaries = np.flatnonzero(np.diff(band_keys[order])) + 1
+        anchors, others = _bucket_pairs(order, boundaries, max_bucket_pairs)
+        pair_keys.append(np.minimum(anchors, others) * n + np.maximum(anchors, others))
+    # Pasangan yang sama dari beberapa band hanya dibandingkan sekali
+    pair_keys = np.unique(np.concatenate(pair_keys))
+
+    matched = []
+    for start in range(0, len(pair_keys), chunk_size):
+        keys = pair_keys[start:start + chunk_size]
+        similarity = (signatures[keys // n] == signatures[keys % n]).mean(axis=1)
+        matched.append(keys[similarity >= threshold])
+    matched = np.concatenate(matched) if matched else np.empty(0, dtype=np.int64)
+
+    graph = sp.coo_matrix((np.ones(len(matched)), (matched // n, matched % n)), shape=(n, n))
+    _, roots = connected_components(graph, directed=False)
+    root_counts = pd.Series(roots).value_counts()
+    in_cluster = pd.Series(roots).map(root_counts).to_numpy() > 1
+    if not in_cluster.any():
+        return pd.DataFrame(columns=['cluster_id', 'row_index', 'cluster_size'])
+
+    cluster_ids, _ = pd.factorize(roots[in_cluster])
+    clusters = pd.DataFrame({
+        'cluster_id': cluster_ids,
+        'row_index': data.index[in_cluster],
+        'cluster_size': root_counts.loc[roots[in_cluster]].to_numpy()
+    })
+    return clusters.sort_values(['cluster_id', 'row_index']).reset_index(drop=True)
@@ -0,0 +1,270 @@
+import hashlib
+import inspect
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from sklearn.decomposition import PCA, IncrementalPCA
+from sklearn.manifold import TSNE
+from sklearn.neighbors import NearestNeighbors
+
+try:
+    from openTSNE import TSNE as OpenTSNE
+    OPENTSNE_AVAILABLE = True
+except ImportError:
+    OPENTSNE_AVAILABLE = False
+
+PCA_BACKENDS = ["auto", "full", "randomized", "incremental"]
+
+
+def matrix_fingerprint(X):
+    """Content hash of a feature matrix (DataFrame or array), independent of object identity"""
+    digest = hashlib.sha1()
+    if isinstance(X, pd.DataFrame):
+        digest.update(repr(list(X.columns)).encode())
+        digest.update(pd.util.hash_pandas_object(X, index=False).to_numpy().tobytes())
+    else:
+        X = np.ascontiguousarray(X)
+        digest.update(repr((X.shape, str(X.dtype))).encode())
+        digest.update(X.tobytes())
+    return digest.hexdigest()
+
+
+def choose_pca_backend(n_rows, n_features, n_components, memory_budget_mb=512):
+    """incremental if the dense matrix exceeds the memory budget, randomized SVD for large
+    matrices with few components, otherwise the exact (full) SVD"""
+    if n_rows * n_features * 8 > memory_budget_mb * 1024 ** 2:
+        return "incremental"
+    if max(n_rows, n_features) > 500 and n_components < 0.8 * min(n_rows, n_features):
+        return "randomized"
+    return "full"
+
+
+def _row_chunks(n_rows, n_features, n_components, memory_budget_mb):
+    """Row chunk size so one dense float64 chunk uses at most a quarter of the budget"""
+    rows = int(memory_budget_mb * 1024 ** 2 / 4 // (max(n_features, 1) * 8))
+    return max(rows, n_components, 1)
+
+
+def _dense_block(X, start, stop):
+    """Dense rows start:stop; float32 input stays float32"""
+    block = np.asarray(X.iloc[start:stop] if isinstance(X, pd.DataFrame) else X[start:stop])
+    return block if block.dtype in (np.float32, np.float64) else block.astype(np.float64)
+
+
+class PCAProjection:
+    """PCA fitted once per feature matrix with the backend suited to its shape"""
+
+    def __init__(self, n_components, backend="auto", memory_budget_mb=512, random_state=42):
+        self.n_components = n_components
+        self.backend = backend
+        self.memory_budget_mb = memory_budget_mb
+        self.random_state = random_state
+        self.model = None
+        self.input_columns = None
+        self.embedding = None
+
+    @property
+    def explained_variance_ratio_(self):
+        return self.model.explained_variance_ratio_
+
+    @property
+    def component_names(self):
+        return [f"PC{i + 1}" for i in range(self.n_components)]
+
+    def fit_transform(self, X):
+        n_rows, n_features = X.shape
+        self.n_components = min(self.n_components, n_rows, n_features)
+        if self.backend == "auto":
+            self.backend = choose_pca_backend(n_rows, n_features, self.n_components, self.memory_budget_mb)
+        self.input_columns = list(X.columns) if isinstance(X, pd.DataFrame) else None
+
+        if self.backend == "incremental":
+            # Data dimasukkan per chunk; matriks dense penuh tidak pernah dibuat sekaligus
+            chunk = _row_chunks(n_rows, n_features, self.n_components, self.memory_budget_mb)
+            self.model = IncrementalPCA(n_components=self.n_components, batch_size=chunk)
+            for start in range(0, n_rows, chunk):
+                block = _dense_block(X, start, start + chunk)
+                # Chunk terakhir yang lebih kecil dari n_components tidak bisa di-partial_fit
+                if len(block) >= self.n_components:
+                    self.model.partial_fit(block)
+        else:
+            self.model = PCA(n_components=self.n_components, svd_solver=self.backend, random_state=self.random_state)
+            self.model.fit(_dense_block(X, 0, n_rows))
+        self.embedding = self.transform(X)
+        return self.embedding
+
+    def transform(self, X):
+        """Project in row chunks (bounded memory for every backend)"""
+        n_rows, n_features = X.shape
+        chunk = _row_chunks(n_rows, n_features, self.n_components, self.memory_budget_mb)
+        out = np.empty((n_rows, self.n_components), dtype=self.model.components_.dtype)
+        for start in range(0, n_rows, chunk):
+            out[start:start + chunk] = self.model.transform(_dense_block(X, start, start + chunk))
+        return out
+
+    def transform_frame(self, X):
+        """Project a frame with the training columns into a PC1..PCk frame (same index)"""
+        if self.input_columns is not None:
+            X = X[self.input_columns]
+        return pd.DataFrame(self.transform(X), index=X.index, columns=self.component_names)
+
+
+def _sample_rows(n_rows, sample_size, random_state):
+    if not sample_size or sample_size >= n_rows:
+        return np.arange(n_rows)
+    return np.sort(np.random.RandomState(random_state).choice(n_rows, sample_size, replace=False))
+
+
+class TSNEEmbedding:
+    """t-SNE on a row sample (FFT/Barnes-Hut, multi-threaded); remaining rows are placed
+    at the distance-weighted mean embedding of their nearest sampled neighbours"""
+
+    def __init__(self, n_components=3, perplexity=30, learning_rate=200, n_iter=1000, sample_size=5000,
+                 n_neighbors=5, n_jobs=-1, random_state=42):
+        self.n_components = n_components
+        self.perplexity = perplexity
+        self.learning_rate = learning_rate
+        self.n_iter = n_iter
+        self.sample_size = sample_size
+        self.n_neighbors = n_neighbors
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+        self.method = None
+        self.sample_index = None
+        self.embedding = None
+
+    def _fit_sample(self, X_sample, init):
+        perplexity = min(self.perplexity, max(1, (len(X_sample) - 1) / 3))
+        if OPENTSNE_AVAILABLE:
+            # FFT hanya mendukung <= 2 dimensi; 3D memakai Barnes-Hut di openTSNE
+            gradient = "fft" if self.n_components <= 2 else "bh"
+            try:
+                embedding = OpenTSNE(n_components=self.n_components, perplexity=perplexity,
+                                     learning_rate=self.learning_rate, n_iter=self.n_iter, initialization=init,
+                                     negative_gradient_method=gradient, n_jobs=self.n_jobs,
+                                     random_state=self.random_state).fit(X_sample)
+                self.method = f"openTSNE ({gradient})"
+                return np.asarray(embedding)
+            except (TypeError, ValueError):
+                # Versi openTSNE yang tidak mendukung parameter ini: pakai sklearn
+                pass
+        params = {
+            'n_components': self.n_components,
+            'perplexity': perplexity,
+            'learning_rate': self.learning_rate,
+            'init': init,
+            'method': 'barnes_hut',
+            'n_jobs': self.n_jobs,
+            'random_state': self.random_state
+        }
+        # sklearn >= 1.5 mengganti nama n_iter menjadi max_iter
+        iter_param = 'max_iter' if 'max_iter' in inspect.signature(TSNE).parameters else 'n_iter'
+        params[iter_param] = self.n_iter
+        self.method = "sklearn (Barnes-Hut)"
+        return TSNE(**params).fit_transform(X_sample)
+
+    def fit_transform(self, X, init=None):
+        X_values = _dense_block(X, 0, X.shape[0])
+        n_rows = len(X_values)
+        self.sample_index = _sample_rows(n_rows, self.sample_size, self.random_state)
+        X_sample = X_values[self.sample_index]
+        if init is None:
+            init = PCA(n_components=self.n_components, random_state=self.random_state).fit_transform(X_sample)
+        # Inisialisasi PCA diskalakan seperti default t-SNE (std komponen pertama = 1e-4)
+        init = np.asarray(init, dtype=np.float64)
+        init = init / np.std(init[:, 0]) * 1e-4 if np.std(init[:, 0]) > 0 else init
+        sample_embedding = self._fit_sample(X_sample, init)
+
+        self.embedding = np.empty((n_rows, self.n_components))
+        self.embedding[self.sample_index] = sample_embedding
+        rest = np.setdiff1d(np.arange(n_rows), self.sample_index)
+        if len(rest) > 0:
+            nn = NearestNeighbors(n_neighbors=min(self.n_neighbors, len(X_sample)), n_jobs=self.n_jobs).fit(X_sample)
+            distances, neighbours = nn.kneighbors(X_values[rest])
+            weights = 1.0 / np.maximum(distances, 1e-12)
+            weights /= weights.sum(axis=1, keepdims=True)
+            self.embedding[rest] = np.einsum('ij,ijk->ik', weights, sample_embedding[neighbours])
+        return self.embedding
+
+    @property
+    def is_sampled(self):
+        mask = np.zeros(len(self.embedding), dtype=bool)
+        mask[self.sample_index] = True
+        return mask
+
+
+def _nbytes(projection):
+    """Approximate memory of a cached projection: its arrays and those of its fitted model"""
+    total = 0
+    for value in vars(projection).values():
+        if isinstance(value, np.ndarray):
+            total += value.nbytes
+        elif hasattr(value, '__dict__'):
+            total += sum(attr.nbytes for attr in vars(value).values() if isinstance(attr, np.ndarray))
+    return total
+
+
+class ProjectionCache:
+    """Fit each projection once per (feature matrix, method, params); reruns reuse it.
+    Shared by all sessions: least recently used entries are evicted above max_entries or max_bytes."""
+
+    def __init__(self, max_entries=16, max_bytes=256 * 1024 ** 2):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+
+    def cached(self, key, compute):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        # Dihitung di luar lock: sesi lain tidak menunggu fit yang lama (t-SNE memanggil pca() secara bersarang)
+        value = compute()
+        with self._lock:
+            self._entries[key] = value
+            self._sizes[key] = _nbytes(value)
+            while len(self._entries) > 1 and (len(self._entries) > self.max_entries
+                                              or sum(self._sizes.values()) > self.max_bytes):
+                evicted, _ = self._entries.popitem(last=False)
+                self._sizes.pop(evicted)
+        return value
+
+    def pca(self, X, n_components, backend="auto", memory_budget_mb=512, random_state=42):
+        key = (matrix_fingerprint(X), "PCA", n_components, backend, memory_budget_mb, random_state)
+
+        def compute():
+            projection = PCAProjection(n_components, backend, memory_budget_mb, random_state)
+            projection.fit_transform(X)
+            return projection
+
+        return self.cached(key, compute)
+
+    def tsne(self, X, n_components=3, perplexity=30, learning_rate=200, n_iter=1000, sample_size=5000,
+             random_state=42):
+        """Cached t-SNE; the PCA initialisation comes from the same cache when the full matrix is used"""
+        fingerprint = matrix_fingerprint(X)
+        key = (fingerprint, "t-SNE", n_components, perplexity, learning_rate, n_iter, sample_size, random_state)
+
+        def compute():
+            embedding = TSNEEmbedding(n_components, perplexity, learning_rate, n_iter, sample_size,
+                                      random_state=random_state)
+            init = None
+            if not sample_size or sample_size >= X.shape[0]:
+                init = self.pca(X, n_components, random_state=random_state).embedding
+            embedding.fit_transform(X, init=init)
+            return embedding
+
+        return self.cached(key, compute)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+
+
+# Cache bersama untuk proyeksi (visualisasi clustering, visualisasi 3D, reduksi dimensi tab3)
+projections = ProjectionCache()
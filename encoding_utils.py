@@ -0,0 +1,307 @@
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from sklearn.model_selection import KFold
+from sklearn.preprocessing import LabelEncoder, OneHotEncoder, StandardScaler, MaxAbsScaler, RobustScaler
+
+
+def sparse_frame(matrix, index=None, columns=None):
+    """Wrap a scipy sparse matrix as an all-sparse DataFrame (fill value 0, memory ~ nnz)"""
+    csc = sp.csc_matrix(matrix)
+    columns = list(columns) if columns is not None else list(range(csc.shape[1]))
+    arrays = {
+        name: pd.arrays.SparseArray.from_spmatrix(csc[:, j])
+        for j, name in enumerate(columns)
+    }
+    return pd.DataFrame(arrays, index=index if index is not None else pd.RangeIndex(csc.shape[0]))
+
+
+def is_sparse_frame(data):
+    """Check whether every column of a DataFrame is stored sparse"""
+    return (
+        isinstance(data, pd.DataFrame)
+        and data.shape[1] > 0
+        and all(isinstance(dtype, pd.SparseDtype) for dtype in data.dtypes)
+    )
+
+
+def frame_to_csr(data):
+    """Convert an all-sparse DataFrame to a CSR matrix"""
+    return data.sparse.to_coo().tocsr()
+
+
+def sparse_memory_summary(data):
+    """Return (nnz, density, sparse bytes, equivalent dense bytes) for a sparse DataFrame"""
+    n_rows, n_cols = data.shape
+    nnz = int(sum(data[col].array.npoints for col in data.columns))
+    sparse_bytes = int(data.memory_usage(index=False).sum())
+    dense_bytes = n_rows * n_cols * 8
+    density = nnz / (n_rows * n_cols) if n_rows * n_cols > 0 else 0.0
+    return nnz, density, sparse_bytes, dense_bytes
+
+
+def label_encoded(data):
+    """Label-encode text/category columns into a new frame; the input is left untouched.
+    Under copy-on-write only the encoded columns are materialized, the rest stay shared."""
+    columns = data.select_dtypes(include=['object', 'category']).columns
+    if len(columns) == 0:
+        return data
+    # Salinan dangkal + assignment per kolom (assign(**kw) gagal untuk label kolom non-string)
+    out = data.copy(deep=False)
+    for col in columns:
+        out[col] = LabelEncoder().fit_transform(data[col].astype(str))
+    return out
+
+
+def native_categorical_mask(X, categorical_columns, max_categories=255):
+    """Boolean mask of the columns of X that still hold label-encoding codes (non-negative integers
+    below max_categories, e.g. not rescaled), for the categorical_features of histogram gradient
+    boosting; None when there are none"""
+    if is_sparse_frame(X):
+        return None
+    mask = np.zeros(X.shape[1], dtype=bool)
+    for j, col in enumerate(X.columns):
+        if col not in categorical_columns or not pd.api.types.is_numeric_dtype(X[col]):
+            continue
+        values = X[col].dropna().to_numpy()
+        if len(values) and values.min() >= 0 and values.max() < max_categories and np.all(values == np.round(values)):
+            mask[j] = True
+    return mask if mask.any() else None
+
+
+def make_sparse_scaler(method):
+    """Scalers that keep sparsity (no centering)"""
+    if method == "StandardScaler":
+        return StandardScaler(with_mean=False)
+    elif method == "MinMaxScaler":
+        # MinMaxScaler tidak mendukung input sparse; MaxAbsScaler setara untuk data non-negatif
+        return MaxAbsScaler()
+    elif method == "RobustScaler":
+        return RobustScaler(with_centering=False)
+    return None
+
+
+def _stack_passthrough(encoded, data, passthrough_columns, dtype):
+    """Append passthrough columns to an encoded CSR block"""
+    blocks = [encoded]
+    if passthrough_columns:
+        passthrough = data[passthrough_columns].to_numpy(dtype=dtype, na_value=np.nan)
+        blocks.append(sp.csr_matrix(passthrough))
+    return sp.hstack(blocks, format='csr')
+
+
+class SparseOneHotEncoder:
+    """One-hot encode categorical columns straight into CSR, passing other columns through"""
+
+    def __init__(self, drop_first=True, dtype=np.float64):
+        self.drop_first = drop_first
+        self.dtype = dtype
+        self.encoder = None
+        self.categorical_columns = []
+        self.passthrough_columns = []
+        self.feature_names = []
+
+    @property
+    def input_columns(self):
+        return self.categorical_columns + self.passthrough_columns
+
+    @property
+    def categories_(self):
+        if self.encoder is None:
+            return {}
+        return {col: list(cats) for col, cats in zip(self.categorical_columns, self.encoder.categories_)}
+
+    def fit_transform(self, data, categorical_columns):
+        self.categorical_columns = [col for col in data.columns if col in categorical_columns]
+        self.passthrough_columns = [col for col in data.columns if col not in self.categorical_columns]
+        self.encoder = OneHotEncoder(
+            drop='first' if self.drop_first else None,
+            handle_unknown='ignore',
+            sparse_output=True,
+            dtype=self.dtype
+        )
+        self.encoder.fit(data[self.categorical_columns].astype(str))
+        self.feature_names = (
+            list(self.encoder.get_feature_names_out(self.categorical_columns))
+            + self.passthrough_columns
+        )
+        return self.transform(data)
+
+    def transform(self, data, scaler=None):
+        encoded = self.encoder.transform(data[self.categorical_columns].astype(str))
+        matrix = _stack_passthrough(encoded, data, self.passthrough_columns, self.dtype)
+        if scaler is not None:
+            matrix = scaler.transform(matrix)
+        return sparse_frame(matrix, index=data.index, columns=self.feature_names)
+
+
+class HashingEncoder:
+    """Feature hashing of categorical columns into a fixed number of sparse columns"""
+
+    def __init__(self, n_features=256, alternate_sign=True, dtype=np.float64):
+        self.n_features = n_features
+        self.alternate_sign = alternate_sign
+        self.dtype = dtype
+        self.categorical_columns = []
+        self.passthrough_columns = []
+        self.feature_names = []
+        self._categories = {}
+
+    @property
+    def input_columns(self):
+        return self.categorical_columns + self.passthrough_columns
+
+    @property
+    def categories_(self):
+        # Hanya untuk pilihan input; nilai baru tetap bisa di-hash saat prediksi
+        return self._categories
+
+    def _hash_column(self, values, col):
+        """Return (bucket, sign) per row; only unique values are hashed"""
+        codes, uniques = pd.factorize(values.astype(str))
+        keys = np.asarray([f"{col}={value}" for value in uniques], dtype=object)
+        hashed = pd.util.hash_array(keys)
+        buckets = (hashed % np.uint64(self.n_features)).astype(np.int64)[codes]
+        if self.alternate_sign:
+            signs = np.where(hashed >> np.uint64(63), -1.0, 1.0)[codes]
+        else:
+            signs = np.ones(len(codes))
+        return buckets, signs
+
+    def fit_transform(self, data, categorical_columns):
+        self.categorical_columns = [col for col in data.columns if col in categorical_columns]
+        self.passthrough_columns = [col for col in data.columns if col not in self.categorical_columns]
+        self._categories = {col: sorted(data[col].astype(str).unique()) for col in self.categorical_columns}
+        self.feature_names = [f"hash_{i}" for i in range(self.n_features)] + self.passthrough_columns
+        return self.transform(data)
+
+    def transform(self, data, scaler=None):
+        n_rows = len(data)
+        rows, cols, values = [], [], []
+        for col in self.categorical_columns:
+            buckets, signs = self._hash_column(data[col], col)
+            rows.append(np.arange(n_rows))
+            cols.append(buckets)
+            values.append(signs)
+        if rows:
+            # Tabrakan bucket dijumlahkan oleh konversi COO -> CSR
+            encoded = sp.coo_matrix(
+                (np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))),
+                shape=(n_rows, self.n_features), dtype=self.dtype
+            ).tocsr()
+        else:
+            encoded = sp.csr_matrix((n_rows, self.n_features), dtype=self.dtype)
+        matrix = _stack_passthrough(encoded, data, self.passthrough_columns, self.dtype)
+        if scaler is not None:
+            matrix = scaler.transform(matrix)
+        return sparse_frame(matrix, index=data.index, columns=self.feature_names)
+
+
+class TargetEncoder:
+    """Out-of-fold target encoding with smoothing towards the global prior"""
+
+    def __init__(self, smoothing=10.0, n_folds=5, problem_type="Classification", random_state=42, dtype=np.float64):
+        self.smoothing = smoothing
+        self.n_folds = n_folds
+        self.problem_type = problem_type
+        self.random_state = random_state
+        self.dtype = dtype
+        self.categorical_columns = []
+        self.passthrough_columns = []
+        self.feature_names = []
+        self.classes_ = None
+        self.prior_ = None
+        self._categories = {}
+        self._tables = {}
+
+    @property
+    def input_columns(self):
+        return self.categorical_columns + self.passthrough_columns
+
+    @property
+    def categories_(self):
+        return {col: list(cats) for col, cats in self._categories.items()}
+
+    def _target_matrix(self, target):
+        """Regression: (n, 1) target; classification: one column per class (one for binary)"""
+        if self.problem_type == "Regression":
+            self.classes_ = None
+            return target.to_numpy(dtype=np.float64).reshape(-1, 1)
+        codes, classes = pd.factorize(target, sort=True)
+        self.classes_ = list(classes)
+        indicator = np.zeros((len(codes), len(classes)))
+        indicator[np.arange(len(codes)), codes] = 1.0
+        return indicator[:, 1:] if len(classes) == 2 else indicator
+
+    def _output_names(self, col):
+        if self.classes_ is None or len(self.classes_) == 2:
+            return [col]
+        return [f"{col}_te_{cls}" for cls in self.classes_]
+
+    @staticmethod
+    def _category_sums(codes, targets, n_categories):
+        counts = np.bincount(codes, minlength=n_categories).astype(np.float64)
+        sums = np.column_stack([
+            np.bincount(codes, weights=targets[:, j], minlength=n_categories)
+            for j in range(targets.shape[1])
+        ])
+        return sums, counts
+
+    def _smooth(self, sums, counts):
+        return (sums + self.smoothing * self.prior_) / (counts[:, None] + self.smoothing)
+
+    def fit_transform(self, data, categorical_columns, target):
+        self.categorical_columns = [col for col in data.columns if col in categorical_columns]
+        self.passthrough_columns = [col for col in data.columns if col not in self.categorical_columns]
+        targets = self._target_matrix(target)
+        self.prior_ = targets.mean(axis=0)
+
+        n_rows = len(data)
+        folds = list(KFold(n_splits=min(self.n_folds, n_rows), shuffle=True,
+                           random_state=self.random_state).split(np.arange(n_rows)))
+        encoded = {}
+        for col in self.categorical_columns:
+            codes, categories = pd.factorize(data[col].astype(str))
+            n_categories = len(categories)
+            full_sums, full_counts = self._category_sums(codes, targets, n_categories)
+            self._categories[col] = categories
+            # Baris terakhir = prior untuk kategori yang tidak dikenal saat prediksi
+            self._tables[col] = np.vstack([self._smooth(full_sums, full_counts), self.prior_]).astype(self.dtype)
+
+            # Statistik out-of-fold = total dikurangi statistik fold itu sendiri
+            oof = np.empty((n_rows, targets.shape[1]), dtype=self.dtype)
+            for _, fold_idx in folds:
+                fold_sums, fold_counts = self._category_sums(codes[fold_idx], targets[fold_idx], n_categories)
+                table = self._smooth(full_sums - fold_sums, full_counts - fold_counts)
+                oof[fold_idx] = table[codes[fold_idx]]
+            encoded[col] = oof
+
+        self.feature_names = self._assemble_names()
+        return self._assemble(data, encoded)
+
+    def _assemble_names(self):
+        names = []
+        for col in self.input_columns:
+            names.extend(self._output_names(col) if col in self._tables else [col])
+        return names
+
+    def _assemble(self, data, encoded, scaler=None):
+        columns = {}
+        for col in self.input_columns:
+            if col in encoded:
+                for j, name in enumerate(self._output_names(col)):
+                    columns[name] = encoded[col][:, j]
+            else:
+                columns[col] = data[col].to_numpy()
+        result = pd.DataFrame(columns, index=data.index)
+        if scaler is not None:
+            result = pd.DataFrame(scaler.transform(result), index=data.index, columns=result.columns)
+        return result
+
+    def transform(self, data, scaler=None):
+        encoded = {}
+        for col in self.categorical_columns:
+            codes = pd.Categorical(data[col].astype(str), categories=self._categories[col]).codes
+            # Kode -1 (kategori baru) jatuh ke baris prior di akhir tabel
+            encoded[col] = self._tables[col][codes]
+        return self._assemble(data, encoded, scaler=scaler)
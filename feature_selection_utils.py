@@ -0,0 +1,512 @@
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import parent_process, shared_memory
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import (GradientBoostingClassifier, GradientBoostingRegressor,
+                              RandomForestClassifier, RandomForestRegressor)
+from sklearn.feature_selection import mutual_info_classif, mutual_info_regression
+from sklearn.linear_model import Lasso, LinearRegression, LogisticRegression
+from sklearn.model_selection import KFold, StratifiedKFold, train_test_split
+
+
+def _default_jobs():
+    """All cores in the main process; 1 inside a pool worker so pools are never nested"""
+    return 1 if parent_process() is not None else (os.cpu_count() or 1)
+
+
+def _integer_codes(values):
+    """Factorize to 0..k-1 codes; missing values get their own code"""
+    codes, uniques = pd.factorize(values)
+    codes[codes < 0] = len(uniques)
+    return codes
+
+
+def _contingency_mi(x_codes, y_codes):
+    """Exact MI (nats) of two discrete variables from their contingency table"""
+    n_x, n_y = x_codes.max() + 1, y_codes.max() + 1
+    joint = np.bincount(x_codes * n_y + y_codes, minlength=n_x * n_y).reshape(n_x, n_y) / len(x_codes)
+    px = joint.sum(axis=1, keepdims=True)
+    py = joint.sum(axis=0, keepdims=True)
+    nonzero = joint > 0
+    return float(np.sum(joint[nonzero] * np.log(joint[nonzero] / (px @ py)[nonzero])))
+
+
+def _knn_mi_chunk(X_chunk, y, problem_type, random_state):
+    """kNN MI estimate for a block of continuous features (runs in a worker process)"""
+    if problem_type == "Regression":
+        return mutual_info_regression(X_chunk, y, discrete_features=False, random_state=random_state)
+    return mutual_info_classif(X_chunk, y, discrete_features=False, random_state=random_state)
+
+
+def discrete_feature_mask(X, max_unique=32):
+    """Non-numeric columns and integer/bool columns with few distinct values are treated as discrete"""
+    mask = []
+    for col in X.columns:
+        dtype = X[col].dtype
+        if isinstance(dtype, pd.SparseDtype):
+            dtype = dtype.subtype
+        if not pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_bool_dtype(dtype):
+            mask.append(True)
+        elif pd.api.types.is_integer_dtype(dtype):
+            mask.append(X[col].nunique() <= max_unique)
+        else:
+            # Float hasil one-hot/encoding (mis. 0/1) juga diskrit
+            mask.append(X[col].nunique() <= 2)
+    return np.array(mask, dtype=bool)
+
+
+def _sample_rows(y, problem_type, sample_size, seed):
+    n_rows = len(y)
+    if not sample_size or sample_size >= n_rows:
+        return np.arange(n_rows)
+    if problem_type != "Regression":
+        try:
+            sample, _ = train_test_split(np.arange(n_rows), train_size=sample_size, stratify=y, random_state=seed)
+            return np.sort(sample)
+        except ValueError:
+            # Kelas terlalu kecil untuk stratifikasi
+            pass
+    return np.sort(np.random.RandomState(seed).choice(n_rows, sample_size, replace=False))
+
+
+def parallel_mutual_information(X, y, problem_type, n_jobs=None, sample_size=None, n_repeats=1,
+                                n_bins=32, random_state=42):
+    """Mutual information per feature: contingency path for discrete features, kNN estimator
+    split across worker processes for continuous ones, optionally averaged over row subsamples"""
+    y = np.asarray(y)
+    n_jobs = n_jobs or _default_jobs()
+    discrete = discrete_feature_mask(X)
+    continuous_columns = X.columns[~discrete]
+    discrete_columns = X.columns[discrete]
+    n_repeats = n_repeats if sample_size else 1
+
+    totals = pd.Series(0.0, index=X.columns)
+    for repeat in range(n_repeats):
+        rows = _sample_rows(y, problem_type, sample_size, random_state + repeat)
+        y_sample = y[rows]
+
+        if len(discrete_columns) > 0:
+            if problem_type == "Regression":
+                # Target kontinu didiskretisasi ke bin kuantil untuk jalur kontingensi
+                y_codes = _integer_codes(pd.qcut(y_sample, q=n_bins, labels=False, duplicates='drop'))
+            else:
+                y_codes = _integer_codes(y_sample)
+            for col in discrete_columns:
+                x_codes = _integer_codes(X[col].iloc[rows].to_numpy())
+                totals[col] += _contingency_mi(x_codes, y_codes)
+
+        if len(continuous_columns) > 0:
+            X_continuous = X[continuous_columns].iloc[rows].to_numpy(dtype=np.float64)
+            chunks = np.array_split(np.arange(len(continuous_columns)), min(n_jobs, len(continuous_columns)))
+            if n_jobs > 1 and len(chunks) > 1:
+                with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+                    futures = [pool.submit(_knn_mi_chunk, X_continuous[:, chunk], y_sample, problem_type,
+                                           random_state + repeat) for chunk in chunks]
+                    scores = np.concatenate([future.result() for future in futures])
+            else:
+                scores = _knn_mi_chunk(X_continuous, y_sample, problem_type, random_state + repeat)
+            totals[continuous_columns] += scores
+
+    return totals / n_repeats
+
+
+def _mutual_information(X, y, problem_type, sample_size=None, n_repeats=1):
+    return parallel_mutual_information(X, y, problem_type, sample_size=sample_size, n_repeats=n_repeats)
+
+
+def _pearson_correlation(X, y, problem_type):
+    numeric_columns = X.select_dtypes(include=[np.number]).columns
+    if y.dtype not in [np.float64, np.int64, np.float32, np.int32]:
+        return pd.Series(np.nan, index=numeric_columns)
+    return X[numeric_columns].corrwith(y).abs()
+
+
+def _lasso(X, y, problem_type, alpha=0.01, C=1.0):
+    if problem_type == "Regression":
+        model = Lasso(alpha=alpha, max_iter=1000)
+    else:
+        model = LogisticRegression(penalty='l1', solver='liblinear', max_iter=500, C=C)
+    model.fit(X, y)
+    coef = model.coef_
+    return coef[0] if coef.ndim > 1 else coef
+
+
+def _gradient_boosting(X, y, problem_type):
+    if problem_type == "Regression":
+        model = GradientBoostingRegressor(random_state=42)
+    else:
+        model = GradientBoostingClassifier(random_state=42)
+    model.fit(X, y)
+    return model.feature_importances_
+
+
+def _random_forest_model(X, y, problem_type, n_estimators=100):
+    # Satu core per forest di dalam worker pool (mis. bootstrap stabilitas) agar CPU tidak oversubscribed
+    if problem_type == "Regression":
+        model = RandomForestRegressor(n_estimators=n_estimators, random_state=42, n_jobs=_default_jobs())
+    else:
+        model = RandomForestClassifier(n_estimators=n_estimators, random_state=42, n_jobs=_default_jobs())
+    return model.fit(X, y)
+
+
+def _random_forest(X, y, problem_type, n_estimators=100):
+    return _random_forest_model(X, y, problem_type, n_estimators).feature_importances_
+
+
+def make_rfe_estimator(name, problem_type):
+    """Estimators used by the RFE paths in tab3"""
+    if name == "random_forest":
+        # RFECV menjalankan fold di worker pool: di sana satu core per forest
+        if problem_type == "Regression":
+            return RandomForestRegressor(n_estimators=100, random_state=42, n_jobs=_default_jobs())
+        return RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=_default_jobs())
+    if problem_type == "Regression":
+        return LinearRegression()
+    return LogisticRegression(max_iter=500)
+
+
+def _estimator_importances(estimator):
+    if hasattr(estimator, "feature_importances_"):
+        return np.asarray(estimator.feature_importances_)
+    coef = np.asarray(estimator.coef_)
+    # Sama seperti RFE sklearn: norma L1 antar kelas untuk koefisien 2D
+    return np.abs(coef) if coef.ndim == 1 else np.linalg.norm(coef, axis=0, ord=1)
+
+
+def _elimination_step(step, n_remaining):
+    """Integer step removes a fixed count; fractional step removes a share of the remaining features"""
+    if 0 < step < 1:
+        return max(1, int(step * n_remaining))
+    return max(1, int(step))
+
+
+def _elimination_path(X, y, estimator_name, problem_type, step, X_val=None, y_val=None,
+                      initial_importances=None, initial_keep=None):
+    """Run elimination down to one feature; return ranking (1 = best) and validation score per subset size.
+    Importances already computed on all columns (initial_importances) serve as the first round, keeping
+    initial_keep features; that round is not scored on the validation data."""
+    X = np.asarray(X, dtype=np.float64)
+    remaining = np.arange(X.shape[1])
+    ranking = np.empty(X.shape[1], dtype=np.int64)
+    scores = {}
+    while len(remaining) > 0:
+        if initial_importances is not None:
+            importances, initial_importances = np.asarray(initial_importances), None
+            n_drop = len(remaining) - max(1, min(initial_keep, len(remaining)))
+        else:
+            estimator = make_rfe_estimator(estimator_name, problem_type)
+            estimator.fit(X[:, remaining], y)
+            importances = _estimator_importances(estimator)
+            n_drop = min(_elimination_step(step, len(remaining)), len(remaining) - 1)
+            if X_val is not None:
+                scores[len(remaining)] = estimator.score(np.asarray(X_val, dtype=np.float64)[:, remaining], y_val)
+        if len(remaining) == 1:
+            ranking[remaining[0]] = 1
+            break
+        if n_drop == 0:
+            continue
+        order = np.argsort(importances, kind='stable')
+        dropped = remaining[order[:n_drop]]
+        # Fitur yang dibuang paling awal mendapat peringkat terburuk
+        ranking[dropped] = len(remaining) - np.arange(n_drop)
+        remaining = remaining[np.sort(order[n_drop:])]
+    return ranking, scores
+
+
+def _rfe_ranking(X, y, problem_type, estimator="linear", step=1):
+    ranking, _ = _elimination_path(X, np.asarray(y), estimator, problem_type, step)
+    return ranking
+
+
+def _rfe_fold(X_train, y_train, X_val, y_val, estimator_name, problem_type, step):
+    return _elimination_path(X_train, y_train, estimator_name, problem_type, step, X_val, y_val)[1]
+
+
+def rfecv_scores(X, y, problem_type, estimator="linear", step=1, cv=5, n_jobs=None, random_state=42):
+    """RFECV with folds evaluated in parallel; each fold scores every subset size on its own path"""
+    X_values = X.to_numpy(dtype=np.float64)
+    y_values = np.asarray(y)
+    if problem_type == "Regression":
+        splitter = KFold(n_splits=cv, shuffle=True, random_state=random_state)
+    else:
+        splitter = StratifiedKFold(n_splits=cv, shuffle=True, random_state=random_state)
+    folds = list(splitter.split(X_values, y_values))
+    n_jobs = min(n_jobs or _default_jobs(), len(folds))
+    args = [(X_values[train], y_values[train], X_values[val], y_values[val], estimator, problem_type, step)
+            for train, val in folds]
+    if n_jobs > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            fold_scores = list(pool.map(_rfe_fold, *zip(*args)))
+    else:
+        fold_scores = [_rfe_fold(*fold_args) for fold_args in args]
+    scores = pd.DataFrame(fold_scores).T.sort_index()
+    scores.index.name = 'n_features'
+    return pd.DataFrame({'mean_score': scores.mean(axis=1), 'std_score': scores.std(axis=1)})
+
+
+def _rfecv(X, y, problem_type, estimator="linear", step=1, cv=5):
+    return rfecv_scores(X, y, problem_type, estimator=estimator, step=step, cv=cv)
+
+
+SCORERS = {
+    "Mutual Information": _mutual_information,
+    "Pearson Correlation": _pearson_correlation,
+    "LASSO": _lasso,
+    "Gradient Boosting Importance": _gradient_boosting,
+    "Random Forest Importance": _random_forest,
+    "RFE Ranking": _rfe_ranking,
+    "RFECV": _rfecv
+}
+
+
+def dataset_fingerprint(X, y):
+    """Content hash of features + target (dataset version), independent of object identity"""
+    digest = hashlib.sha1()
+    digest.update(repr(list(X.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(X, index=False).to_numpy().tobytes())
+    digest.update(pd.util.hash_pandas_object(pd.Series(np.asarray(y)), index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _nbytes(value):
+    """Approximate memory of a cached score vector / ranking"""
+    if isinstance(value, (pd.Series, pd.DataFrame)):
+        return int(np.sum(value.memory_usage(deep=True)))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    return len(pickle.dumps(value))
+
+
+class FeatureScoreCache:
+    """Compute each feature scorer once per (dataset version, target, feature set, params).
+    Only score vectors and rankings are stored (never fitted models); least recently used
+    entries are evicted above max_entries or max_bytes."""
+
+    def __init__(self, max_entries=64, max_bytes=64 * 1024 ** 2):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self.hits = 0
+        self.misses = 0
+
+    def cached(self, key, compute):
+        """Return the stored value for key, computing and storing it on a miss"""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = self._entries[key]
+        else:
+            self.misses += 1
+            value = compute()
+            self._entries[key] = value
+            self._sizes[key] = _nbytes(value)
+            while len(self._entries) > 1 and (len(self._entries) > self.max_entries
+                                              or sum(self._sizes.values()) > self.max_bytes):
+                evicted, _ = self._entries.popitem(last=False)
+                self._sizes.pop(evicted)
+        return value.copy() if isinstance(value, (pd.Series, pd.DataFrame)) else value
+
+    def get(self, X, y, method, problem_type, fingerprint=None, **params):
+        """Return scores as a Series indexed by feature; thresholds/top-N only filter this.
+        Pass the fingerprint of a parent frame to skip re-hashing a column subset of it."""
+        key = (fingerprint or dataset_fingerprint(X, y), tuple(X.columns), method, problem_type,
+               tuple(sorted(params.items())))
+
+        def compute():
+            scores = SCORERS[method](X, y, problem_type, **params)
+            if isinstance(scores, np.ndarray):
+                scores = pd.Series(scores, index=X.columns)
+            return scores
+
+        return self.cached(key, compute)
+
+    def rfe_select(self, X, y, problem_type, n_features, estimator="linear", step=1):
+        """Top-n features from the cached full elimination ranking (no refit when n changes)"""
+        ranking = self.get(X, y, "RFE Ranking", problem_type, estimator=estimator, step=step)
+        return ranking, ranking.nsmallest(n_features).index.tolist()
+
+    def clear(self):
+        self._entries.clear()
+        self._sizes.clear()
+
+
+# Cache bersama untuk semua metode seleksi fitur
+feature_scores = FeatureScoreCache()
+
+
+def multi_stage_select(X, y, problem_type, ig_percent, rf_percent, n_final, mi_params=None, step=1,
+                       cache=feature_scores):
+    """Information Gain -> Random Forest importance -> RFE, with every stage output cached by its inputs.
+    The stage-2 importances are reused as the first RFE round, so only the RFE tail refits."""
+    fingerprint = dataset_fingerprint(X, y)
+
+    # Tahap 1: top-k skor mutual information (urutan kolom dipertahankan)
+    mi_scores = cache.get(X, y, "Mutual Information", problem_type, fingerprint=fingerprint, **(mi_params or {}))
+    n_ig = max(1, int(X.shape[1] * ig_percent / 100))
+    ig_features = X.columns[X.columns.isin(mi_scores.nlargest(n_ig).index)]
+
+    # Tahap 2: importance forest pada fitur hasil IG (dipakai ulang sebagai ronde pertama tahap 3)
+    X_ig = X[ig_features]
+    forest_importances = cache.get(X_ig, y, "Random Forest Importance", problem_type, fingerprint=fingerprint, n_estimators=100)
+    rf_importances = forest_importances.sort_values(ascending=False)
+    n_rf = max(1, int(len(ig_features) * rf_percent / 100))
+    rf_features = rf_importances.head(n_rf).index.tolist()
+
+    stages = {
+        'mi_scores': mi_scores,
+        'ig_features': list(ig_features),
+        'rf_importances': rf_importances,
+        'rf_features': rf_features,
+        'rfe_ranking': None
+    }
+    if len(rf_features) < 2:
+        # RFE membutuhkan minimal 2 fitur
+        stages['n_final'] = min(n_final, len(rf_features))
+        stages['final_features'] = rf_features
+        return stages
+
+    # Tahap 3: ranking RFE penuh; ronde pertama = importance tahap 2 (pangkas ke n_rf fitur)
+    key = (fingerprint, tuple(ig_features), "Staged RFE Ranking", problem_type, n_rf, step)
+    ranking = cache.cached(key, lambda: pd.Series(
+        _elimination_path(X_ig, np.asarray(y), "random_forest", problem_type, step,
+                          initial_importances=forest_importances.to_numpy(), initial_keep=n_rf)[0],
+        index=ig_features
+    ))
+    n_final = max(2, min(n_final, len(rf_features)))
+    selected = set(ranking.nsmallest(n_final).index)
+    stages['rfe_ranking'] = ranking
+    stages['n_final'] = n_final
+    stages['final_features'] = [f for f in rf_features if f in selected]
+    return stages
+
+
+# Metode yang didukung analisis stabilitas (nama sesuai pilihan di tab3)
+STABILITY_METHODS = {
+    "Mutual Information": "Mutual Information",
+    "Recursive Feature Elimination (RFE)": "RFE Ranking",
+    "LASSO": "LASSO",
+    "Random Forest Importance": "Random Forest Importance",
+    "Multi-Stage Feature Selection": "Multi-Stage"
+}
+
+# State per proses worker bootstrap (diisi sekali oleh initializer pool)
+_STABILITY_WORKER = {}
+
+
+def _select_subset(X, y, method, problem_type, n_features, params):
+    """Features one method selects on one sample, as a boolean mask over X.columns"""
+    if method == "Multi-Stage":
+        # Cache kecil per sampel: tiap resample adalah versi data yang berbeda
+        stages = multi_stage_select(X, y, problem_type, cache=FeatureScoreCache(max_entries=4), **params)
+        return X.columns.isin(stages['final_features'])
+    scores = SCORERS[method](X, y, problem_type, **params)
+    scores = pd.Series(np.asarray(scores), index=X.columns)
+    if method == "RFE Ranking":
+        return X.columns.isin(scores.nsmallest(n_features).index)
+    if method == "LASSO":
+        # Sama seperti tab3: LASSO memilih semua fitur dengan koefisien non-nol
+        return (scores != 0).to_numpy()
+    return X.columns.isin(scores.abs().nlargest(n_features).index)
+
+
+def _bootstrap_rows(n_rows, seed):
+    return np.random.RandomState(seed).randint(0, n_rows, n_rows)
+
+
+def _bootstrap_selection(X, y, resample, method, problem_type, n_features, params, random_state):
+    rows = _bootstrap_rows(len(y), random_state + resample)
+    X_boot = X.iloc[rows].reset_index(drop=True)
+    y_boot = pd.Series(np.asarray(y)[rows], name=getattr(y, 'name', None))
+    return resample, _select_subset(X_boot, y_boot, method, problem_type, n_features, params)
+
+
+def _init_stability_worker(shm_name, shape, columns, dtypes, y, config):
+    """Attach the shared feature matrix once per worker and rebuild the frame with its dtypes"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    values = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+    _STABILITY_WORKER['shm'] = shm
+    _STABILITY_WORKER['X'] = pd.DataFrame(values, columns=columns, copy=False).astype(dtypes)
+    _STABILITY_WORKER['y'] = y
+    _STABILITY_WORKER['config'] = config
+
+
+def _worker_bootstrap_selection(resample):
+    return _bootstrap_selection(_STABILITY_WORKER['X'], _STABILITY_WORKER['y'], resample,
+                                **_STABILITY_WORKER['config'])
+
+
+def stability_index(masks):
+    """Nogueira et al. stability of selected subsets (rows = resamples, columns = features).
+    1 = identical subsets every time, ~0 = no better than random subsets of the same size."""
+    masks = np.asarray(masks, dtype=np.float64)
+    n_resamples, n_features = masks.shape
+    if n_resamples < 2:
+        return np.nan
+    frequency = masks.mean(axis=0)
+    mean_size = masks.sum(axis=1).mean()
+    expected = (mean_size / n_features) * (1 - mean_size / n_features)
+    if expected == 0:
+        # Selalu memilih semua fitur atau tidak satu pun: subset identik
+        return 1.0
+    variance = n_resamples / (n_resamples - 1) * frequency * (1 - frequency)
+    return float(1 - variance.mean() / expected)
+
+
+def bootstrap_stability(X, y, problem_type, method, n_features=10, n_bootstrap=50, n_jobs=None,
+                        random_state=42, **params):
+    """Rerun one selection method on bootstrap resamples in a process pool (shared-memory data).
+    Yields the running selection frequency and stability index each time a resample finishes."""
+    method = STABILITY_METHODS.get(method, method)
+    y = np.asarray(y)
+    n_jobs = min(n_jobs or _default_jobs(), n_bootstrap)
+    config = {
+        'method': method,
+        'problem_type': problem_type,
+        'n_features': n_features,
+        'params': params,
+        'random_state': random_state
+    }
+    masks = np.zeros((n_bootstrap, X.shape[1]), dtype=bool)
+    done = []
+
+    def progress(resample, mask):
+        masks[resample] = mask
+        done.append(resample)
+        completed = masks[np.sort(done)]
+        return {
+            'completed': len(done),
+            'n_bootstrap': n_bootstrap,
+            'frequency': pd.Series(completed.mean(axis=0), index=X.columns),
+            'subset_size': float(completed.sum(axis=1).mean()),
+            'stability': stability_index(completed)
+        }
+
+    shm = None
+    pool = None
+    try:
+        if n_jobs > 1:
+            values = X.to_numpy(dtype=np.float64)
+            shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+            np.ndarray(values.shape, dtype=np.float64, buffer=shm.buf)[:] = values
+            pool = ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_stability_worker,
+                                       initargs=(shm.name, values.shape, list(X.columns),
+                                                 X.dtypes.to_dict(), y, config))
+            futures = [pool.submit(_worker_bootstrap_selection, b) for b in range(n_bootstrap)]
+            for future in as_completed(futures):
+                yield progress(*future.result())
+        else:
+            for b in range(n_bootstrap):
+                yield progress(*_bootstrap_selection(X, y, b, **config))
+    finally:
+        if pool is not None:
+            # Konsumen berhenti lebih awal (GeneratorExit): resample yang masih antre dibatalkan, tidak ditunggu
+            pool.shutdown(wait=False, cancel_futures=True)
+        if shm is not None:
+            shm.close()
+            shm.unlink()
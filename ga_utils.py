@@ -0,0 +1,380 @@
+import hashlib
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
+from sklearn.model_selection import KFold, StratifiedKFold, cross_val_score
+
+# State per proses worker (diisi sekali oleh initializer pool)
+_WORKER = {}
+
+
+def _make_forest(problem_type, n_estimators, random_state, n_jobs=1):
+    if problem_type == "Regression":
+        return RandomForestRegressor(n_estimators=n_estimators, random_state=random_state, n_jobs=n_jobs)
+    return RandomForestClassifier(n_estimators=n_estimators, random_state=random_state, n_jobs=n_jobs)
+
+
+def _cv_fitness(X, y, indices, problem_type, cv, n_estimators, random_state):
+    """Raw cross-validated fitness of one feature subset (before penalty)"""
+    model = _make_forest(problem_type, n_estimators, random_state)
+    if problem_type == "Regression":
+        # R^2 agar fitness regresi juga "lebih tinggi = lebih baik" dan sebanding dengan penalty
+        scores = cross_val_score(model, X[:, indices], y, cv=cv, scoring='r2')
+        return np.mean(scores)
+    scores = cross_val_score(model, X[:, indices], y, cv=cv, scoring='accuracy')
+    return np.mean(scores)
+
+
+def _init_worker(shm_name, shape, dtype, y, params):
+    """Attach the shared feature matrix once per worker instead of pickling it per task"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _WORKER['shm'] = shm
+    _WORKER['X'] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    _WORKER['y'] = y
+    _WORKER['params'] = params
+
+
+def _worker_fitness(indices):
+    return _cv_fitness(_WORKER['X'], _WORKER['y'], indices, **_WORKER['params'])
+
+
+class SurrogateScorer:
+    """Closed-form ridge score on fixed folds; per-fold Gram matrices are computed once"""
+
+    def __init__(self, X, y, problem_type, cv=3, alpha=1.0, random_state=42):
+        self.problem_type = problem_type
+        self.alpha = alpha
+        n_rows, n_features = X.shape
+        # Kolom konstan di akhir sebagai intercept (tidak diregularisasi)
+        A = np.hstack([X, np.ones((n_rows, 1))])
+        if problem_type == "Regression":
+            T = np.asarray(y, dtype=np.float64).reshape(-1, 1)
+            splitter = KFold(n_splits=cv, shuffle=True, random_state=random_state)
+            self.labels = None
+        else:
+            # Klasifikasi: ridge one-vs-rest pada target {-1, 1}, prediksi = argmax
+            self.labels, _ = pd.factorize(np.asarray(y), sort=True)
+            T = -np.ones((n_rows, self.labels.max() + 1))
+            T[np.arange(n_rows), self.labels] = 1.0
+            splitter = StratifiedKFold(n_splits=cv, shuffle=True, random_state=random_state)
+        self.intercept = n_features
+        self.folds = []
+        for train_idx, val_idx in splitter.split(X, self.labels if self.labels is not None else None):
+            A_train = A[train_idx]
+            self.folds.append({
+                'gram': A_train.T @ A_train,
+                'moment': A_train.T @ T[train_idx],
+                'A_val': A[val_idx],
+                'T_val': T[val_idx],
+                'labels_val': self.labels[val_idx] if self.labels is not None else None
+            })
+
+    def score(self, indices):
+        columns = np.append(indices, self.intercept)
+        ridge = self.alpha * np.eye(len(columns))
+        ridge[-1, -1] = 0.0
+        scores = []
+        for fold in self.folds:
+            gram = fold['gram'][np.ix_(columns, columns)] + ridge
+            coef = np.linalg.lstsq(gram, fold['moment'][columns], rcond=None)[0]
+            pred = fold['A_val'][:, columns] @ coef
+            if self.labels is None:
+                residual = np.sum((fold['T_val'] - pred) ** 2)
+                total = np.sum((fold['T_val'] - fold['T_val'].mean()) ** 2)
+                scores.append(1.0 - residual / total if total > 0 else 0.0)
+            else:
+                scores.append(np.mean(pred.argmax(axis=1) == fold['labels_val']))
+        return float(np.mean(scores))
+
+
+class EarlyStopping:
+    """Stop when the best fitness has not improved by more than tol for patience generations"""
+
+    def __init__(self, patience=10, tol=1e-4):
+        self.patience = patience
+        self.tol = tol
+        self.best = -np.inf
+        self.stale = 0
+
+    def update(self, best_fitness):
+        if best_fitness > self.best + self.tol:
+            self.best = best_fitness
+            self.stale = 0
+        else:
+            self.stale += 1
+        return self.patience > 0 and self.stale >= self.patience
+
+
+class GAFitnessEvaluator:
+    """Memoized, process-parallel fitness evaluation for GA feature selection"""
+
+    def __init__(self, X, y, problem_type, target_features, cv=3, n_estimators=50,
+                 random_state=42, n_jobs=None, penalty_weight=0.01, surrogate=False, alpha=1.0):
+        self.X = np.ascontiguousarray(X, dtype=np.float64)
+        self.y = np.asarray(y)
+        self.problem_type = problem_type
+        self.target_features = target_features
+        self.penalty_weight = penalty_weight
+        self.n_jobs = n_jobs or os.cpu_count() or 1
+        self.params = {
+            'problem_type': problem_type,
+            'cv': cv,
+            'n_estimators': n_estimators,
+            'random_state': random_state
+        }
+        self.cache = {}
+        self.verified = {}
+        self.best_verified = None
+        self.n_requests = 0
+        self._shm = None
+        self._pool = None
+        self.top_indices = self._importance_ranking()
+        self.surrogate = SurrogateScorer(self.X, self.y, problem_type, cv=cv, alpha=alpha,
+                                         random_state=random_state) if surrogate else None
+
+    def _importance_ranking(self):
+        """Rank features by forest importance once per run (not once per chromosome)"""
+        model = _make_forest(self.problem_type, self.params['n_estimators'],
+                             self.params['random_state'], n_jobs=self.n_jobs)
+        model.fit(self.X, self.y)
+        return np.argsort(model.feature_importances_)[-self.target_features:]
+
+    def _effective_indices(self, solution):
+        selected = np.flatnonzero(np.asarray(solution) == 1)
+        if len(selected) > self.target_features:
+            selected = np.intersect1d(selected, self.top_indices)
+        return selected
+
+    def _mask_key(self, indices):
+        mask = np.zeros(self.X.shape[1], dtype=bool)
+        mask[indices] = True
+        return np.packbits(mask).tobytes()
+
+    def start(self):
+        if self.n_jobs <= 1 or self._pool is not None:
+            return self
+        try:
+            self._shm = shared_memory.SharedMemory(create=True, size=max(self.X.nbytes, 1))
+            shared_X = np.ndarray(self.X.shape, dtype=self.X.dtype, buffer=self._shm.buf)
+            shared_X[:] = self.X
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.n_jobs,
+                initializer=_init_worker,
+                initargs=(self._shm.name, self.X.shape, self.X.dtype, self.y, self.params)
+            )
+        except (OSError, ValueError):
+            # Lingkungan tanpa shared memory / multiprocessing: evaluasi serial
+            self.close()
+        return self
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def n_evaluations(self):
+        return len(self.cache)
+
+    def _penalized(self, score, indices):
+        # Penalty untuk jumlah fitur yang menyimpang dari target
+        return max(0, score - abs(len(indices) - self.target_features) * self.penalty_weight)
+
+    def _forest_scores(self, subsets):
+        if self._pool is not None:
+            return list(self._pool.map(_worker_fitness, subsets))
+        return [_cv_fitness(self.X, self.y, indices, **self.params) for indices in subsets]
+
+    def evaluate_population(self, population):
+        """Fitness for every chromosome; only unseen feature subsets are scored, in parallel"""
+        population = np.atleast_2d(population)
+        keys, pending = [], {}
+        for solution in population:
+            indices = self._effective_indices(solution)
+            key = self._mask_key(indices) if len(indices) > 0 else None
+            keys.append(key)
+            if key is not None and key not in self.cache and key not in pending:
+                pending[key] = indices
+        self.n_requests += len(population)
+
+        if pending:
+            subsets = list(pending.values())
+            if self.surrogate is not None:
+                scores = [self.surrogate.score(indices) for indices in subsets]
+            else:
+                scores = self._forest_scores(subsets)
+            for (key, indices), score in zip(pending.items(), scores):
+                self.cache[key] = self._penalized(score, indices)
+
+        return [self.cache[key] if key is not None else 0.0 for key in keys]
+
+    def fitness_func(self, ga_instance, solutions, solution_idx):
+        """PyGAD fitness callback; handles both single solutions and batches (fitness_batch_size)"""
+        solutions = np.asarray(solutions)
+        if solutions.ndim == 1:
+            return self.evaluate_population(solutions)[0]
+        return self.evaluate_population(solutions)
+
+    def verify_elite(self, population, fitness, n_elite=3):
+        """Re-score the surrogate's top chromosomes with the full forest CV; track the best verified one"""
+        order = np.argsort(np.asarray(fitness))[::-1]
+        pending = {}
+        for idx in order[:n_elite]:
+            indices = self._effective_indices(population[idx])
+            if len(indices) == 0:
+                continue
+            key = self._mask_key(indices)
+            if key not in self.verified and key not in pending:
+                pending[key] = (population[idx].copy(), indices)
+        if pending:
+            scores = self._forest_scores([indices for _, indices in pending.values()])
+            for (key, (solution, indices)), score in zip(pending.items(), scores):
+                self.verified[key] = self._penalized(score, indices)
+                if self.best_verified is None or self.verified[key] > self.best_verified[1]:
+                    self.best_verified = (solution, self.verified[key])
+        return self.best_verified
+
+    def state(self):
+        return {'cache': self.cache, 'verified': self.verified, 'best_verified': self.best_verified}
+
+    def restore(self, state):
+        self.cache.update(state.get('cache', {}))
+        self.verified.update(state.get('verified', {}))
+        self.best_verified = state.get('best_verified')
+
+
+def checkpoint_path(X, y, params, directory="checkpoints"):
+    """Checkpoint file keyed by the data and GA settings, so a rerun finds its own run"""
+    digest = hashlib.sha1()
+    digest.update(np.ascontiguousarray(X).tobytes())
+    digest.update(pd.util.hash_array(np.asarray(y).astype(str).astype(object)).tobytes())
+    digest.update(repr(sorted(params.items())).encode())
+    return os.path.join(directory, f"ga_{digest.hexdigest()[:16]}.pkl")
+
+
+def save_checkpoint(path, population, generations_completed, evaluator, fitness_history):
+    """Write population, progress and fitness caches atomically"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    state = {
+        'population': np.asarray(population),
+        'generations_completed': generations_completed,
+        'fitness_history': list(fitness_history),
+        'evaluator': evaluator.state()
+    }
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(state, f)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path):
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+
+def run_genetic_selection(X, y, problem_type, population_size=50, generations=100, mutation_rate=0.1,
+                          crossover_rate=0.7, elite_size=5, target_features=10, surrogate=False,
+                          verify_elite=3, patience=15, checkpoint_file=None, checkpoint_every=0,
+                          resume=False, n_jobs=None, on_generation=None):
+    """PyGAD feature selection with the memoized evaluator, early stopping and checkpoints.
+    on_generation(generation, best_fitness) is called after every generation (the foreground
+    progress bar or a background job's progress report)."""
+    import pygad
+
+    # Evaluator fitness: ranking importance dihitung sekali, hasil di-cache per bitmask kromosom,
+    # dan populasi tiap generasi dievaluasi paralel (data dibagi lewat shared memory)
+    evaluator = GAFitnessEvaluator(X, y, problem_type, target_features, cv=3, n_estimators=50,
+                                   random_state=42, n_jobs=n_jobs, surrogate=surrogate)
+
+    start_generation = 0
+    fitness_history = []
+    initial_population = None
+    checkpoint = load_checkpoint(checkpoint_file) if resume and checkpoint_file else None
+    if checkpoint is not None:
+        evaluator.restore(checkpoint['evaluator'])
+        initial_population = checkpoint['population']
+        start_generation = checkpoint['generations_completed']
+        fitness_history = list(checkpoint['fitness_history'])
+
+    early_stopping = EarlyStopping(patience=patience)
+    for value in fitness_history:
+        early_stopping.update(value)
+
+    ga_instance = pygad.GA(
+        num_generations=max(1, generations - start_generation),
+        initial_population=initial_population,
+        num_parents_mating=population_size // 2,
+        fitness_func=evaluator.fitness_func,
+        fitness_batch_size=population_size,
+        sol_per_pop=population_size,
+        num_genes=X.shape[1],
+        gene_space=[0, 1],
+        init_range_low=0,
+        init_range_high=2,
+        parent_selection_type="tournament",
+        K_tournament=3,
+        crossover_type="single_point",
+        crossover_probability=crossover_rate,
+        mutation_type="random",
+        mutation_probability=mutation_rate,
+        keep_elitism=elite_size,
+        random_seed=42,
+        suppress_warnings=True
+    )
+
+    def after_generation(ga_instance):
+        generation = start_generation + ga_instance.generations_completed
+        best_fitness = ga_instance.best_solution()[1]
+        fitness_history.append(best_fitness)
+        if surrogate:
+            # Fitness populasi sudah di-cache, jadi evaluasi ulang ini murah
+            population_fitness = evaluator.evaluate_population(ga_instance.population)
+            evaluator.verify_elite(ga_instance.population, population_fitness, verify_elite)
+        if checkpoint_file and checkpoint_every > 0 and generation % checkpoint_every == 0:
+            save_checkpoint(checkpoint_file, ga_instance.population, generation, evaluator, fitness_history)
+        if on_generation is not None:
+            on_generation(generation, best_fitness)
+        if early_stopping.update(best_fitness):
+            return "stop"
+
+    ga_instance.on_generation = after_generation
+    with evaluator:
+        ga_instance.run()
+
+    # Run selesai, checkpoint tidak diperlukan lagi
+    if checkpoint_file and os.path.exists(checkpoint_file):
+        os.remove(checkpoint_file)
+
+    if surrogate and evaluator.best_verified is not None:
+        # Hasil akhir diambil dari kromosom yang sudah diverifikasi dengan Random Forest
+        solution, solution_fitness = evaluator.best_verified
+    else:
+        solution, solution_fitness, _ = ga_instance.best_solution()
+    return {
+        'selected_indices': np.where(solution == 1)[0],
+        'solution_fitness': solution_fitness,
+        'fitness_history': fitness_history,
+        'generations_run': start_generation + ga_instance.generations_completed,
+        'n_evaluations': evaluator.n_evaluations,
+        'n_requests': evaluator.n_requests
+    }
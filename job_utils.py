@@ -0,0 +1,253 @@
+import json
+import os
+import pickle
+import shutil
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+ACTIVE_STATUSES = ("queued", "running")
+FINISHED_STATUSES = ("completed", "failed", "cancelled", "interrupted")
+
+
+class JobCancelled(Exception):
+    pass
+
+
+def _write_atomic(path, data, binary=False):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb' if binary else 'w') as f:
+        if binary:
+            pickle.dump(data, f)
+        else:
+            json.dump(data, f, default=str)
+    os.replace(tmp_path, path)
+
+
+def _read_json(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _update(job_dir, **fields):
+    path = os.path.join(job_dir, "job.json")
+    record = _read_json(path) or {}
+    record.update(fields)
+    _write_atomic(path, record)
+    return record
+
+
+class JobContext:
+    """Handed to every job function: progress reports, intermediate results and cancellation checks"""
+
+    def __init__(self, job_dir):
+        self.job_dir = job_dir
+
+    def cancelled(self):
+        return os.path.exists(os.path.join(self.job_dir, "cancel"))
+
+    def check_cancelled(self):
+        if self.cancelled():
+            raise JobCancelled()
+
+    def report(self, progress=None, message=None, partial=None):
+        """Record progress (0-1), a status message and optionally an intermediate result;
+        also the cooperative cancellation point of the job"""
+        self.check_cancelled()
+        fields = {'updated': time.time()}
+        if progress is not None:
+            fields['progress'] = float(min(max(progress, 0.0), 1.0))
+        if message is not None:
+            fields['message'] = message
+        if partial is not None:
+            _write_atomic(os.path.join(self.job_dir, "partial.pkl"), partial, binary=True)
+            fields['has_partial'] = True
+        _update(self.job_dir, **fields)
+
+
+def _run_job(job_dir, func, args, kwargs):
+    """Worker entry point: runs func(context, *args, **kwargs) and stores the outcome in the job table"""
+    context = JobContext(job_dir)
+    try:
+        context.check_cancelled()
+        _update(job_dir, status="running", started=time.time(), pid=os.getpid())
+        result = func(context, *args, **kwargs)
+        _write_atomic(os.path.join(job_dir, "result.pkl"), result, binary=True)
+        _update(job_dir, status="completed", progress=1.0, finished=time.time())
+    except JobCancelled:
+        _update(job_dir, status="cancelled", finished=time.time())
+    except Exception as e:
+        _update(job_dir, status="failed", error=str(e), traceback=traceback.format_exc(), finished=time.time())
+
+
+class JobRunner:
+    """Local job queue: jobs run in a process pool, their state lives in jobs/<id>/job.json so it
+    survives Streamlit reruns and browser reloads; results are pickled next to it.
+    Finished jobs beyond keep_finished per owner, or older than max_age seconds, are deleted."""
+
+    def __init__(self, root="jobs", max_workers=2, keep_finished=10, max_age=7 * 24 * 3600):
+        self.root = root
+        self.max_workers = max_workers
+        self.keep_finished = keep_finished
+        self.max_age = max_age
+        self._pool = None
+        self._futures = {}
+        self._lock = threading.Lock()
+
+    def _executor(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+
+    def _dir(self, job_id):
+        return os.path.join(self.root, job_id)
+
+    def submit(self, kind, name, func, *args, owner=None, meta=None, **kwargs):
+        """Queue func(context, *args, **kwargs) (func must be a picklable top-level function); returns the job id.
+        owner scopes the job to the session that submitted it; meta is stored in the job record."""
+        self.prune(owner)
+        job_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        job_dir = self._dir(job_id)
+        os.makedirs(job_dir, exist_ok=True)
+        _update(job_dir, id=job_id, kind=kind, name=name, owner=owner, status="queued", progress=0.0,
+                message="", created=time.time(), **(meta or {}))
+        with self._lock:
+            try:
+                future = self._executor().submit(_run_job, job_dir, func, args, kwargs)
+            except BrokenProcessPool:
+                # Worker mati (mis. kehabisan memori): pool dibuat ulang
+                self._pool = None
+                future = self._executor().submit(_run_job, job_dir, func, args, kwargs)
+            self._futures[job_id] = future
+        return job_id
+
+    def get(self, job_id):
+        record = _read_json(os.path.join(self._dir(job_id), "job.json"))
+        if record is None:
+            return None
+        future = self._futures.get(job_id)
+        if record['status'] in ACTIVE_STATUSES:
+            if future is None:
+                # Job dari server sebelumnya yang tidak pernah selesai
+                record = _update(self._dir(job_id), status="interrupted", finished=time.time())
+            elif future.done() and future.exception() is not None:
+                # Proses worker berhenti sebelum job sempat mencatat hasilnya
+                record = _update(self._dir(job_id), status="failed", error=str(future.exception()),
+                                 finished=time.time())
+        return record
+
+    def list(self, kind=None, owner=None):
+        """Jobs on disk (of one kind / owner when given), newest first"""
+        if not os.path.isdir(self.root):
+            return []
+        records = [self.get(job_id) for job_id in os.listdir(self.root)]
+        records = [r for r in records if r is not None
+                   and (kind is None or r.get('kind') == kind)
+                   and (owner is None or r.get('owner') == owner)]
+        return sorted(records, key=lambda r: r.get('created', 0), reverse=True)
+
+    def prune(self, owner=None):
+        """Delete finished jobs older than max_age (any owner) and those beyond keep_finished for owner"""
+        now = time.time()
+        kept = 0
+        for record in self.list():
+            if record['status'] not in FINISHED_STATUSES:
+                continue
+            if now - record.get('finished', record.get('created', now)) > self.max_age:
+                self.delete(record['id'])
+            elif record.get('owner') == owner:
+                kept += 1
+                if kept > self.keep_finished:
+                    self.delete(record['id'])
+
+    def _load(self, job_id, filename):
+        path = os.path.join(self._dir(job_id), filename)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+
+    def result(self, job_id):
+        return self._load(job_id, "result.pkl")
+
+    def partial(self, job_id):
+        return self._load(job_id, "partial.pkl")
+
+    def cancel(self, job_id):
+        """Queued jobs are dropped immediately; running jobs stop at their next progress report"""
+        with open(os.path.join(self._dir(job_id), "cancel"), 'w'):
+            pass
+        future = self._futures.get(job_id)
+        if future is not None and future.cancel():
+            _update(self._dir(job_id), status="cancelled", finished=time.time())
+
+    def delete(self, job_id):
+        record = self.get(job_id)
+        if record is not None and record['status'] in FINISHED_STATUSES:
+            shutil.rmtree(self._dir(job_id), ignore_errors=True)
+            self._futures.pop(job_id, None)
+
+
+def train_model_job(context, model, X_train, y_train, cv=None, scoring=None):
+    """Background training: fit (with search progress for tuned models) and cross-validation"""
+    from validation_utils import cross_validation_result
+
+    context.report(0.0, "fitting")
+    start_time = time.time()
+    if hasattr(model, "strategy"):
+        # Pencarian hyperparameter melaporkan progres (dan bisa dibatalkan) di antara batch
+        def on_batch(info):
+            context.report(0.8 * info['progress'], f"{info['n_fits']} fits, best score {info['best_score']:.4f}",
+                           partial={'best_params': info['best_params'], 'best_score': info['best_score']})
+        model.fit(X_train, y_train, callback=on_batch)
+    else:
+        model.fit(X_train, y_train)
+    training_time = time.time() - start_time
+
+    estimator = model.best_estimator_ if hasattr(model, "best_estimator_") else model
+    cv_result = None
+    if cv is not None:
+        context.report(0.8, "cross-validation")
+        cv_result = getattr(model, "cv_result_", None)
+        if cv_result is None or scoring not in cv_result.scores:
+            cv_result = cross_validation_result(estimator, X_train, y_train, cv=cv, scoring=scoring)
+    return {
+        'model': model,
+        'training_time': training_time,
+        'cv_result': cv_result
+    }
+
+
+def shap_values_job(context, model, X_sample, X_background):
+    """Background SHAP: values are computed chunk by chunk, reporting progress between chunks"""
+    from shap_utils import compute_shap_values
+
+    context.report(0.0, "explainer")
+
+    def on_progress(done, total):
+        context.report(done / total, f"{done}/{total} rows")
+
+    return compute_shap_values(model, X_sample, X_background, on_progress=on_progress)
+
+
+def ga_selection_job(context, X, y, problem_type, generations, **params):
+    """Background GA feature selection: progress and best fitness are reported every generation"""
+    from ga_utils import run_genetic_selection
+
+    context.report(0.0, "feature importance ranking")
+
+    def on_generation(generation, best_fitness):
+        context.report(generation / generations, f"generation {generation}/{generations}, best fitness {best_fitness:.4f}",
+                       partial={'generation': generation, 'best_fitness': best_fitness})
+
+    return run_genetic_selection(X, y, problem_type, generations=generations, on_generation=on_generation, **params)
+
+
+# Satu runner per proses server Streamlit (modul di-cache antar rerun)
+jobs = JobRunner()
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.metrics import accuracy_score, f1_score, mean_squared_error, r2_score
+
+# Integer di atas 2^24 tidak bisa direpresentasikan persis oleh float32
+_FLOAT32_EXACT_INT = 2 ** 24
+
+
+def _cast_dtype(series, dtype, target):
+    """Target dtype for one column, or None if the column should be left as is"""
+    sparse = isinstance(dtype, pd.SparseDtype)
+    subtype = dtype.subtype if sparse else dtype
+    if pd.api.types.is_bool_dtype(subtype) or not pd.api.types.is_numeric_dtype(subtype):
+        return None
+    if pd.api.types.is_integer_dtype(subtype) and target == np.float32:
+        values = series.sparse.sp_values if sparse else series.to_numpy()
+        if len(values) and np.abs(values).max() >= _FLOAT32_EXACT_INT:
+            return None
+    if subtype == target:
+        return None
+    return pd.SparseDtype(target, 0) if sparse else target
+
+
+def cast_frame(data, dtype=np.float32, exclude=()):
+    """Cast numeric columns (dense or sparse) to one float dtype; text, bool and large-integer columns are kept"""
+    dtypes = {}
+    for col in data.columns:
+        if col in exclude:
+            continue
+        new_dtype = _cast_dtype(data[col], data[col].dtype, dtype)
+        if new_dtype is not None:
+            dtypes[col] = new_dtype
+    return data.astype(dtypes) if dtypes else data
+
+
+def to_float32(data, exclude=()):
+    return cast_frame(data, np.float32, exclude)
+
+
+def frame_nbytes(data):
+    return int(data.memory_usage(index=False, deep=True).sum())
+
+
+def precision_metrics(y_true, y_pred, problem_type):
+    if problem_type == "Regression":
+        return {
+            "R2": r2_score(y_true, y_pred),
+            "RMSE": np.sqrt(mean_squared_error(y_true, y_pred))
+        }
+    return {
+        "Accuracy": accuracy_score(y_true, y_pred),
+        "F1 (macro)": f1_score(y_true, y_pred, average='macro')
+    }
+
+
+def compare_precision(model, X_train, y_train, X_test, y_test, problem_type):
+    """Refit a clone of the (float32-trained) model on float64 copies and tabulate metric deltas"""
+    metrics32 = precision_metrics(y_test, model.predict(X_test), problem_type)
+    model64 = clone(model)
+    model64.fit(cast_frame(X_train, np.float64), y_train)
+    metrics64 = precision_metrics(y_test, model64.predict(cast_frame(X_test, np.float64)), problem_type)
+    return pd.DataFrame({
+        "Metric": list(metrics32),
+        "float32": list(metrics32.values()),
+        "float64": [metrics64[name] for name in metrics32],
+        "Delta (32 - 64)": [metrics32[name] - metrics64[name] for name in metrics32]
+    })
@@ -0,0 +1,158 @@
+import json
+import os
+import shutil
+import threading
+import time
+
+import joblib
+import numpy as np
+import sklearn
+
+
+def _json_safe(value):
+    """Manifest values: numbers/strings/lists/dicts as is, anything else as its repr"""
+    if isinstance(value, dict):
+        return {str(k): _json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(v) for v in value]
+    if isinstance(value, (str, bool, int, float)) or value is None:
+        return value
+    if hasattr(value, "item"):
+        # Skalar numpy
+        return value.item()
+    return repr(value)
+
+
+def _has_sklearn_trees(model):
+    """Decision trees and tree ensembles (random forest, gradient boosting) of scikit-learn"""
+    estimator = getattr(model, 'best_estimator_', model)
+    if hasattr(estimator, 'tree_'):
+        return True
+    estimators = getattr(estimator, 'estimators_', None)
+    if estimators is None:
+        return False
+    return any(hasattr(member, 'tree_') for member in np.ravel(np.asarray(estimators, dtype=object)))
+
+
+class ModelRegistry:
+    """Versioned model store: models/<name>/v<N>/ holds the compressed estimator (model.joblib),
+    the preprocessing objects (preprocessing.joblib) and a JSON manifest. Loaded models are kept
+    once per server process and shared by every session. Estimators whose parameters are plain
+    arrays (linear models, SVMs, MLPs, histogram gradient boosting) are expanded once into an
+    uncompressed copy and memory-mapped (mmap_mode='r'); sklearn trees copy their node arrays
+    when unpickled (Tree.__setstate__), so tree models are loaded into memory from the compressed
+    artifact instead. Only the newest keep_versions versions of each name are kept."""
+
+    def __init__(self, root="models", compress=3, keep_versions=5):
+        self.root = root
+        self.compress = compress
+        self.keep_versions = keep_versions
+        self._loaded = {}
+        self._lock = threading.Lock()
+
+    def _dir(self, name, version):
+        return os.path.join(self.root, name, f"v{version}")
+
+    def versions(self, name):
+        path = os.path.join(self.root, name)
+        if not os.path.isdir(path):
+            return []
+        return sorted(int(v[1:]) for v in os.listdir(path)
+                      if v.startswith("v") and v[1:].isdigit()
+                      and os.path.exists(os.path.join(path, v, "manifest.json")))
+
+    def list(self):
+        """Manifests of every registered version, newest first"""
+        if not os.path.isdir(self.root):
+            return []
+        manifests = []
+        for name in os.listdir(self.root):
+            for version in self.versions(name):
+                manifests.append(self.manifest(name, version))
+        return sorted(manifests, key=lambda m: m.get('created', 0), reverse=True)
+
+    def manifest(self, name, version=None):
+        version = version or self.versions(name)[-1]
+        with open(os.path.join(self._dir(name, version), "manifest.json")) as f:
+            return json.load(f)
+
+    def register(self, name, model, features=None, preprocessing=None, metrics=None, **metadata):
+        """Store a new version of name; returns its manifest"""
+        with self._lock:
+            version = (self.versions(name) or [0])[-1] + 1
+            directory = self._dir(name, version)
+            os.makedirs(directory)
+        start = time.time()
+        joblib.dump(model, os.path.join(directory, "model.joblib"), compress=self.compress)
+        if preprocessing:
+            joblib.dump(preprocessing, os.path.join(directory, "preprocessing.joblib"), compress=self.compress)
+        manifest = {
+            'name': name,
+            'version': version,
+            'created': time.time(),
+            'model_class': f"{type(model).__module__}.{type(model).__name__}",
+            'params': _json_safe(model.get_params()) if hasattr(model, "get_params") else {},
+            'features': list(features) if features is not None else None,
+            'preprocessing': sorted(preprocessing) if preprocessing else [],
+            'metrics': _json_safe(metrics or {}),
+            'sklearn_version': sklearn.__version__,
+            'artifact_bytes': os.path.getsize(os.path.join(directory, "model.joblib")),
+            'save_seconds': time.time() - start,
+            **_json_safe(metadata)
+        }
+        self._write_manifest(name, version, manifest)
+        self.prune(name)
+        return manifest
+
+    def prune(self, name):
+        """Delete all but the newest keep_versions versions of name (artifacts and memory-mapped copies)"""
+        if not self.keep_versions:
+            return
+        with self._lock:
+            for version in self.versions(name)[:-self.keep_versions]:
+                shutil.rmtree(self._dir(name, version), ignore_errors=True)
+                self._loaded.pop((name, version), None)
+
+    def _write_manifest(self, name, version, manifest):
+        path = os.path.join(self._dir(name, version), "manifest.json")
+        with open(path + ".tmp", 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(path + ".tmp", path)
+
+    def update(self, name, version, **fields):
+        """Add fields (e.g. metrics computed after saving) to an existing manifest"""
+        manifest = self.manifest(name, version)
+        manifest.update(_json_safe(fields))
+        self._write_manifest(name, version, manifest)
+        return manifest
+
+    def _load_estimator(self, name, version):
+        """Memory-mapped estimator, or the in-memory one for sklearn tree models (mmap would not share them)"""
+        directory = self._dir(name, version)
+        path = os.path.join(directory, "model.mmap.joblib")
+        if not os.path.exists(path):
+            model = joblib.load(os.path.join(directory, "model.joblib"))
+            if _has_sklearn_trees(model):
+                return model
+            # Salinan tanpa kompresi (ditulis sekali) agar array-nya bisa di-memory-map
+            joblib.dump(model, path + ".tmp")
+            os.replace(path + ".tmp", path)
+        return joblib.load(path, mmap_mode='r')
+
+    def load(self, name, version=None):
+        """(model, preprocessing, manifest); repeated loads of the same version return the same objects"""
+        version = version or self.versions(name)[-1]
+        key = (name, version)
+        with self._lock:
+            if key not in self._loaded:
+                directory = self._dir(name, version)
+                model = self._load_estimator(name, version)
+                preprocessing_path = os.path.join(directory, "preprocessing.joblib")
+                preprocessing = joblib.load(preprocessing_path) if os.path.exists(preprocessing_path) else {}
+                self._loaded[key] = (model, preprocessing)
+        model, preprocessing = self._loaded[key]
+        return model, preprocessing, self.manifest(name, version)
+
+
+# Registry bersama (satu per proses server Streamlit)
+model_registry = ModelRegistry()
@@ -0,0 +1,235 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+from sklearn.neighbors import NearestNeighbors
+
+try:
+    from pynndescent import NNDescent
+    PYNNDESCENT_AVAILABLE = True
+except ImportError:
+    PYNNDESCENT_AVAILABLE = False
+
+# State per proses worker (diisi sekali oleh initializer pool)
+_WORKER = {}
+
+
+class ClassNeighbourIndex:
+    """One neighbour index per class, built on first query and shared by SMOTE generation and
+    ENN/Tomek cleaning (plain SMOTE only queries, and so only builds, the minority classes)"""
+
+    def __init__(self, X, y, n_neighbors=5, approximate=False, n_jobs=None, random_state=42):
+        self.n_neighbors = n_neighbors
+        self.approximate = approximate and PYNNDESCENT_AVAILABLE
+        self.n_jobs = n_jobs or os.cpu_count() or 1
+        self.random_state = random_state
+        self.X = X
+        self.y = y
+        self.members = {c: np.flatnonzero(y == c) for c in np.unique(y)}
+        self.indexes = {}
+
+    def _index(self, c):
+        if c not in self.indexes:
+            rows = self.members[c]
+            if self.approximate:
+                self.indexes[c] = NNDescent(self.X[rows], n_neighbors=max(self.n_neighbors + 1, 10),
+                                            random_state=self.random_state, n_jobs=self.n_jobs)
+            else:
+                # Query tree dibagi ke thread oleh sklearn; indeks tidak disalin per worker
+                self.indexes[c] = NearestNeighbors(n_jobs=self.n_jobs).fit(self.X[rows])
+        return self.indexes[c]
+
+    def add_samples(self, X_new, y_new):
+        """Append synthetic rows; only the classes that grew are re-indexed (majority index is kept)"""
+        if len(y_new) == 0:
+            return
+        self.X = np.vstack([self.X, X_new])
+        self.y = np.concatenate([self.y, y_new])
+        for c in np.unique(y_new):
+            self.members[c] = np.flatnonzero(self.y == c)
+            self.indexes.pop(c, None)
+
+    def query(self, c, Q, k):
+        """(distances, positions within class c) of the k nearest class-c samples"""
+        k = min(k, len(self.members[c]))
+        if self.approximate:
+            positions, distances = self._index(c).query(Q, k=k)
+            return distances, positions
+        return self._index(c).kneighbors(Q, n_neighbors=k)
+
+    def within_class(self, c, k, chunk_size=50_000):
+        """k nearest same-class neighbours (positions within class c) of every class-c sample, self excluded"""
+        rows = self.members[c]
+        k = min(k, len(rows) - 1)
+        table = np.empty((len(rows), k), dtype=np.int64)
+        for start in range(0, len(rows), chunk_size):
+            block = np.arange(start, min(start + chunk_size, len(rows)))
+            _, positions = self.query(c, self.X[rows[block]], k + 1)
+            table[block] = _drop_self(positions, block, k)
+        return table
+
+    def nearest(self, Q, k, exclude=None, chunk_size=50_000):
+        """k nearest samples over all classes (global row ids), merging the per-class results.
+        exclude: global row id of each query, dropped from its own results (the query itself)."""
+        n_query = len(Q)
+        distances = np.empty((n_query, k))
+        neighbours = np.empty((n_query, k), dtype=np.int64)
+        extra = 1 if exclude is not None else 0
+        for start in range(0, n_query, chunk_size):
+            stop = min(start + chunk_size, n_query)
+            block_dist, block_rows = [], []
+            for c, rows in self.members.items():
+                dist, positions = self.query(c, Q[start:stop], k + extra)
+                block_dist.append(dist)
+                block_rows.append(rows[positions])
+            block_dist = np.hstack(block_dist)
+            block_rows = np.hstack(block_rows)
+            if exclude is not None:
+                block_dist = np.where(block_rows == exclude[start:stop, None], np.inf, block_dist)
+            order = np.argsort(block_dist, axis=1, kind='stable')[:, :k]
+            distances[start:stop] = np.take_along_axis(block_dist, order, axis=1)
+            neighbours[start:stop] = np.take_along_axis(block_rows, order, axis=1)
+        return distances, neighbours
+
+
+def _drop_self(positions, self_positions, k):
+    """Remove each query's own position from its k+1 results (or the farthest one if ties hid it)"""
+    is_self = positions == self_positions[:, None]
+    is_self[~is_self.any(axis=1), -1] = True
+    return positions[~is_self].reshape(len(positions), k)
+
+
+def _smote_chunk(X_class, neighbours, out, offset, n_samples, seed):
+    """Interpolate n_samples synthetic rows into out[offset:offset + n_samples]"""
+    rng = np.random.RandomState(seed)
+    base = rng.randint(0, len(X_class), n_samples)
+    partner = neighbours[base, rng.randint(0, neighbours.shape[1], n_samples)]
+    gap = rng.uniform(size=(n_samples, 1))
+    out[offset:offset + n_samples] = X_class[base] + gap * (X_class[partner] - X_class[base])
+
+
+def _attach(name, shape, dtype):
+    shm = shared_memory.SharedMemory(name=name)
+    _WORKER.setdefault('shm', []).append(shm)
+    return np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _init_worker(class_spec, neighbours_spec, out_spec):
+    """Attach minority samples, their neighbour table and the output buffer once per worker"""
+    _WORKER['X_class'] = _attach(*class_spec)
+    _WORKER['neighbours'] = _attach(*neighbours_spec)
+    _WORKER['out'] = _attach(*out_spec)
+
+
+def _worker_smote_chunk(offset, n_samples, seed):
+    _smote_chunk(_WORKER['X_class'], _WORKER['neighbours'], _WORKER['out'], offset, n_samples, seed)
+
+
+def _shared_copy(array, blocks):
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    blocks.append(shm)
+    shared = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+    shared[:] = array
+    return shared, (shm.name, array.shape, array.dtype)
+
+
+class ScalableResampler:
+    """SMOTE / SMOTEENN / SMOTETomek for large data: per-class neighbour index built once,
+    synthetic rows generated in bounded-memory chunks across worker processes, optional
+    approximate neighbours (PyNNDescent), and cleaning passes that reuse the same index"""
+
+    def __init__(self, method="SMOTE", k_neighbors=5, enn_neighbors=3, chunk_size=50_000,
+                 n_jobs=None, approximate=False, random_state=42):
+        self.method = method
+        self.k_neighbors = k_neighbors
+        self.enn_neighbors = enn_neighbors
+        self.chunk_size = chunk_size
+        self.n_jobs = n_jobs or os.cpu_count() or 1
+        self.approximate = approximate
+        self.random_state = random_state
+        self.index_ = None
+        self.n_synthetic_ = 0
+        self.n_removed_ = 0
+
+    def _generate(self, c, n_new):
+        """Synthetic samples for class c, chunked; workers write straight into a shared output buffer"""
+        X_class = self.index_.X[self.index_.members[c]]
+        neighbours = self.index_.within_class(c, self.k_neighbors, self.chunk_size)
+        chunks = [(offset, min(self.chunk_size, n_new - offset), self.random_state + i)
+                  for i, offset in enumerate(range(0, n_new, self.chunk_size))]
+        if self.n_jobs <= 1 or len(chunks) <= 1:
+            out = np.empty((n_new, X_class.shape[1]), dtype=X_class.dtype)
+            for chunk in chunks:
+                _smote_chunk(X_class, neighbours, out, *chunk)
+            return out
+
+        blocks = []
+        try:
+            _, class_spec = _shared_copy(X_class, blocks)
+            _, neighbours_spec = _shared_copy(neighbours, blocks)
+            out_shm = shared_memory.SharedMemory(create=True, size=max(n_new * X_class.shape[1] * X_class.itemsize, 1))
+            blocks.append(out_shm)
+            out_spec = (out_shm.name, (n_new, X_class.shape[1]), X_class.dtype)
+            with ProcessPoolExecutor(max_workers=min(self.n_jobs, len(chunks)), initializer=_init_worker,
+                                     initargs=(class_spec, neighbours_spec, out_spec)) as pool:
+                list(pool.map(_worker_smote_chunk, *zip(*chunks)))
+            return np.ndarray(out_spec[1], dtype=X_class.dtype, buffer=out_shm.buf).copy()
+        finally:
+            for shm in blocks:
+                shm.close()
+                shm.unlink()
+
+    def _edited_nearest_neighbours(self):
+        """ENN ('all'): drop every sample with a differently labelled sample among its k nearest"""
+        rows = np.arange(len(self.index_.y))
+        _, neighbours = self.index_.nearest(self.index_.X, self.enn_neighbors, exclude=rows,
+                                            chunk_size=self.chunk_size)
+        return (self.index_.y[neighbours] == self.index_.y[:, None]).all(axis=1)
+
+    def _tomek_links(self):
+        """Drop both ends of every Tomek link (mutual nearest neighbours with different labels)"""
+        rows = np.arange(len(self.index_.y))
+        _, nn = self.index_.nearest(self.index_.X, 1, exclude=rows, chunk_size=self.chunk_size)
+        nn = nn[:, 0]
+        linked = (nn[nn] == rows) & (self.index_.y[nn] != self.index_.y)
+        return ~linked
+
+    def fit_resample(self, X, y):
+        columns = X.columns if isinstance(X, pd.DataFrame) else None
+        # Presisi input dipertahankan (float32 tetap float32), kolom integer menjadi float64
+        dtype = np.result_type(*(X.dtypes if columns is not None else [np.asarray(X).dtype]), np.float32)
+        X_values = np.ascontiguousarray(np.asarray(X, dtype=dtype))
+        y_values = np.asarray(y)
+        self.index_ = ClassNeighbourIndex(X_values, y_values, self.k_neighbors, self.approximate,
+                                          self.n_jobs, self.random_state)
+
+        # Strategi 'auto': semua kelas non-mayoritas dinaikkan ke jumlah kelas mayoritas
+        counts = pd.Series(y_values).value_counts()
+        synthetic_X, synthetic_y = [], []
+        for c, count in counts.items():
+            n_new = counts.max() - count
+            if n_new == 0 or count < 2:
+                continue
+            synthetic_X.append(self._generate(c, n_new))
+            synthetic_y.append(np.full(n_new, c, dtype=y_values.dtype))
+        X_new = np.vstack(synthetic_X) if synthetic_X else np.empty((0, X_values.shape[1]), dtype=X_values.dtype)
+        y_new = np.concatenate(synthetic_y) if synthetic_y else np.empty(0, dtype=y_values.dtype)
+        self.n_synthetic_ = len(y_new)
+
+        if self.method in ("SMOTEENN", "SMOTETomek"):
+            # Pembersihan pada data hasil resampling memakai indeks yang sama (hanya kelas minoritas diperbarui)
+            self.index_.add_samples(X_new, y_new)
+            keep = self._edited_nearest_neighbours() if self.method == "SMOTEENN" else self._tomek_links()
+            X_res, y_res = self.index_.X[keep], self.index_.y[keep]
+            self.n_removed_ = int((~keep).sum())
+        else:
+            X_res = np.vstack([X_values, X_new])
+            y_res = np.concatenate([y_values, y_new])
+            self.n_removed_ = 0
+
+        if columns is not None:
+            X_res = pd.DataFrame(X_res, columns=columns)
+        name = y.name if isinstance(y, pd.Series) else None
+        return X_res, pd.Series(y_res, name=name)
@@ -0,0 +1,41 @@
+import numpy as np
+import shap
+
+TREE_MODELS = ['randomforest', 'gradientboosting', 'xgb', 'lgbm', 'catboost', 'decisiontree']
+
+
+def _concat_shap(chunks):
+    """Join per-chunk SHAP values (a list per class for multi-output explainers)"""
+    if isinstance(chunks[0], list):
+        return [np.concatenate([chunk[k] for chunk in chunks]) for k in range(len(chunks[0]))]
+    return np.concatenate(chunks)
+
+
+def compute_shap_values(model, X_sample, X_background, chunk_size=10, on_progress=None):
+    """SHAP values and expected value for X_sample. Tree models use TreeExplainer; the rest use
+    KernelExplainer on a k-means summary of X_background, explained chunk by chunk so that
+    on_progress(rows_done, rows_total) can report (and a background job can be cancelled)."""
+    model_type = type(model).__name__.lower()
+    native_categorical = getattr(model, 'is_categorical_', None) is not None and bool(np.any(model.is_categorical_))
+    if any(tree_model in model_type for tree_model in TREE_MODELS) and not (
+        model_type in ('gradientboostingclassifier', 'histgradientboostingclassifier') or native_categorical
+    ):
+        # TreeExplainer: sekali jalan, cepat
+        explainer = shap.TreeExplainer(model)
+        shap_values = explainer.shap_values(X_sample)
+        if on_progress is not None:
+            on_progress(len(X_sample), len(X_sample))
+        return {'shap_values': shap_values, 'expected_value': explainer.expected_value, 'X_sample': X_sample}
+
+    # KernelExplainer untuk model lain, (Hist)GradientBoostingClassifier (multi-kelas) dan split kategorikal native
+    if any(tree_model in model_type for tree_model in TREE_MODELS) and hasattr(model, 'predict_proba'):
+        predict = model.predict_proba
+    else:
+        predict = model.predict
+    explainer = shap.KernelExplainer(predict, shap.kmeans(X_background, 5))
+    chunks = []
+    for start in range(0, len(X_sample), chunk_size):
+        chunks.append(explainer.shap_values(X_sample.iloc[start:start + chunk_size]))
+        if on_progress is not None:
+            on_progress(min(start + chunk_size, len(X_sample)), len(X_sample))
+    return {'shap_values': _concat_shap(chunks), 'expected_value': explainer.expected_value, 'X_sample': X_sample}
@@ -0,0 +1,182 @@
+import numpy as np
+import scipy.sparse as sp
+from sklearn.base import BaseEstimator, ClassifierMixin, RegressorMixin
+from sklearn.calibration import CalibratedClassifierCV
+from sklearn.kernel_approximation import Nystroem, PolynomialCountSketch, RBFSampler
+from sklearn.model_selection import train_test_split
+from sklearn.svm import SVC, SVR, LinearSVC, LinearSVR
+
+try:
+    from sklearn.frozen import FrozenEstimator
+except ImportError:
+    # scikit-learn < 1.6: kalibrasi model yang sudah di-fit lewat cv='prefit'
+    FrozenEstimator = None
+
+SVM_MODES = ["Auto", "Exact", "Nystroem", "Random Features"]
+# "internal": 5-fold Platt scaling di dalam SVC (hanya mode Exact; aproksimasi memakai sigmoid post-hoc)
+CALIBRATION_METHODS = ["internal", "sigmoid", "isotonic", "none"]
+
+# Di atas jumlah baris ini SVC/SVR exact (O(n²)–O(n³)) diganti aproksimasi kernel + solver linear
+EXACT_SVM_MAX_ROWS = 20000
+
+
+def _resolve_gamma(gamma, X):
+    """'scale' / 'auto' as SVC computes them"""
+    if gamma == "scale":
+        variance = (X.multiply(X)).mean() - X.mean() ** 2 if sp.issparse(X) else np.asarray(X, dtype=np.float64).var()
+        return 1.0 / (X.shape[1] * variance) if variance > 0 else 1.0
+    if gamma == "auto":
+        return 1.0 / X.shape[1]
+    return float(gamma)
+
+
+def _feature_map(kernel, gamma, degree, coef0, approximation, n_components, random_state):
+    """Explicit feature map whose inner products approximate the kernel (None for the linear kernel).
+    Random features: RBFSampler for rbf, PolynomialCountSketch for poly; sigmoid always uses Nystroem."""
+    if kernel == "linear":
+        return None
+    if approximation == "Random Features" and kernel == "rbf":
+        return RBFSampler(gamma=gamma, n_components=n_components, random_state=random_state)
+    if approximation == "Random Features" and kernel == "poly":
+        return PolynomialCountSketch(gamma=gamma, degree=degree, coef0=coef0, n_components=n_components,
+                                     random_state=random_state)
+    return Nystroem(kernel=kernel, gamma=gamma, degree=degree, coef0=coef0, n_components=n_components,
+                    random_state=random_state)
+
+
+class _KernelApproximationMixin:
+    def _transform(self, X):
+        return self.feature_map_.transform(X) if self.feature_map_ is not None else X
+
+    def _fit_feature_map(self, X):
+        self.gamma_ = _resolve_gamma(self.gamma, X)
+        n_components = min(self.n_components, X.shape[0])
+        self.feature_map_ = _feature_map(self.kernel, self.gamma_, self.degree, self.coef0, self.approximation,
+                                         n_components, self.random_state)
+        if self.feature_map_ is not None:
+            self.feature_map_.fit(X)
+        self.n_features_in_ = X.shape[1]
+
+
+class ScalableSVC(_KernelApproximationMixin, ClassifierMixin, BaseEstimator):
+    """SVC for large data: the kernel (rbf/poly/sigmoid) is approximated by an explicit Nystroem or
+    random-feature map and solved with LinearSVC; the linear kernel goes to LinearSVC directly.
+    approximation="Exact" keeps the kernel SVC but without its internal 5-fold Platt scaling.
+    Probabilities come from one post-hoc calibration on a held-out calibration_fraction of the
+    training rows (calibration="none": softmax of the decision function, uncalibrated)."""
+
+    def __init__(self, C=1.0, kernel="rbf", gamma="scale", degree=3, coef0=0.0, approximation="Nystroem",
+                 n_components=500, calibration="sigmoid", calibration_fraction=0.2, max_iter=5000,
+                 random_state=42):
+        self.C = C
+        self.kernel = kernel
+        self.gamma = gamma
+        self.degree = degree
+        self.coef0 = coef0
+        self.approximation = approximation
+        self.n_components = n_components
+        self.calibration = calibration
+        self.calibration_fraction = calibration_fraction
+        self.max_iter = max_iter
+        self.random_state = random_state
+
+    def _svm(self):
+        if self.approximation == "Exact":
+            return SVC(C=self.C, kernel=self.kernel, gamma=self.gamma, degree=self.degree, coef0=self.coef0,
+                       random_state=self.random_state)
+        return LinearSVC(C=self.C, max_iter=self.max_iter, random_state=self.random_state)
+
+    def fit(self, X, y):
+        self.classes_ = np.unique(y)
+        X_fit, y_fit, X_cal, y_cal = X, y, None, None
+        if self.calibration != "none":
+            try:
+                X_fit, X_cal, y_fit, y_cal = train_test_split(X, y, test_size=self.calibration_fraction,
+                                                              stratify=y, random_state=self.random_state)
+            except ValueError:
+                # Kelas dengan terlalu sedikit baris untuk stratifikasi
+                X_fit, X_cal, y_fit, y_cal = train_test_split(X, y, test_size=self.calibration_fraction,
+                                                              random_state=self.random_state)
+        if self.approximation == "Exact":
+            self.feature_map_ = None
+            self.n_features_in_ = X.shape[1]
+        else:
+            self._fit_feature_map(X_fit)
+        self.svm_ = self._svm().fit(self._transform(X_fit), y_fit)
+        self.calibrator_ = None
+        if X_cal is not None:
+            svm = FrozenEstimator(self.svm_) if FrozenEstimator is not None else self.svm_
+            options = {} if FrozenEstimator is not None else {'cv': 'prefit'}
+            self.calibrator_ = CalibratedClassifierCV(svm, method=self.calibration, **options).fit(
+                self._transform(X_cal), y_cal)
+        return self
+
+    def decision_function(self, X):
+        return self.svm_.decision_function(self._transform(X))
+
+    def predict(self, X):
+        return self.svm_.predict(self._transform(X))
+
+    def predict_proba(self, X):
+        if self.calibrator_ is not None:
+            proba = self.calibrator_.predict_proba(self._transform(X))
+            # Kelas yang tidak muncul di data kalibrasi tetap mendapat kolom (probabilitas 0)
+            if proba.shape[1] == len(self.classes_):
+                return proba
+            full = np.zeros((proba.shape[0], len(self.classes_)))
+            full[:, np.searchsorted(self.classes_, self.calibrator_.classes_)] = proba
+            return full
+        scores = self.decision_function(X)
+        if scores.ndim == 1:
+            scores = np.column_stack([-scores, scores])
+        scores = np.exp(scores - scores.max(axis=1, keepdims=True))
+        return scores / scores.sum(axis=1, keepdims=True)
+
+
+class ScalableSVR(_KernelApproximationMixin, RegressorMixin, BaseEstimator):
+    """SVR for large data: Nystroem / random-feature map of the kernel followed by LinearSVR
+    (linear kernel: LinearSVR on the raw features)"""
+
+    def __init__(self, C=1.0, kernel="rbf", gamma="scale", degree=3, coef0=0.0, epsilon=0.1,
+                 approximation="Nystroem", n_components=500, max_iter=5000, random_state=42):
+        self.C = C
+        self.kernel = kernel
+        self.gamma = gamma
+        self.degree = degree
+        self.coef0 = coef0
+        self.epsilon = epsilon
+        self.approximation = approximation
+        self.n_components = n_components
+        self.max_iter = max_iter
+        self.random_state = random_state
+
+    def fit(self, X, y):
+        self._fit_feature_map(X)
+        self.svm_ = LinearSVR(C=self.C, epsilon=self.epsilon, max_iter=self.max_iter,
+                              random_state=self.random_state).fit(self._transform(X), y)
+        return self
+
+    def predict(self, X):
+        return self.svm_.predict(self._transform(X))
+
+
+def resolve_svm_mode(mode, n_rows):
+    """'Auto': exact kernel SVM up to EXACT_SVM_MAX_ROWS training rows, Nystroem above"""
+    if mode != "Auto":
+        return mode
+    return "Exact" if n_rows <= EXACT_SVM_MAX_ROWS else "Nystroem"
+
+
+def make_svm(problem_type, n_rows, mode="Auto", calibration="internal", n_components=500, **params):
+    """SVC/SVR for the tab4 settings (C, kernel, gamma, epsilon, ...). Exact mode with internal
+    calibration is the classic SVC(probability=True); every other choice goes through ScalableSVC/SVR."""
+    mode = resolve_svm_mode(mode, n_rows)
+    if problem_type == "Classification":
+        if mode == "Exact" and calibration == "internal":
+            return SVC(probability=True, random_state=42, **params)
+        calibration = "sigmoid" if calibration == "internal" else calibration
+        return ScalableSVC(approximation=mode, calibration=calibration, n_components=n_components,
+                           random_state=42, **params)
+    if mode == "Exact":
+        return SVR(**params)
+    return ScalableSVR(approximation=mode, n_components=n_components, random_state=42, **params)
@@ -0,0 +1,306 @@
+import math
+import time
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
+from sklearn.base import clone, is_classifier
+from sklearn.model_selection import ParameterGrid
+
+from validation_utils import CrossValidationResult, cv_splits, fit_fold, fit_fold_path, make_scorers
+
+SEARCH_STRATEGIES = ["Grid Search", "Randomized Search", "Successive Halving", "Hyperband"]
+
+
+def _resource_param(estimator, resource):
+    """'auto': n_estimators for ensembles, otherwise the number of training rows"""
+    if resource != "auto":
+        return resource
+    return "n_estimators" if "n_estimators" in estimator.get_params() else "n_samples"
+
+
+def supports_warm_start(estimator):
+    """Ensembles that can add trees/stages to an already fitted model (RF, GB, Bagging, ...)"""
+    params = estimator.get_params()
+    return "warm_start" in params and "n_estimators" in params
+
+
+def _path_key(params):
+    """The parameters of a candidate other than n_estimators (one warm-start path per key)"""
+    return repr(sorted((k, v) for k, v in params.items() if k != "n_estimators"))
+
+
+class BudgetedSearchCV:
+    """Grid search, randomized search, successive halving and Hyperband under a wall-clock and/or
+    fit-count budget. Exposes the GridSearchCV attributes the app uses (best_params_, best_score_,
+    best_estimator_) plus cv_result_: the folds of the winning configuration, so it is never
+    cross-validated a second time. With warm_start, grid/randomized search grows one forest or
+    boosting model per parameter combination and fold through all n_estimators values instead of
+    fitting every value from scratch."""
+
+    def __init__(self, estimator, param_grid, strategy="Randomized Search", cv=5, scoring=None,
+                 report_scoring=None, time_budget=None, max_fits=None, n_candidates=20, resource="auto",
+                 factor=3, min_resource=None, warm_start=True, n_jobs=-1, random_state=42):
+        self.estimator = estimator
+        self.param_grid = param_grid
+        self.strategy = strategy
+        self.cv = cv
+        self.scoring = scoring
+        self.report_scoring = report_scoring
+        self.time_budget = time_budget
+        self.max_fits = max_fits
+        self.n_candidates = n_candidates
+        self.resource = resource
+        self.factor = factor
+        self.min_resource = min_resource
+        self.warm_start = warm_start
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+
+    def _budget_left(self):
+        if self.time_budget and time.time() - self._start >= self.time_budget:
+            return False
+        if self.max_fits and self.n_fits_ >= self.max_fits:
+            return False
+        return True
+
+    def _candidates(self, n, rng):
+        """n distinct random parameter combinations from the grid (all of them if the grid is smaller)"""
+        grid = ParameterGrid(self._grid)
+        order = rng.permutation(len(grid))[:n]
+        return [grid[i] for i in order]
+
+    def _fold_data(self, X, y, resource_value):
+        """(X, y, params override) for one resource level; the full level keeps the original row order"""
+        if resource_value is None or resource_value >= self._max_resource:
+            resource_value = None
+        if resource_value is None:
+            return X, y, {}
+        if self._resource == "n_estimators":
+            return X, y, {'n_estimators': int(resource_value)}
+        subset = self._rows[:int(resource_value)]
+        X_fit = X.iloc[subset] if hasattr(X, "iloc") else X[subset]
+        y_fit = y.iloc[subset] if hasattr(y, "iloc") else np.asarray(y)[subset]
+        return X_fit, y_fit, {}
+
+    def _run(self, candidates, X, y, resource_value, bracket, round_idx):
+        """Score candidates (one task per candidate and fold) in parallel batches until done or out
+        of budget; returns their mean scores"""
+        X_fit, y_fit, override = self._fold_data(X, y, resource_value)
+        full = X_fit is X and not override
+        splits = cv_splits(self.estimator, X_fit, y_fit, self.cv)
+        batch = max(1, math.ceil(effective_n_jobs(self.n_jobs) / len(splits))) * self._path_width
+        scores = []
+        for start in range(0, len(candidates), batch):
+            if not self._budget_left():
+                break
+            chunk = candidates[start:start + batch]
+            outputs = self._evaluate(chunk, X_fit, y_fit, override, splits, full)
+            self.n_fits_ += len(outputs)
+            for i, params in enumerate(chunk):
+                record = CrossValidationResult(outputs[i * len(splits):(i + 1) * len(splits)], [test for _, test in splits],
+                                               len(y_fit), source=self.strategy)
+                score = record.mean(self._score_name)
+                scores.append(score)
+                self._results.append({
+                    'params': params, 'bracket': bracket, 'round': round_idx,
+                    'resource': resource_value or self._max_resource,
+                    'mean_test_score': score, 'std_test_score': record.std(self._score_name),
+                    'mean_fit_time': record.fit_time.mean(), 'mean_score_time': record.score_time.mean()
+                })
+                self._consider(params, score, resource_value or self._max_resource, record if full else None)
+            self._evaluated += len(chunk)
+            if self._callback is not None:
+                self._callback({
+                    'progress': self._progress(), 'n_fits': self.n_fits_, 'best_score': self.best_score_,
+                    'best_params': self.best_params_, 'elapsed': time.time() - self._start
+                })
+        return scores
+
+    def _evaluate(self, chunk, X, y, override, splits, keep_predictions):
+        """fit_fold outputs of every candidate and fold (candidate-major), in parallel"""
+        if not self._path_width > 1:
+            return Parallel(n_jobs=self.n_jobs)(
+                delayed(fit_fold)(self.estimator, {**params, **override}, X, y, train, test,
+                                  self._scorers, keep_predictions)
+                for params in chunk for train, test in splits
+            )
+        # Satu task per jalur warm-start dan fold: model ditumbuhkan melewati semua nilai n_estimators
+        paths = {}
+        for params in chunk:
+            rest = {k: v for k, v in params.items() if k != "n_estimators"}
+            paths.setdefault(_path_key(params), (rest, []))[1].append(params["n_estimators"])
+        path_outputs = Parallel(n_jobs=self.n_jobs)(
+            delayed(fit_fold_path)(self.estimator, rest, X, y, train, test, self._scorers,
+                                   "n_estimators", values, keep_predictions)
+            for rest, values in paths.values() for train, test in splits
+        )
+        lookup = {}
+        for i, (key, (_, values)) in enumerate(paths.items()):
+            for fold in range(len(splits)):
+                for value, output in zip(values, path_outputs[i * len(splits) + fold]):
+                    lookup[(key, value, fold)] = output
+        return [lookup[(_path_key(params), params["n_estimators"], fold)]
+                for params in chunk for fold in range(len(splits))]
+
+    def _progress(self):
+        """Fraction of the planned candidate evaluations (or of the budget, if that runs out first)"""
+        fractions = [self._evaluated / max(self._planned, 1)]
+        if self.time_budget:
+            fractions.append((time.time() - self._start) / self.time_budget)
+        if self.max_fits:
+            fractions.append(self.n_fits_ / self.max_fits)
+        return min(max(fractions), 1.0)
+
+    def _halving_plan(self, n, r_min):
+        """Number of candidate evaluations one successive-halving bracket performs"""
+        total, resource_value = 0, r_min
+        while n >= 1:
+            total += n
+            if n == 1 or resource_value >= self._max_resource:
+                break
+            n = max(1, n // self.factor)
+            resource_value = self._max_resource if n == 1 else resource_value * self.factor
+        return total
+
+    def _successive_halving(self, candidates, X, y, r_min, bracket):
+        """Keep the best 1/factor candidates and multiply their resource by factor each round"""
+        resource_value, round_idx = r_min, 0
+        while candidates:
+            scores = self._run(candidates, X, y, min(resource_value, self._max_resource), bracket, round_idx)
+            # Budget habis di tengah ronde: hanya kandidat yang sudah dinilai yang dipertimbangkan
+            candidates = candidates[:len(scores)]
+            if len(candidates) <= 1 or resource_value >= self._max_resource or not self._budget_left():
+                return
+            keep = max(1, len(candidates) // self.factor)
+            order = np.argsort(scores)[::-1][:keep]
+            candidates = [candidates[i] for i in order]
+            # Kandidat terakhir selalu dinilai dengan resource penuh
+            resource_value = self._max_resource if len(candidates) == 1 else resource_value * self.factor
+            round_idx += 1
+
+    def _consider(self, params, score, resource_value, record):
+        """Best candidate = highest score at the highest resource level reached so far"""
+        key = (resource_value, score)
+        if self._best_key is None or key > self._best_key:
+            self._best_key = key
+            self.best_params_ = params
+            self.best_score_ = score
+            self.cv_result_ = record
+
+    def fit(self, X, y, callback=None):
+        """callback(info) is called after every batch with progress, fits so far and the best score;
+        an exception raised by it (e.g. a cancelled job) aborts the search"""
+        self._callback = callback
+        try:
+            return self._fit(X, y)
+        finally:
+            self._callback = None
+
+    def _fit(self, X, y):
+        self._start = time.time()
+        self.n_fits_ = 0
+        self._evaluated = 0
+        self._results = []
+        self._best_key = None
+        self.best_params_, self.best_score_, self.cv_result_ = None, -np.inf, None
+        rng = np.random.RandomState(self.random_state)
+        self._scorers = make_scorers(self.estimator, self.scoring, self.report_scoring)
+        self._score_name = next(iter(self._scorers))
+        # Grid/randomized search selalu memakai resource penuh; n_estimators tetap bagian dari grid
+        full_only = self.strategy in ("Grid Search", "Randomized Search")
+        self._resource = None if full_only else _resource_param(self.estimator, self.resource)
+        self._grid = {k: v for k, v in self.param_grid.items()
+                      if not (self._resource == "n_estimators" and k == "n_estimators")}
+        # Warm start hanya berguna bila grid berisi beberapa nilai n_estimators
+        n_values = len(set(self._grid.get("n_estimators", [])))
+        warm_path = full_only and self.warm_start and n_values > 1 and supports_warm_start(self.estimator)
+        self._path_width = n_values if warm_path else 1
+
+        if self._resource == "n_estimators":
+            # Resource maksimum = nilai n_estimators terbesar di grid (atau nilai estimator)
+            self._max_resource = max(self.param_grid.get("n_estimators", [self.estimator.get_params()["n_estimators"]]))
+            default_min = max(10, self._max_resource // self.factor ** 2)
+        else:
+            self._max_resource = len(y)
+            n_classes = len(np.unique(y)) if is_classifier(self.estimator) else 1
+            n_splits = len(cv_splits(self.estimator, X, y, self.cv))
+            default_min = min(self._max_resource, max(n_splits * n_classes * 10, self._max_resource // self.factor ** 3))
+        r_min = self.min_resource or default_min
+        self._rows = rng.permutation(len(y))
+
+        n_grid = len(ParameterGrid(self._grid))
+        if full_only:
+            n = n_grid if self.strategy == "Grid Search" else min(self.n_candidates, n_grid)
+            candidates = list(ParameterGrid(self._grid)) if self.strategy == "Grid Search" else self._candidates(n, rng)
+            if self._path_width > 1:
+                # Kandidat satu jalur warm-start berurutan agar masuk batch yang sama
+                order = {}
+                for params in candidates:
+                    order.setdefault(_path_key(params), len(order))
+                candidates = sorted(candidates, key=lambda params: order[_path_key(params)])
+            self._planned = len(candidates)
+            self._run(candidates, X, y, None, 0, 0)
+        elif self.strategy == "Successive Halving":
+            n_rounds = max(0, int(math.floor(math.log(self._max_resource / r_min, self.factor))))
+            n_start = min(n_grid, max(self.n_candidates, self.factor ** n_rounds))
+            self._planned = self._halving_plan(n_start, r_min)
+            self._successive_halving(self._candidates(n_start, rng), X, y, r_min, 0)
+        else:
+            # Hyperband: beberapa bracket successive halving, dari banyak kandidat/resource kecil
+            # sampai sedikit kandidat/resource penuh
+            s_max = max(0, int(math.floor(math.log(self._max_resource / r_min, self.factor))))
+            brackets = []
+            for s in range(s_max, -1, -1):
+                n = min(n_grid, int(math.ceil((s_max + 1) / (s + 1) * self.factor ** s)))
+                r = max(r_min, int(self._max_resource * self.factor ** -s))
+                brackets.append((n, r, s_max - s))
+            self._planned = sum(self._halving_plan(n, r) for n, r, _ in brackets)
+            for n, r, bracket in brackets:
+                if not self._budget_left():
+                    break
+                self._successive_halving(self._candidates(n, rng), X, y, r, bracket)
+
+        if self.best_params_ is None:
+            # Budget terlalu kecil untuk satu evaluasi: pakai parameter estimator dasar
+            self.best_params_ = {}
+        best_params = dict(self.best_params_)
+        if self._resource == "n_estimators":
+            best_params["n_estimators"] = self._max_resource
+        self.best_params_ = best_params
+        self.best_estimator_ = clone(self.estimator).set_params(**best_params).fit(X, y)
+        self.cv_results_ = pd.DataFrame(self._results)
+        self.elapsed_ = time.time() - self._start
+        return self
+
+    def predict(self, X):
+        return self.best_estimator_.predict(X)
+
+    def predict_proba(self, X):
+        return self.best_estimator_.predict_proba(X)
+
+    def score(self, X, y):
+        return self.best_estimator_.score(X, y)
+
+
+def make_search(estimator, param_grid, cv=5, scoring=None, strategy="Grid Search", report_scoring=None,
+                time_budget=None, max_fits=None, n_candidates=20, warm_start=True, random_state=42):
+    """Exhaustive grid search, or a budgeted randomized / successive-halving / Hyperband search.
+    report_scoring: extra metric recorded per fold (e.g. the tab4 CV metric) without affecting selection.
+    warm_start: grow ensembles through the n_estimators values of the grid instead of refitting each."""
+    return BudgetedSearchCV(estimator, param_grid, strategy=strategy, cv=cv, scoring=scoring,
+                            report_scoring=report_scoring, time_budget=time_budget, max_fits=max_fits,
+                            n_candidates=n_candidates, warm_start=warm_start, random_state=random_state)
+
+
+def early_stopping_params(estimator, validation_fraction=0.1, patience=10):
+    """Constructor parameters that stop Gradient Boosting / MLP training once the score on a held-out
+    validation_fraction of the training rows has not improved for patience iterations"""
+    params = estimator.get_params()
+    if "early_stopping" in params:
+        # MLPClassifier / MLPRegressor
+        return {'early_stopping': True, 'validation_fraction': validation_fraction, 'n_iter_no_change': patience}
+    if "n_iter_no_change" in params:
+        # GradientBoostingClassifier / GradientBoostingRegressor
+        return {'validation_fraction': validation_fraction, 'n_iter_no_change': patience}
+    return {}
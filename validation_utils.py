@@ -0,0 +1,298 @@
+import time
+import warnings
+from math import comb
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
+from sklearn.base import BaseEstimator, RegressorMixin, clone, is_classifier
+from sklearn.linear_model import LinearRegression, Ridge
+from sklearn.metrics import check_scoring
+from sklearn.model_selection import BaseCrossValidator, LeaveOneOut, LeavePOut, check_cv
+
+
+def _take(data, rows):
+    return data.iloc[rows] if hasattr(data, "iloc") else np.asarray(data)[rows]
+
+
+def make_scorers(estimator, *scorings):
+    """{name: scorer} for the given scoring names (None = estimator.score), duplicates dropped"""
+    scorers = {}
+    for scoring in scorings:
+        name = scoring if isinstance(scoring, str) else "score"
+        if name not in scorers:
+            scorers[name] = check_scoring(estimator, scoring=scoring)
+    return scorers
+
+
+def _score(model, X_test, y_test, scorers, keep_predictions):
+    """(scores, score time, predictions) of a fitted model on one test fold"""
+    start = time.time()
+    scores = {}
+    for name, scorer in scorers.items():
+        try:
+            scores[name] = float(scorer(model, X_test, y_test))
+        except Exception:
+            scores[name] = np.nan
+    score_time = time.time() - start
+    predictions = model.predict(X_test) if keep_predictions else None
+    return scores, score_time, predictions
+
+
+def fit_fold(estimator, params, X, y, train, test, scorers, keep_predictions=False):
+    """Fit one configuration on one fold; failed fits/scores give NaN like error_score=np.nan"""
+    model = clone(estimator).set_params(**params)
+    start = time.time()
+    try:
+        model.fit(_take(X, train), _take(y, train))
+    except Exception:
+        return {name: np.nan for name in scorers}, time.time() - start, 0.0, None
+    fit_time = time.time() - start
+
+    scores, score_time, predictions = _score(model, _take(X, test), _take(y, test), scorers, keep_predictions)
+    return scores, fit_time, score_time, predictions
+
+
+def fit_fold_path(estimator, params, X, y, train, test, scorers, path_param, path_values, keep_predictions=False):
+    """Grow one warm-started model on one fold through increasing values of path_param (e.g. n_estimators),
+    scoring it at every checkpoint; returns one fit_fold output per value in path_values order.
+    Fit times are cumulative, i.e. what a fit with that value from scratch would have cost."""
+    model = clone(estimator).set_params(**params, warm_start=True)
+    X_train, y_train = _take(X, train), _take(y, train)
+    X_test, y_test = _take(X, test), _take(y, test)
+    outputs = {}
+    fit_time = 0.0
+    for value in sorted(set(path_values)):
+        start = time.time()
+        try:
+            model.set_params(**{path_param: value}).fit(X_train, y_train)
+        except Exception:
+            fit_time += time.time() - start
+            outputs[value] = ({name: np.nan for name in scorers}, fit_time, 0.0, None)
+            continue
+        fit_time += time.time() - start
+        scores, score_time, predictions = _score(model, X_test, y_test, scorers, keep_predictions)
+        outputs[value] = (scores, fit_time, score_time, predictions)
+    return [outputs[value] for value in path_values]
+
+
+class CrossValidationResult:
+    """Per-fold scores, fit/score times and out-of-fold predictions of one configuration"""
+
+    def __init__(self, fold_outputs, test_indices, n_samples, source="cross-validation"):
+        self.source = source
+        self.n_samples = n_samples
+        self.test_indices = list(test_indices)
+        names = list(fold_outputs[0][0]) if fold_outputs else []
+        self.scores = {name: np.array([out[0][name] for out in fold_outputs]) for name in names}
+        self.fit_time = np.array([out[1] for out in fold_outputs])
+        self.score_time = np.array([out[2] for out in fold_outputs])
+        self._predictions = [out[3] for out in fold_outputs]
+
+    @property
+    def n_folds(self):
+        return len(self.fit_time)
+
+    def mean(self, name):
+        scores = self.scores[name]
+        return float(np.nanmean(scores)) if not np.all(np.isnan(scores)) else -np.inf
+
+    def std(self, name):
+        return float(np.nanstd(self.scores[name]))
+
+    @property
+    def oof_predictions(self):
+        """Out-of-fold prediction per training row, or None when folds overlap (Leave-P-Out) or
+        predictions were not kept"""
+        if any(pred is None for pred in self._predictions):
+            return None
+        tests = np.concatenate(self.test_indices) if self.test_indices else np.empty(0, dtype=int)
+        if len(tests) != self.n_samples or len(np.unique(tests)) != self.n_samples:
+            return None
+        oof = np.empty(self.n_samples, dtype=np.asarray(self._predictions[0]).dtype)
+        for test, pred in zip(self.test_indices, self._predictions):
+            oof[test] = pred
+        return oof
+
+    def fold_table(self, name):
+        return pd.DataFrame({
+            'Fold': [f'Fold {i + 1}' for i in range(self.n_folds)],
+            'Score': self.scores[name],
+            'Fit time (s)': self.fit_time,
+            'Score time (s)': self.score_time
+        })
+
+
+def cv_splits(estimator, X, y, cv):
+    splitter = check_cv(cv, y, classifier=is_classifier(estimator))
+    return list(splitter.split(X, y))
+
+
+def cross_validation_result(estimator, X, y, cv=5, scoring=None, n_jobs=-1, keep_predictions=True):
+    """One cross-validation pass (folds in parallel) recording scores, timings and OOF predictions;
+    Leave-One-Out goes through the closed-form / chunked engine"""
+    scoring = leave_out_scoring(estimator, cv, scoring)
+    if isinstance(cv, LeaveOneOut):
+        return leave_one_out_result(estimator, X, y, scoring, n_jobs, keep_predictions)
+    scorers = make_scorers(estimator, scoring)
+    splits = cv_splits(estimator, X, y, cv)
+    outputs = Parallel(n_jobs=n_jobs)(
+        delayed(fit_fold)(estimator, {}, X, y, train, test, scorers, keep_predictions)
+        for train, test in splits
+    )
+    return CrossValidationResult(outputs, [test for _, test in splits], len(y))
+
+
+class SampledLeavePOut(BaseCrossValidator):
+    """Leave-P-Out on at most n_splits distinct random test sets instead of all C(n, p)"""
+
+    def __init__(self, p, n_splits=1000, random_state=42):
+        self.p = p
+        self.n_splits = n_splits
+        self.random_state = random_state
+
+    def get_n_splits(self, X=None, y=None, groups=None):
+        if X is None:
+            return self.n_splits
+        return min(self.n_splits, comb(len(X), self.p))
+
+    def _iter_test_indices(self, X, y=None, groups=None):
+        n_samples = len(X)
+        if comb(n_samples, self.p) <= self.n_splits:
+            for _, test in LeavePOut(self.p).split(X):
+                yield test
+            return
+        rng = np.random.RandomState(self.random_state)
+        seen = set()
+        while len(seen) < self.n_splits:
+            test = tuple(np.sort(rng.choice(n_samples, self.p, replace=False)))
+            if test not in seen:
+                seen.add(test)
+                yield np.array(test)
+
+
+def is_leave_out(cv):
+    return isinstance(cv, (LeaveOneOut, LeavePOut, SampledLeavePOut))
+
+
+def leave_out_scoring(estimator, cv, scoring):
+    """Scoring for Leave-One-Out / Leave-P-Out on regression: R² is undefined on single-sample test
+    folds (NaN per fold), so the default becomes neg_mean_squared_error and an explicit 'r2' is rejected"""
+    if is_classifier(estimator) or not is_leave_out(cv):
+        return scoring
+    if scoring == 'r2':
+        raise ValueError("R² is not defined on Leave-One-Out / Leave-P-Out test folds; use "
+                         "neg_mean_squared_error, neg_root_mean_squared_error or neg_mean_absolute_error")
+    return 'neg_mean_squared_error' if scoring is None else scoring
+
+
+def cv_cost(cv, n_samples, fit_seconds=None, n_jobs=-1):
+    """Number of refits a CV scheme needs on n_samples rows and, given the time of one fit,
+    the estimated wall-clock seconds with n_jobs workers"""
+    if isinstance(cv, LeavePOut):
+        n_splits = comb(n_samples, cv.p)
+    elif isinstance(cv, LeaveOneOut):
+        n_splits = n_samples
+    elif isinstance(cv, int):
+        n_splits = cv
+    else:
+        n_splits = cv.get_n_splits(np.empty((n_samples, 1)))
+    seconds = n_splits * fit_seconds / effective_n_jobs(n_jobs) if fit_seconds is not None else None
+    return {'n_splits': n_splits, 'estimated_seconds': seconds}
+
+
+def supports_closed_form_loo(estimator):
+    """LinearRegression / Ridge (scalar alpha, unconstrained): LOO residuals follow from the hat matrix"""
+    if type(estimator) is LinearRegression:
+        return not estimator.positive
+    if type(estimator) is Ridge:
+        return np.ndim(estimator.alpha) == 0 and not estimator.positive
+    return False
+
+
+def loo_hat_matrix_predictions(estimator, X, y):
+    """Exact LOO predictions of a (ridge) least-squares fit from one solve:
+    y_loo = y - e / (1 - h), with h the diagonal of the hat matrix (intercept unpenalised)"""
+    A = np.asarray(X, dtype=np.float64)
+    y_values = np.asarray(y, dtype=np.float64)
+    alpha = float(estimator.alpha) if isinstance(estimator, Ridge) else 0.0
+    penalty = np.full(A.shape[1], alpha)
+    if estimator.fit_intercept:
+        A = np.hstack([np.ones((len(A), 1)), A])
+        penalty = np.concatenate([[0.0], penalty])
+    # pinv juga menangani matriks singular (mis. fitur kolinear pada LinearRegression)
+    M_inv_At = np.linalg.pinv(A.T @ A + np.diag(penalty)) @ A.T
+    leverage = np.einsum('ij,ji->i', A, M_inv_At)
+    residuals = y_values - A @ (M_inv_At @ y_values)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(leverage < 1 - 1e-12, y_values - residuals / (1 - leverage), np.nan)
+
+
+# Skor satu-sampel yang bisa dihitung vektor (e = y - prediksi); metrik lain lewat scorer per fold
+_PER_SAMPLE_SCORES = {
+    'neg_mean_squared_error': lambda e: -e ** 2,
+    'neg_mean_absolute_error': lambda e: -np.abs(e),
+    'neg_root_mean_squared_error': lambda e: -np.abs(e)
+}
+
+
+class _PrecomputedRegressor(RegressorMixin, BaseEstimator):
+    """Returns stored predictions for row ids, so regular scorers can score closed-form LOO folds"""
+
+    def __init__(self, predictions=None):
+        self.predictions = predictions
+
+    def fit(self, X, y=None):
+        return self
+
+    def predict(self, X):
+        return self.predictions[np.asarray(X)[:, 0].astype(int)]
+
+
+def _loo_chunk(estimator, X, y, rows, scorers, keep_predictions):
+    """Leave-One-Out folds for a block of rows (train indices built per fold, never all at once)"""
+    all_rows = np.arange(len(y))
+    with warnings.catch_warnings():
+        # Metrik seperti ROC AUC tidak terdefinisi untuk satu sampel (NaN, sama seperti cross_val_score)
+        warnings.simplefilter("ignore")
+        return [fit_fold(estimator, {}, X, y, np.delete(all_rows, i), np.array([i]), scorers, keep_predictions)
+                for i in rows]
+
+
+def leave_one_out_result(estimator, X, y, scoring=None, n_jobs=-1, keep_predictions=True):
+    """Leave-One-Out: closed form for LinearRegression/Ridge, otherwise chunks of folds in parallel"""
+    n_samples = len(y)
+    scorers = make_scorers(estimator, leave_out_scoring(estimator, LeaveOneOut(), scoring))
+    test_indices = [np.array([i]) for i in range(n_samples)]
+    if supports_closed_form_loo(estimator):
+        start = time.time()
+        predictions = loo_hat_matrix_predictions(estimator, X, y)
+        fit_time = (time.time() - start) / n_samples
+        rows = np.arange(n_samples).reshape(-1, 1)
+        precomputed = _PrecomputedRegressor(predictions)
+        y_values = np.asarray(y)
+        per_sample = {}
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for name, scorer in scorers.items():
+                if name in _PER_SAMPLE_SCORES:
+                    per_sample[name] = _PER_SAMPLE_SCORES[name](y_values - predictions)
+                    continue
+                per_sample[name] = np.empty(n_samples)
+                for i in range(n_samples):
+                    try:
+                        per_sample[name][i] = scorer(precomputed, rows[i:i + 1], y_values[i:i + 1])
+                    except Exception:
+                        per_sample[name][i] = np.nan
+        outputs = [({name: float(values[i]) for name, values in per_sample.items()}, fit_time, 0.0,
+                    predictions[i:i + 1] if keep_predictions else None) for i in range(n_samples)]
+        return CrossValidationResult(outputs, test_indices, n_samples, source="Leave-One-Out (closed form)")
+
+    # Beberapa chunk per worker agar beban seimbang tanpa overhead satu task per fold
+    n_chunks = min(n_samples, effective_n_jobs(n_jobs) * 4)
+    chunks = np.array_split(np.arange(n_samples), n_chunks)
+    results = Parallel(n_jobs=n_jobs)(
+        delayed(_loo_chunk)(estimator, X, y, rows, scorers, keep_predictions) for rows in chunks
+    )
+    outputs = [output for chunk in results for output in chunk]
+    return CrossValidationResult(outputs, test_indices, n_samples, source="Leave-One-Out (parallel)")